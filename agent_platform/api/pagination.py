@@ -0,0 +1,58 @@
+"""
+Keyset Pagination Helpers
+Opaque cursors for list endpoints ordered by (timestamp DESC, id DESC).
+
+The timestamp columns are nullable, so rows without one are ordered last
+(NULLS LAST on every dialect) and a cursor may carry a NULL timestamp.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(ts: Optional[datetime], row_id: Any) -> str:
+    """Encode the (timestamp, id) keyset position of the last row on a page."""
+    payload = {"ts": ts.isoformat() if ts is not None else None, "id": row_id}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, id_type: type = int) -> Tuple[Optional[datetime], Any]:
+    """Decode a cursor from encode_cursor(); raises 400 if malformed.
+
+    ``id_type`` is the Python type of the route's id column; a cursor whose
+    id has any other type is rejected rather than compared against the column.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        ts, row_id = payload["ts"], payload["id"]
+        # bool is an int subclass, but never a valid row id
+        if type(row_id) is not id_type:
+            raise ValueError(f"cursor id must be {id_type.__name__}")
+        if ts is not None and not isinstance(ts, str):
+            raise ValueError("cursor ts must be an ISO timestamp or null")
+        return (datetime.fromisoformat(ts) if ts is not None else None), row_id
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_order(ts_column, id_column) -> tuple:
+    """ORDER BY clauses for (timestamp DESC NULLS LAST, id DESC)."""
+    return ts_column.desc().nulls_last(), id_column.desc()
+
+
+def after_cursor(ts_column, id_column, cursor_ts: Optional[datetime], cursor_id: Any):
+    """Filter for the rows after a decoded cursor in keyset_order()."""
+    if cursor_ts is None:
+        # Already in the NULL-timestamp tail
+        return and_(ts_column.is_(None), id_column < cursor_id)
+    return or_(
+        ts_column < cursor_ts,
+        and_(ts_column == cursor_ts, id_column < cursor_id),
+        ts_column.is_(None),
+    )
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from agent_platform.api.dependencies import get_db_session
+from agent_platform.api.pagination import after_cursor, decode_cursor, encode_cursor, keyset_order
 from agent_platform.db.models import Decision
 from agent_platform.memory import get_decision, get_pending_decisions, make_decision
 
@@ -36,8 +37,8 @@ class DecisionResponse(BaseModel):
     decided_at: Optional[datetime]
     email_subject: Optional[str]
     email_sender: Optional[str]
-    created_at: datetime
-    updated_at: datetime
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
 
     class Config:
         from_attributes = True
@@ -50,11 +51,11 @@ class MakeDecisionRequest(BaseModel):
 
 
 class DecisionsListResponse(BaseModel):
-    """Paginated decisions list."""
+    """Cursor-paginated decisions list (newest first)."""
     items: List[DecisionResponse]
-    total: int
     limit: int
-    offset: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None  # only with include_total=true
 
 
 # ============================================================================
@@ -63,22 +64,24 @@ class DecisionsListResponse(BaseModel):
 
 @router.get("/decisions", response_model=DecisionsListResponse)
 def list_decisions(
-    limit: int = Query(20, le=100),
-    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     account_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     urgency: Optional[str] = Query(None),
+    include_total: bool = Query(False),
     db: Session = Depends(get_db_session),
 ):
     """
-    List decisions with optional filtering.
+    List decisions with optional filtering (keyset pagination).
 
     Query Parameters:
         - limit: Max results (default: 20)
-        - offset: Pagination offset
+        - cursor: next_cursor from the previous page (omit for first page)
         - account_id: Filter by account
         - status: Filter by status (pending/decided/delegated/cancelled)
         - urgency: Filter by urgency (low/medium/high/urgent)
+        - include_total: Also count all matching decisions (extra COUNT query)
     """
     query = db.query(Decision)
 
@@ -90,17 +93,30 @@ def list_decisions(
     if urgency:
         query = query.filter(Decision.urgency == urgency)
 
-    # Get total count
-    total = query.count()
-
-    # Get items
-    items = query.order_by(Decision.created_at.desc()).limit(limit).offset(offset).all()
+    # Counting every match costs a second query; page with next_cursor instead
+    total = query.count() if include_total else None
+
+    # Continue after the last row of the previous page
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor, id_type=str)
+        query = query.filter(
+            after_cursor(Decision.created_at, Decision.decision_id, cursor_ts, cursor_id)
+        )
+
+    # Fetch one extra row to detect whether another page exists
+    items = (
+        query.order_by(*keyset_order(Decision.created_at, Decision.decision_id))
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(items) > limit
+    items = items[:limit]
 
     return DecisionsListResponse(
         items=[DecisionResponse.from_orm(item) for item in items],
-        total=total,
         limit=limit,
-        offset=offset
+        next_cursor=encode_cursor(items[-1].created_at, items[-1].decision_id) if has_more else None,
+        total=total,
     )
 
 
@@ -126,16 +142,14 @@ def make_decision_endpoint(
         decision_id: Decision ID
         request: Chosen option and optional notes
     """
-    decision = get_decision(decision_id)
-    if not decision:
-        raise HTTPException(status_code=404, detail="Decision not found")
-
-    # Make decision
-    make_decision(
+    # make_decision() updates in one statement and returns None if not found
+    decision = make_decision(
         decision_id=decision_id,
         chosen_option=request.chosen_option,
         decision_notes=request.decision_notes
     )
+    if not decision:
+        raise HTTPException(status_code=404, detail="Decision not found")
 
     return {
         "success": True,
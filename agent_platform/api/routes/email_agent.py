@@ -3,13 +3,17 @@ Email-Agent API Routes
 Endpoints specific to Email-Agent monitoring and HITL actions.
 """
 
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel
+from sqlalchemy import and_, case, func, text
 from sqlalchemy.orm import Session
 
 from agent_platform.api.dependencies import get_db_session
+from agent_platform.api.pagination import after_cursor, decode_cursor, encode_cursor, keyset_order
 from agent_platform.db.models import ProcessedEmail, Task, Decision, Question
 from agent_platform.events import log_event, EventType, get_events
 from agent_platform.memory import (
@@ -25,6 +29,16 @@ from agent_platform.memory import (
 router = APIRouter()
 
 
+# Seconds a computed /email-agent/status response is reused (dashboard polls it)
+STATUS_CACHE_TTL = 10
+
+# Seconds an exact runs-list total is reused per (account_id, needs_human) filter
+RUNS_TOTAL_CACHE_TTL = 30
+
+# Maximum number of (account_id, needs_human) filters with a cached total
+RUNS_TOTAL_CACHE_SIZE = 256
+
+
 # ============================================================================
 # Pydantic Schemas
 # ============================================================================
@@ -48,7 +62,7 @@ class RunListItem(BaseModel):
     confidence: Optional[float]
     needs_human: bool
     status: str
-    created_at: datetime
+    created_at: Optional[datetime]  # processed_at is nullable
 
     class Config:
         from_attributes = True
@@ -70,7 +84,7 @@ class RunDetail(BaseModel):
     tasks: List[dict]
     decisions: List[dict]
     questions: List[dict]
-    created_at: datetime
+    created_at: Optional[datetime]  # processed_at is nullable
 
     class Config:
         from_attributes = True
@@ -87,59 +101,160 @@ class RunEditRequest(BaseModel):
     feedback: str
 
 
+class RunActionResponse(BaseModel):
+    """Result of accepting, rejecting or editing a run."""
+    success: bool
+    message: str
+    run_id: str
+
+
+class TriggerTestResponse(BaseModel):
+    """Result of triggering a test run."""
+    success: bool
+    message: str
+    note: Optional[str] = None
+
+
 class RunsListResponse(BaseModel):
-    """Paginated runs list response."""
+    """Cursor-paginated runs list response (newest first)."""
     items: List[RunListItem]
     total: int
+    total_is_exact: bool = True  # False for cached counts and planner estimates
     limit: int
-    offset: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
 # Endpoints
 # ============================================================================
 
+# (computed_at, today_start, status) of the last status response. Misses are
+# computed under _status_lock so concurrent polls run the queries only once.
+_status_cache: Optional[Tuple[datetime, datetime, EmailAgentStatus]] = None
+_status_lock = threading.Lock()
+
+
+def _cached_status(today_start: datetime) -> Optional[EmailAgentStatus]:
+    """Return the cached status if it is younger than STATUS_CACHE_TTL and from today."""
+    cached = _status_cache
+    if cached is None:
+        return None
+    computed_at, cached_day, status = cached
+    if cached_day != today_start:
+        return None
+    if datetime.utcnow() - computed_at >= timedelta(seconds=STATUS_CACHE_TTL):
+        return None
+    return status
+
+
+def invalidate_status_cache():
+    """Drop the cached status so the next request recomputes it."""
+    global _status_cache
+    _status_cache = None
+
+
+# (account_id, needs_human) -> (computed_at, exact total) of recent runs lists.
+# The runs endpoint is sync and runs in the threadpool, so every read or
+# reordering of the LRU happens under _runs_total_lock.
+_runs_total_cache: "OrderedDict[Tuple[Optional[str], Optional[bool]], Tuple[datetime, int]]" = OrderedDict()
+_runs_total_lock = threading.Lock()
+
+
+def _cached_runs_total(key: Tuple[Optional[str], Optional[bool]]) -> Optional[int]:
+    """Return the cached total for key if younger than RUNS_TOTAL_CACHE_TTL."""
+    with _runs_total_lock:
+        cached = _runs_total_cache.get(key)
+        if cached is None or datetime.utcnow() - cached[0] >= timedelta(seconds=RUNS_TOTAL_CACHE_TTL):
+            return None
+        _runs_total_cache.move_to_end(key)
+        return cached[1]
+
+
+def _store_runs_total(key: Tuple[Optional[str], Optional[bool]], total: int):
+    """Cache an exact total, evicting the least recently used filter when full."""
+    with _runs_total_lock:
+        _runs_total_cache[key] = (datetime.utcnow(), total)
+        _runs_total_cache.move_to_end(key)
+        # account_id comes straight from the query string; keep the cache bounded
+        while len(_runs_total_cache) > RUNS_TOTAL_CACHE_SIZE:
+            _runs_total_cache.popitem(last=False)
+
+
+def _estimated_runs_total(db: Session) -> Optional[int]:
+    """Planner row estimate of processed_emails (PostgreSQL only; None if unknown)."""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = db.execute(
+        text("SELECT reltuples FROM pg_class WHERE relname = 'processed_emails'")
+    ).scalar()
+    # -1 (or no row) until the table has been vacuumed/analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def invalidate_runs_total_cache():
+    """Drop cached runs-list totals so the next requests count exactly."""
+    with _runs_total_lock:
+        _runs_total_cache.clear()
+
+
 @router.get("/email-agent/status", response_model=EmailAgentStatus)
-def get_email_agent_status(db: Session = Depends(get_db_session)):
+def get_email_agent_status(response: Response, db: Session = Depends(get_db_session)):
     """
     Get Email-Agent status.
 
+    Cached for STATUS_CACHE_TTL seconds.
+
     Returns:
         - active: Whether agent is active (always True for now)
         - emails_processed_today: Count of emails processed today
         - pending_runs: Count of emails needing human review
         - last_run: Timestamp of last email processing
     """
-    # Count emails processed today
-    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    global _status_cache
 
-    emails_today = db.query(ProcessedEmail).filter(
-        ProcessedEmail.processed_at >= today_start
-    ).count()
+    response.headers["Cache-Control"] = f"max-age={STATUS_CACHE_TTL}, stale-while-revalidate=30"
 
-    # Count pending runs (medium/low confidence)
-    pending = db.query(ProcessedEmail).filter(
-        ProcessedEmail.confidence < 0.90,  # High confidence threshold
-        ProcessedEmail.processed_at >= today_start
-    ).count()
-
-    # Get last run
-    last_email = db.query(ProcessedEmail).order_by(
-        ProcessedEmail.processed_at.desc()
-    ).first()
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    return EmailAgentStatus(
-        active=True,  # Always active for now
-        emails_processed_today=emails_today,
-        pending_runs=pending,
-        last_run=last_email.processed_at if last_email else None
-    )
+    status = _cached_status(today_start)
+    if status is not None:
+        return status
+
+    with _status_lock:
+        # Another request may have filled the cache while we waited
+        status = _cached_status(today_start)
+        if status is not None:
+            return status
+
+        # One aggregate query: today's count, today's pending runs
+        # (medium/low confidence) and the last run over all emails
+        processed_today = ProcessedEmail.processed_at >= today_start
+        emails_today, pending, last_run = db.query(
+            func.sum(case((processed_today, 1), else_=0)),
+            func.sum(case((and_(
+                processed_today,
+                ProcessedEmail.confidence < 0.90,  # High confidence threshold
+            ), 1), else_=0)),
+            func.max(ProcessedEmail.processed_at),
+        ).one()
+
+        status = EmailAgentStatus(
+            active=True,  # Always active for now
+            emails_processed_today=emails_today or 0,
+            pending_runs=pending or 0,
+            last_run=last_run
+        )
+        _status_cache = (datetime.utcnow(), today_start, status)
+
+    return status
 
 
 @router.get("/email-agent/runs", response_model=RunsListResponse)
 def list_email_agent_runs(
-    limit: int = Query(20, le=100),
-    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
     account_id: Optional[str] = Query(None),
     needs_human: Optional[bool] = Query(None),
     status: Optional[str] = Query(None),
@@ -150,7 +265,7 @@ def list_email_agent_runs(
 
     Query Parameters:
         - limit: Max results (default: 20, max: 100)
-        - offset: Pagination offset
+        - cursor: next_cursor from the previous page (omit for first page)
         - account_id: Filter by account (e.g., gmail_1)
         - needs_human: Filter by needs_human flag
         - status: Filter by status (pending/accepted/rejected)
@@ -158,7 +273,18 @@ def list_email_agent_runs(
     Returns:
         Paginated list of runs
     """
-    query = db.query(ProcessedEmail)
+    # Only the list columns: skips ORM identity-map hydration and the large
+    # body/summary columns of ProcessedEmail
+    query = db.query(
+        ProcessedEmail.id,
+        ProcessedEmail.email_id,
+        ProcessedEmail.subject,
+        ProcessedEmail.sender,
+        ProcessedEmail.received_at,
+        ProcessedEmail.category,
+        ProcessedEmail.confidence,
+        ProcessedEmail.processed_at,
+    )
 
     # Apply filters
     if account_id:
@@ -175,13 +301,33 @@ def list_email_agent_runs(
     # Note: status filtering would require new column in ProcessedEmail
     # For now, we infer status from confidence
 
-    # Get total count
-    total = query.count()
-
-    # Get items
+    # Get total count: exact COUNT(*) at most once per filter and TTL; the
+    # unfiltered total uses the planner estimate where one is available
+    total_key = (account_id, needs_human)
+    cached_total = _cached_runs_total(total_key)
+    total_is_exact = False
+    if cached_total is not None:
+        total = cached_total
+    elif total_key == (None, None) and (estimate := _estimated_runs_total(db)) is not None:
+        total = estimate
+    else:
+        total = query.count()
+        total_is_exact = True
+        _store_runs_total(total_key, total)
+
+    # Continue after the last row of the previous page
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(
+            after_cursor(ProcessedEmail.processed_at, ProcessedEmail.id, cursor_ts, cursor_id)
+        )
+
+    # Get items (one extra row to detect whether another page exists)
     items = query.order_by(
-        ProcessedEmail.processed_at.desc()
-    ).limit(limit).offset(offset).all()
+        *keyset_order(ProcessedEmail.processed_at, ProcessedEmail.id)
+    ).limit(limit + 1).all()
+    has_more = len(items) > limit
+    items = items[:limit]
 
     # Convert to response model
     run_items = []
@@ -202,8 +348,9 @@ def list_email_agent_runs(
     return RunsListResponse(
         items=run_items,
         total=total,
+        total_is_exact=total_is_exact,
         limit=limit,
-        offset=offset
+        next_cursor=encode_cursor(items[-1].processed_at, items[-1].id) if has_more else None,
     )
 
 
@@ -255,7 +402,7 @@ def get_run_detail(run_id: str, db: Session = Depends(get_db_session)):
     )
 
 
-@router.post("/email-agent/runs/{run_id}/accept")
+@router.post("/email-agent/runs/{run_id}/accept", response_model=RunActionResponse)
 def accept_run(
     run_id: str,
     request: RunActionRequest,
@@ -300,7 +447,7 @@ def accept_run(
     }
 
 
-@router.post("/email-agent/runs/{run_id}/reject")
+@router.post("/email-agent/runs/{run_id}/reject", response_model=RunActionResponse)
 def reject_run(
     run_id: str,
     request: RunActionRequest,
@@ -345,7 +492,7 @@ def reject_run(
     }
 
 
-@router.post("/email-agent/runs/{run_id}/edit")
+@router.post("/email-agent/runs/{run_id}/edit", response_model=RunActionResponse)
 def edit_run(
     run_id: str,
     request: RunEditRequest,
@@ -390,7 +537,7 @@ def edit_run(
     }
 
 
-@router.post("/email-agent/trigger-test")
+@router.post("/email-agent/trigger-test", response_model=TriggerTestResponse)
 def trigger_test_run(db: Session = Depends(get_db_session)):
     """
     Trigger a test run of the Email-Agent.
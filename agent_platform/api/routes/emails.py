@@ -8,8 +8,10 @@ Designed for inbox views and email reading functionality.
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import select, desc, func
 
 from agent_platform.api.dependencies import get_db_session
@@ -40,6 +42,23 @@ class EmailListItem(BaseModel):
         from_attributes = True
 
 
+# Columns loaded for EmailListItem (has_attachments is derived from attachments_metadata)
+_LIST_COLUMNS = (
+    ProcessedEmail.id,
+    ProcessedEmail.email_id,
+    ProcessedEmail.account_id,
+    ProcessedEmail.sender,
+    ProcessedEmail.subject,
+    ProcessedEmail.received_at,
+    ProcessedEmail.category,
+    ProcessedEmail.confidence,
+    ProcessedEmail.importance_score,
+    ProcessedEmail.attachments_metadata,
+    ProcessedEmail.thread_id,
+    ProcessedEmail.processed_at,
+)
+
+
 class EmailDetail(BaseModel):
     """Full email details including body content."""
     id: int
@@ -77,6 +96,27 @@ class EmailListResponse(BaseModel):
     account_id: Optional[str] = None
 
 
+# Helpers
+
+def _parse_fields(fields: Optional[str], model: type[BaseModel]) -> Optional[set]:
+    """
+    Parse a comma-separated `fields` projection against a response model.
+
+    Returns None when no projection was requested. Raises 400 on unknown fields.
+    """
+    if not fields:
+        return None
+
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
 # API Endpoints
 
 @router.get("/emails", response_model=EmailListResponse)
@@ -85,6 +125,7 @@ def list_emails(
     category: Optional[str] = Query(None, description="Filter by category (e.g., 'wichtig', 'nice_to_know')"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of emails to return"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    fields: Optional[str] = Query(None, description="Comma-separated email fields to return (e.g., 'subject,sender')"),
     db: Session = Depends(get_db_session)
 ):
     """
@@ -98,10 +139,12 @@ def list_emails(
     - `category`: Filter by classification category
     - `limit`: Number of emails per page (default: 20, max: 100)
     - `offset`: Pagination offset (default: 0)
+    - `fields`: Only return these email fields (pagination fields are always included)
 
     **Example Requests:**
     ```
     GET /api/v1/emails?limit=20
+    GET /api/v1/emails?limit=5&fields=subject,sender,received_at
     GET /api/v1/emails?account_id=gmail_1&limit=10
     GET /api/v1/emails?account_id=gmail_2&category=wichtig&limit=50
     GET /api/v1/emails?offset=20&limit=20  # Page 2
@@ -144,6 +187,8 @@ def list_emails(
     - Body content excluded for faster queries
     - Indexed on account_id, category, received_at
     """
+    selected_fields = _parse_fields(fields, EmailListItem)
+
     try:
         # Build query
         query = select(ProcessedEmail)
@@ -162,8 +207,9 @@ def list_emails(
         count_query = select(func.count()).select_from(query.subquery())
         total = db.scalar(count_query)
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+        # Apply pagination; only load the columns the list view needs so
+        # body/summary text never lands in the ORM instances
+        query = query.options(load_only(*_LIST_COLUMNS)).limit(limit).offset(offset)
 
         # Execute query
         results = db.execute(query).scalars().all()
@@ -187,7 +233,7 @@ def list_emails(
             for email in results
         ]
 
-        return EmailListResponse(
+        response = EmailListResponse(
             emails=emails,
             total=total or 0,
             limit=limit,
@@ -195,6 +241,19 @@ def list_emails(
             account_id=account_id
         )
 
+        if selected_fields is not None:
+            # Projected payload no longer matches the response model
+            payload = response.model_dump(include={
+                'emails': {'__all__': selected_fields},
+                'total': True,
+                'limit': True,
+                'offset': True,
+                'account_id': True,
+            })
+            return JSONResponse(content=jsonable_encoder(payload))
+
+        return response
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -205,6 +264,7 @@ def list_emails(
 @router.get("/emails/{email_id}", response_model=EmailDetail)
 def get_email(
     email_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (e.g., 'subject,body_text')"),
     db: Session = Depends(get_db_session)
 ):
     """
@@ -220,6 +280,7 @@ def get_email(
     **Example Request:**
     ```
     GET /api/v1/emails/msg_abc123
+    GET /api/v1/emails/msg_abc123?fields=subject,sender,body_text
     ```
 
     **Example Response:**
@@ -263,9 +324,12 @@ def get_email(
     - Thread navigation
 
     **Error Responses:**
+    - 400: Unknown field in `fields`
     - 404: Email not found
     - 500: Server error
     """
+    selected_fields = _parse_fields(fields, EmailDetail)
+
     try:
         # Fetch email from database
         query = select(ProcessedEmail).where(ProcessedEmail.email_id == email_id)
@@ -332,7 +396,7 @@ def get_email(
         if isinstance(attachments_meta, list):
             attachments_meta = None if not attachments_meta else {"files": attachments_meta}
 
-        return EmailDetail(
+        detail = EmailDetail(
             id=result.id,
             email_id=result.email_id,
             account_id=str(result.account_id),  # Convert to string
@@ -356,6 +420,11 @@ def get_email(
             questions=questions
         )
 
+        if selected_fields is not None:
+            return JSONResponse(content=jsonable_encoder(detail.model_dump(include=selected_fields)))
+
+        return detail
+
     except HTTPException:
         raise
     except Exception as e:
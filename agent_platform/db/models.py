@@ -6,7 +6,7 @@ SQLAlchemy models for storing agent runs, steps, and module information.
 from datetime import datetime
 from typing import Optional
 import uuid
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Boolean, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Boolean, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -190,6 +190,13 @@ class EmailAccount(Base):
 class ProcessedEmail(Base):
     """Record of processed emails"""
     __tablename__ = "processed_emails"
+    __table_args__ = (
+        # Email-agent status aggregate (processed today / pending by confidence);
+        # also serves the unfiltered / needs_human runs list in processed_at order
+        Index("idx_processed_emails_processed_at_confidence", "processed_at", "confidence"),
+        # Email-agent runs list filtered by account, newest first
+        Index("idx_processed_emails_account_processed_at", "account_id", "processed_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     account_id = Column(String(100), nullable=False, index=True)  # gmail_account_1, gmail_account_2, etc.
@@ -784,6 +791,17 @@ class Decision(Base):
     Tracks options, recommendations, and user choices.
     """
     __tablename__ = "decisions"
+    __table_args__ = (
+        # Keyset pagination of GET /decisions (ORDER BY created_at DESC, decision_id DESC)
+        Index("idx_decisions_created_at_decision_id", "created_at", "decision_id"),
+        # GET /decisions filters (account_id, status, urgency) + created_at order;
+        # also carries decision_id/email_sender on PostgreSQL
+        Index(
+            "idx_decisions_filters",
+            "account_id", "status", "urgency", "created_at",
+            postgresql_include=["decision_id", "email_sender"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     decision_id = Column(String(36), unique=True, nullable=False, index=True, default=lambda: str(uuid.uuid4()))
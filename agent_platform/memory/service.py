@@ -7,6 +7,7 @@ All memory objects are derived from extraction events.
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from agent_platform.db.database import get_db
@@ -395,26 +396,37 @@ class MemoryService:
         Returns:
             Updated Decision or None if not found
         """
-        decision = self.get_decision(decision_id)
+        # One UPDATE ... RETURNING instead of SELECT + UPDATE (no read-then-write race)
+        decision = self.db.execute(
+            update(Decision)
+            .where(Decision.decision_id == decision_id)
+            .values(
+                status="decided",
+                chosen_option=chosen_option,
+                decision_notes=decision_notes,
+                decided_at=datetime.utcnow(),
+            )
+            .returning(Decision)
+        ).scalar_one_or_none()
 
         if not decision:
+            # Release the write transaction the no-op UPDATE opened
+            self.db.rollback()
             return None
 
-        decision.status = "decided"
-        decision.chosen_option = chosen_option
-        decision.decision_notes = decision_notes
-        decision.decided_at = datetime.utcnow()
+        # Read before commit() expires the instance
+        account_id, email_id, question = decision.account_id, decision.email_id, decision.question
 
         self.db.commit()
 
         # Log event (Event-First)
         log_event(
             event_type=EventType.DECISION_MADE,
-            account_id=decision.account_id,
-            email_id=decision.email_id,
+            account_id=account_id,
+            email_id=email_id,
             payload={
                 'decision_id': decision_id,
-                'question': decision.question,
+                'question': question,
                 'chosen_option': chosen_option,
                 'decision_notes': decision_notes,
             }
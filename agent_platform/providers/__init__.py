@@ -6,7 +6,17 @@ Handles provider-specific email operations:
 - IONOS: Single-folder support (primary category only as folder)
 """
 
+from .category_mapping import CATEGORY_MAPPING, CATEGORY_MAPPING_ITEMS
 from .gmail_handler import GmailHandler
 from .ionos_handler import IonosHandler
+from .queue import ApplyQueue, enqueue_apply, get_apply_queue
 
-__all__ = ['GmailHandler', 'IonosHandler']
+__all__ = [
+    'GmailHandler',
+    'IonosHandler',
+    'CATEGORY_MAPPING',
+    'CATEGORY_MAPPING_ITEMS',
+    'ApplyQueue',
+    'enqueue_apply',
+    'get_apply_queue',
+]
@@ -0,0 +1,29 @@
+"""
+Category Mapping (Phase 7)
+
+Single category → label/folder mapping shared by all provider handlers.
+
+Gmail labels and IMAP folders use the same names, so both handlers read
+from this read-only mapping instead of keeping their own copies.
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+# Category to Gmail label / IMAP folder mapping (read-only)
+CATEGORY_MAPPING: Mapping[str, str] = MappingProxyType({
+    'wichtig_todo': 'Important/ToDo',
+    'termine': 'Events/Appointments',
+    'finanzen': 'Finance/Invoices',
+    'bestellungen': 'Orders/Shipping',
+    'job_projekte': 'Work/Projects',
+    'vertraege': 'Contracts/Official',
+    'persoenlich': 'Personal',
+    'newsletter': 'Newsletter',
+    'werbung': 'Marketing/Promo',
+    'spam': 'SPAM',
+})
+
+# Mapping items sorted by category name, for display
+CATEGORY_MAPPING_ITEMS: Tuple[Tuple[str, str], ...] = tuple(sorted(CATEGORY_MAPPING.items()))
@@ -14,29 +14,25 @@ Example:
     → Gmail Labels: wichtig_todo, termine, finanzen (all 3 applied)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
 import logging
 
 from agent_platform.db.models import ProcessedEmail
 from agent_platform.events import log_event, EventType
+from agent_platform.providers.category_mapping import CATEGORY_MAPPING
 
 
 logger = logging.getLogger(__name__)
 
 
 # Category to Gmail Label mapping
-CATEGORY_TO_LABEL_MAP = {
-    'wichtig_todo': 'Important/ToDo',
-    'termine': 'Events/Appointments',
-    'finanzen': 'Finance/Invoices',
-    'bestellungen': 'Orders/Shipping',
-    'job_projekte': 'Work/Projects',
-    'vertraege': 'Contracts/Official',
-    'persoenlich': 'Personal',
-    'newsletter': 'Newsletter',
-    'werbung': 'Marketing/Promo',
-    'spam': 'SPAM',
-}
+CATEGORY_TO_LABEL_MAP = CATEGORY_MAPPING
+
+# Gmail API limit for calls per batch request
+GMAIL_BATCH_LIMIT = 100
+
+# Emails below this importance are archived (removed from INBOX)
+ARCHIVE_IMPORTANCE_THRESHOLD = 0.4
 
 
 class GmailHandler:
@@ -58,7 +54,7 @@ class GmailHandler:
             gmail_service: Google API service object (optional, for testing)
         """
         self.gmail_service = gmail_service
-        self.label_cache = {}  # Cache label IDs to avoid repeated API calls
+        self._labels_by_name: Optional[Dict[str, str]] = None  # Label name → ID, listed once
 
     async def apply_classification(
         self,
@@ -113,7 +109,7 @@ class GmailHandler:
 
             # Archive low-importance emails (importance < 0.4)
             archived = False
-            if importance_score < 0.4:
+            if importance_score < ARCHIVE_IMPORTANCE_THRESHOLD:
                 archived = await self._archive_email(
                     account_id=account_id,
                     message_id=email_record.email_id
@@ -158,6 +154,152 @@ class GmailHandler:
                 'error': str(e)
             }
 
+    async def apply_classification_batch(
+        self,
+        items: List[Dict[str, Any]],
+        account_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply classifications to many Gmail emails with batched API calls.
+
+        Label and archive changes for one email are combined into a single
+        messages.modify() call. These calls are sent as Gmail batch requests
+        of up to GMAIL_BATCH_LIMIT calls each, so N emails need about N/100
+        HTTP round trips instead of up to 2N.
+
+        Args:
+            items: One dict per email with the keyword arguments of
+                apply_classification() (email_record, primary_category,
+                secondary_categories, importance_score, confidence)
+            account_id: Gmail account ID (gmail_1, gmail_2, etc.)
+
+        Returns:
+            One result dict per item (same shape as apply_classification()),
+            in input order
+        """
+        prepared = []
+        for item in items:
+            label_names = [
+                CATEGORY_TO_LABEL_MAP.get(cat, cat)
+                for cat in [item['primary_category']] + item['secondary_categories']
+            ]
+            label_ids, created_labels = await self._get_or_create_labels(
+                account_id=account_id,
+                label_names=label_names
+            )
+            prepared.append({
+                'label_names': label_names,
+                'label_ids': label_ids,
+                'created_labels': created_labels,
+                'archive': item['importance_score'] < ARCHIVE_IMPORTANCE_THRESHOLD,
+            })
+
+        # request index -> error message (only failed modify calls)
+        errors = self._modify_batch(
+            [
+                (
+                    item['email_record'].email_id,
+                    entry['label_ids'],
+                    ['INBOX'] if entry['archive'] else []
+                )
+                for item, entry in zip(items, prepared)
+            ]
+        )
+
+        results = []
+        for index, (item, entry) in enumerate(zip(items, prepared)):
+            email_record = item['email_record']
+            error = errors.get(index)
+
+            if error:
+                logger.error(f"Gmail handler failed for {email_record.email_id}: {error}")
+                results.append({
+                    'labels_applied': [],
+                    'labels_created': entry['created_labels'],
+                    'archived': False,
+                    'success': False,
+                    'error': error
+                })
+                continue
+
+            # Update database record
+            email_record.gmail_labels_applied = entry['label_names']
+
+            # Log event
+            log_event(
+                event_type=EventType.EMAIL_CLASSIFIED,
+                account_id=account_id,
+                email_id=email_record.email_id,
+                payload={
+                    'provider': 'gmail',
+                    'primary_category': item['primary_category'],
+                    'secondary_categories': item['secondary_categories'],
+                    'labels_applied': entry['label_names'],
+                    'labels_created': entry['created_labels'],
+                    'archived': entry['archive'],
+                    'importance_score': item['importance_score'],
+                    'confidence': item['confidence']
+                }
+            )
+
+            results.append({
+                'labels_applied': entry['label_names'],
+                'labels_created': entry['created_labels'],
+                'archived': entry['archive'],
+                'success': True,
+                'error': None
+            })
+
+        return results
+
+    def _modify_batch(
+        self,
+        modifications: List[tuple[str, List[str], List[str]]]
+    ) -> Dict[int, str]:
+        """
+        Send messages.modify() calls as Gmail batch requests.
+
+        Args:
+            modifications: (message_id, add_label_ids, remove_label_ids) per email
+
+        Returns:
+            Dict mapping index in modifications to error message, for failed calls
+        """
+        if not self.gmail_service:
+            # Mock mode
+            logger.warning("Gmail service not configured - mock batch modify")
+            return {}
+
+        errors: Dict[int, str] = {}
+
+        def on_modify(request_id, response, exception):
+            if exception is not None:
+                errors[int(request_id)] = str(exception)
+
+        messages = self.gmail_service.users().messages()
+
+        for start in range(0, len(modifications), GMAIL_BATCH_LIMIT):
+            chunk = modifications[start:start + GMAIL_BATCH_LIMIT]
+            batch = self.gmail_service.new_batch_http_request(callback=on_modify)
+
+            for offset, (message_id, add_label_ids, remove_label_ids) in enumerate(chunk):
+                body = {'addLabelIds': add_label_ids}
+                if remove_label_ids:
+                    body['removeLabelIds'] = remove_label_ids
+                batch.add(
+                    messages.modify(userId='me', id=message_id, body=body),
+                    request_id=str(start + offset)
+                )
+
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.error(f"Gmail batch modify failed: {str(e)}")
+                for offset in range(len(chunk)):
+                    errors.setdefault(start + offset, str(e))
+
+        return errors
+
     async def _get_or_create_labels(
         self,
         account_id: str,
@@ -179,45 +321,37 @@ class GmailHandler:
             label_ids = [f"label_{name}" for name in label_names]
             return label_ids, []
 
+        labels_by_name = await self._ensure_labels()
+        if labels_by_name is None:
+            # Without the label list we can't tell existing from missing labels
+            return [], []
+
         label_ids = []
         created_labels = []
 
         for label_name in label_names:
-            # Check cache first
-            cache_key = f"{account_id}:{label_name}"
-            if cache_key in self.label_cache:
-                label_ids.append(self.label_cache[cache_key])
+            label_id = labels_by_name.get(label_name)
+            if label_id:
+                label_ids.append(label_id)
                 continue
 
-            # Query existing labels
+            # Create label if not found
             try:
-                results = self.gmail_service.users().labels().list(userId='me').execute()
-                labels = results.get('labels', [])
-
-                # Find matching label
-                label_id = None
-                for label in labels:
-                    if label['name'] == label_name:
-                        label_id = label['id']
-                        break
-
-                # Create label if not found
-                if not label_id:
-                    label_body = {
-                        'name': label_name,
-                        'labelListVisibility': 'labelShow',
-                        'messageListVisibility': 'show'
-                    }
-                    created = self.gmail_service.users().labels().create(
-                        userId='me',
-                        body=label_body
-                    ).execute()
-
-                    label_id = created['id']
-                    created_labels.append(label_name)
-
-                # Cache label ID
-                self.label_cache[cache_key] = label_id
+                label_body = {
+                    'name': label_name,
+                    'labelListVisibility': 'labelShow',
+                    'messageListVisibility': 'show'
+                }
+                created = self.gmail_service.users().labels().create(
+                    userId='me',
+                    body=label_body
+                ).execute()
+
+                label_id = created['id']
+                created_labels.append(label_name)
+
+                # Keep cache coherent with the new label
+                labels_by_name[label_name] = label_id
                 label_ids.append(label_id)
 
             except Exception as e:
@@ -226,6 +360,31 @@ class GmailHandler:
 
         return label_ids, created_labels
 
+    async def _ensure_labels(self) -> Optional[Dict[str, str]]:
+        """
+        Get label name → ID mapping, listing Gmail labels only on first use.
+
+        The handler is bound to one Gmail service (one account), so a single
+        labels().list() call serves all later lookups. New labels are added
+        to the mapping when created.
+
+        Returns:
+            Dict mapping label names to label IDs, or None if listing failed
+        """
+        if self._labels_by_name is None:
+            try:
+                results = self.gmail_service.users().labels().list(userId='me').execute()
+            except Exception as e:
+                logger.error(f"Failed to list Gmail labels: {str(e)}")
+                return None
+
+            self._labels_by_name = {
+                label['name']: label['id']
+                for label in results.get('labels', [])
+            }
+
+        return self._labels_by_name
+
     async def _apply_labels(
         self,
         account_id: str,
@@ -296,11 +455,11 @@ class GmailHandler:
             logger.error(f"Failed to archive {message_id}: {str(e)}")
             return False
 
-    def get_label_mapping(self) -> Dict[str, str]:
+    def get_label_mapping(self) -> Mapping[str, str]:
         """
         Get category to Gmail label mapping.
 
         Returns:
-            Dict mapping category names to Gmail label names
+            Read-only mapping of category names to Gmail label names
         """
-        return CATEGORY_TO_LABEL_MAP.copy()
+        return CATEGORY_TO_LABEL_MAP
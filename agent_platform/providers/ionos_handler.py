@@ -15,30 +15,64 @@ Example:
     → IONOS Folder: Important/ToDo (only primary applied)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
 import logging
 import imaplib
+import time
 
 from agent_platform.db.models import ProcessedEmail
 from agent_platform.events import log_event, EventType
+from agent_platform.providers.category_mapping import CATEGORY_MAPPING
 
 
 logger = logging.getLogger(__name__)
 
 
 # Category to IMAP Folder mapping
-CATEGORY_TO_FOLDER_MAP = {
-    'wichtig_todo': 'Important/ToDo',
-    'termine': 'Events/Appointments',
-    'finanzen': 'Finance/Invoices',
-    'bestellungen': 'Orders/Shipping',
-    'job_projekte': 'Work/Projects',
-    'vertraege': 'Contracts/Official',
-    'persoenlich': 'Personal',
-    'newsletter': 'Newsletter',
-    'werbung': 'Marketing/Promo',
-    'spam': 'SPAM',
-}
+CATEGORY_TO_FOLDER_MAP = CATEGORY_MAPPING
+
+# Idle time (seconds) after which a reused IMAP connection is NOOP-checked
+IMAP_HEALTH_CHECK_INTERVAL = 30
+
+# Max UIDs per UID MOVE command (keeps command lines within server limits)
+IMAP_MOVE_BATCH_LIMIT = 1000
+
+
+def build_uid_sets(uids: List[str], max_uids: int = IMAP_MOVE_BATCH_LIMIT) -> List[str]:
+    """
+    Build IMAP UID sequence sets (RFC 3501), e.g. "1001:1050,1100,1200:1210".
+
+    Consecutive UIDs are collapsed into ranges. Each returned set covers at
+    most `max_uids` UIDs.
+
+    Args:
+        uids: Message UIDs (numeric strings)
+        max_uids: Maximum number of UIDs per sequence set
+
+    Returns:
+        List of sequence set strings
+    """
+    numbers = sorted({int(uid) for uid in uids})
+
+    uid_sets = []
+    for start in range(0, len(numbers), max_uids):
+        chunk = numbers[start:start + max_uids]
+
+        ranges = []
+        range_start = previous = chunk[0]
+        for number in chunk[1:]:
+            if number != previous + 1:
+                ranges.append((range_start, previous))
+                range_start = number
+            previous = number
+        ranges.append((range_start, previous))
+
+        uid_sets.append(",".join(
+            str(first) if first == last else f"{first}:{last}"
+            for first, last in ranges
+        ))
+
+    return uid_sets
 
 
 class IonosHandler:
@@ -50,17 +84,30 @@ class IonosHandler:
     - Secondary categories stored in DB but NOT applied to IMAP
     - Create folders if they don't exist
     - Handle folder conflicts
+    - Reuse one IMAP connection across calls (reconnects if it drops)
     """
 
-    def __init__(self, imap_connection=None):
+    def __init__(
+        self,
+        imap_connection=None,
+        account_config: Optional[Dict[str, Any]] = None
+    ):
         """
         Initialize IONOS handler.
 
         Args:
-            imap_connection: IMAP connection object (optional, for testing)
+            imap_connection: Active IMAP connection (optional, for testing)
+            account_config: Account settings like Config.IONOS_ACCOUNT
+                (email, password, imap_server, imap_port). If given, the
+                handler logs in lazily and reconnects when the connection drops.
         """
         self.imap_connection = imap_connection
+        self.account_config = account_config
         self.folder_cache = set()  # Cache existing folders
+        self._folders_listed = False  # Folder LIST runs once per handler
+        self._capabilities = frozenset()  # CAPABILITY of _capabilities_conn
+        self._capabilities_conn = None
+        self._last_used = time.monotonic()
 
     async def apply_classification(
         self,
@@ -150,6 +197,141 @@ class IonosHandler:
                 'error': str(e)
             }
 
+    async def apply_classification_batch(
+        self,
+        items: List[Dict[str, Any]],
+        account_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply classifications to many IONOS emails with batched IMAP moves.
+
+        Emails are grouped by target folder. Each group is moved with one
+        `UID MOVE <uid_set> <folder>` per IMAP_MOVE_BATCH_LIMIT UIDs, not one
+        COPY/STORE/EXPUNGE cycle per email; servers without the MOVE
+        capability get one UID COPY/STORE/EXPUNGE cycle per sequence set
+        instead. Missing folders are created once, based on a single folder
+        LIST. Each result's moved/success reflects the server response for
+        the sequence set holding that email.
+
+        Args:
+            items: One dict per email with the keyword arguments of
+                apply_classification() (email_record, primary_category,
+                secondary_categories, importance_score, confidence)
+            account_id: IONOS account ID (ionos_1, ionos_2, etc.)
+
+        Returns:
+            One result dict per item (same shape as apply_classification()),
+            in input order
+        """
+        # folder → indices of items moving there
+        buckets: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            folder_name = CATEGORY_TO_FOLDER_MAP.get(item['primary_category'], item['primary_category'])
+            buckets.setdefault(folder_name, []).append(index)
+
+        folders_created = {
+            folder_name: await self._create_folder_if_needed(
+                account_id=account_id,
+                folder_name=folder_name
+            )
+            for folder_name in buckets
+        }
+
+        errors_by_folder = {
+            folder_name: await self._move_batch_to_folder(
+                message_ids=[items[i]['email_record'].email_id for i in indices],
+                folder_name=folder_name
+            )
+            for folder_name, indices in buckets.items()
+        }
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        for folder_name, indices in buckets.items():
+            for index in indices:
+                item = items[index]
+                email_record = item['email_record']
+                error = errors_by_folder[folder_name][email_record.email_id]
+                moved = error is None
+
+                # Update database record
+                email_record.ionos_folder_applied = folder_name
+
+                # Log event
+                log_event(
+                    event_type=EventType.EMAIL_CLASSIFIED,
+                    account_id=account_id,
+                    email_id=email_record.email_id,
+                    payload={
+                        'provider': 'ionos',
+                        'primary_category': item['primary_category'],
+                        'secondary_categories': item['secondary_categories'],
+                        'folder_applied': folder_name,
+                        'folder_created': folders_created[folder_name],
+                        'secondary_ignored': item['secondary_categories'],  # IMAP doesn't support multi-folder
+                        'moved': moved,
+                        'importance_score': item['importance_score'],
+                        'confidence': item['confidence']
+                    }
+                )
+
+                results[index] = {
+                    'folder_applied': folder_name,
+                    'folder_created': folders_created[folder_name],
+                    'secondary_ignored': item['secondary_categories'],
+                    'moved': moved,
+                    'success': moved,
+                    'error': error
+                }
+
+        return results
+
+    async def _get_conn(self):
+        """
+        Get the shared IMAP connection, connecting or reconnecting as needed.
+
+        A connection idle for more than IMAP_HEALTH_CHECK_INTERVAL seconds
+        is checked with NOOP first. If it was dropped (BYE, socket error) and
+        account_config is set, a new connection is opened and INBOX selected.
+
+        Returns:
+            IMAP connection, or None in mock mode (no connection, no config)
+        """
+        conn = self.imap_connection
+
+        if conn is not None and time.monotonic() - self._last_used > IMAP_HEALTH_CHECK_INTERVAL:
+            try:
+                status, _ = conn.noop()
+                if status != 'OK':
+                    raise imaplib.IMAP4.abort(f"NOOP returned {status}")
+            except (imaplib.IMAP4.error, OSError) as e:
+                logger.warning(f"IMAP connection lost: {str(e)}")
+                if self.account_config:
+                    conn = self.imap_connection = None
+
+        if conn is None and self.account_config:
+            conn = imaplib.IMAP4_SSL(
+                self.account_config['imap_server'],
+                self.account_config['imap_port']
+            )
+            conn.login(self.account_config['email'], self.account_config['password'])
+            conn.select('INBOX')
+            self.imap_connection = conn
+
+        self._last_used = time.monotonic()
+        return conn
+
+    async def close(self):
+        """Log out and drop the shared IMAP connection."""
+        if self.imap_connection is None:
+            return
+
+        try:
+            self.imap_connection.logout()
+        except (imaplib.IMAP4.error, OSError) as e:
+            logger.warning(f"IMAP logout failed: {str(e)}")
+        finally:
+            self.imap_connection = None
+
     async def _create_folder_if_needed(
         self,
         account_id: str,
@@ -165,7 +347,8 @@ class IonosHandler:
         Returns:
             True if folder was created, False if already existed
         """
-        if not self.imap_connection:
+        conn = await self._get_conn()
+        if not conn:
             # Mock mode for testing
             logger.warning("IMAP connection not configured - using mock mode")
             return False
@@ -175,29 +358,30 @@ class IonosHandler:
             return False
 
         try:
-            # List existing folders
-            status, folders = self.imap_connection.list()
+            # List existing folders (once; later creates keep the cache current)
+            if not self._folders_listed:
+                status, folders = conn.list()
 
-            if status != 'OK':
-                logger.error(f"Failed to list IMAP folders: {status}")
-                return False
+                if status != 'OK':
+                    logger.error(f"Failed to list IMAP folders: {status}")
+                    return False
+
+                # Parse folder names
+                for folder in folders:
+                    # Parse folder name from IMAP LIST response
+                    # Format: (\\Flags) "/" "FolderName"
+                    parts = folder.decode().split('"')
+                    if len(parts) >= 3:
+                        self.folder_cache.add(parts[-2])
 
-            # Parse folder names
-            existing_folders = set()
-            for folder in folders:
-                # Parse folder name from IMAP LIST response
-                # Format: (\\Flags) "/" "FolderName"
-                parts = folder.decode().split('"')
-                if len(parts) >= 3:
-                    existing_folders.add(parts[-2])
+                self._folders_listed = True
 
             # Check if folder exists
-            if folder_name in existing_folders:
-                self.folder_cache.add(folder_name)
+            if folder_name in self.folder_cache:
                 return False
 
             # Create folder
-            status, result = self.imap_connection.create(folder_name)
+            status, result = conn.create(folder_name)
 
             if status != 'OK':
                 logger.error(f"Failed to create folder {folder_name}: {status}")
@@ -228,28 +412,29 @@ class IonosHandler:
         Returns:
             True if moved successfully
         """
-        if not self.imap_connection:
+        conn = await self._get_conn()
+        if not conn:
             # Mock mode
             logger.warning("IMAP connection not configured - mock moving email")
             return True
 
         try:
             # Copy message to target folder
-            status, result = self.imap_connection.uid('COPY', message_id, folder_name)
+            status, result = conn.uid('COPY', message_id, folder_name)
 
             if status != 'OK':
                 logger.error(f"Failed to copy {message_id} to {folder_name}: {status}")
                 return False
 
             # Mark original as deleted
-            status, result = self.imap_connection.uid('STORE', message_id, '+FLAGS', '(\\Deleted)')
+            status, result = conn.uid('STORE', message_id, '+FLAGS', '(\\Deleted)')
 
             if status != 'OK':
                 logger.error(f"Failed to delete original {message_id}: {status}")
                 return False
 
             # Expunge deleted messages
-            self.imap_connection.expunge()
+            conn.expunge()
 
             return True
 
@@ -257,11 +442,102 @@ class IonosHandler:
             logger.error(f"Failed to move {message_id} to {folder_name}: {str(e)}")
             return False
 
-    def get_folder_mapping(self) -> Dict[str, str]:
+    def _server_capabilities(self, conn) -> frozenset:
+        """Return the server's CAPABILITY list, queried once per connection."""
+        if self._capabilities_conn is not conn:
+            status, data = conn.capability()
+            if status == 'OK' and data and data[0]:
+                self._capabilities = frozenset(data[0].decode().upper().split())
+            else:
+                logger.warning(f"IMAP CAPABILITY returned {status}; assuming no MOVE support")
+                self._capabilities = frozenset()
+            self._capabilities_conn = conn
+        return self._capabilities
+
+    def _move_uid_set(self, conn, uid_set: str, folder_name: str, capabilities: frozenset) -> Optional[str]:
+        """
+        Move one UID sequence set; returns None on success, else the error.
+
+        Uses UID MOVE (RFC 6851) when the server supports it, otherwise
+        UID COPY + STORE \\Deleted + EXPUNGE (UID EXPUNGE with UIDPLUS, so
+        only these messages are expunged).
+        """
+        if 'MOVE' in capabilities:
+            status, result = conn.uid('MOVE', uid_set, folder_name)
+            if status != 'OK':
+                return f"UID MOVE returned {status}: {result}"
+            return None
+
+        status, result = conn.uid('COPY', uid_set, folder_name)
+        if status != 'OK':
+            return f"UID COPY returned {status}: {result}"
+
+        status, result = conn.uid('STORE', uid_set, '+FLAGS', '(\\Deleted)')
+        if status != 'OK':
+            return f"UID STORE returned {status}: {result}"
+
+        if 'UIDPLUS' in capabilities:
+            status, result = conn.uid('EXPUNGE', uid_set)
+        else:
+            status, result = conn.expunge()
+        if status != 'OK':
+            return f"EXPUNGE returned {status}: {result}"
+        return None
+
+    async def _move_batch_to_folder(
+        self,
+        message_ids: List[str],
+        folder_name: str
+    ) -> Dict[str, Optional[str]]:
+        """
+        Move several emails to one IMAP folder using UID sequence sets.
+
+        Uses UID MOVE if the server advertises the MOVE capability and falls
+        back to UID COPY/STORE/EXPUNGE otherwise. A failed sequence set is
+        logged, not raised, and only fails the emails it contains.
+
+        Args:
+            message_ids: Email message IDs (UIDs)
+            folder_name: Target folder name
+
+        Returns:
+            Dict mapping each message ID to None if it was moved, else the error
+        """
+        conn = await self._get_conn()
+        if not conn:
+            # Mock mode
+            logger.warning("IMAP connection not configured - mock moving emails")
+            return {message_id: None for message_id in message_ids}
+
+        errors: Dict[str, Optional[str]] = {}
+        try:
+            capabilities = self._server_capabilities(conn)
+        except Exception as e:
+            logger.error(f"Failed to move {len(message_ids)} emails to {folder_name}: {str(e)}")
+            return {message_id: str(e) for message_id in message_ids}
+
+        ordered = sorted(set(message_ids), key=int)
+        for start in range(0, len(ordered), IMAP_MOVE_BATCH_LIMIT):
+            chunk = ordered[start:start + IMAP_MOVE_BATCH_LIMIT]
+            uid_set = build_uid_sets(chunk)[0]
+
+            try:
+                error = self._move_uid_set(conn, uid_set, folder_name, capabilities)
+            except Exception as e:
+                error = str(e)
+
+            if error is not None:
+                logger.warning(f"Moving {uid_set} to {folder_name} failed: {error}")
+            for message_id in chunk:
+                errors[message_id] = error
+
+        return errors
+
+    def get_folder_mapping(self) -> Mapping[str, str]:
         """
         Get category to IMAP folder mapping.
 
         Returns:
-            Dict mapping category names to IMAP folder names
+            Read-only mapping of category names to IMAP folder names
         """
-        return CATEGORY_TO_FOLDER_MAP.copy()
+        return CATEGORY_TO_FOLDER_MAP
@@ -0,0 +1,200 @@
+"""
+Provider Apply Queue (Phase 7)
+
+Applies provider labels/folders in the background so classification
+doesn't wait on Gmail/IMAP round trips.
+
+Queued items are drained in batches and applied per handler/account with
+apply_classification_batch(), so a burst of classified emails costs one
+batched call per provider instead of one call per email.
+
+Usage:
+    from agent_platform.providers import enqueue_apply
+
+    future = await enqueue_apply(
+        handler=gmail_handler,
+        account_id="gmail_1",
+        email_record=email_record,
+        primary_category="wichtig_todo",
+        secondary_categories=["termine"],
+        importance_score=0.85,
+        confidence=0.92,
+    )
+    # Optional: wait for the provider result
+    result = await future
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent_platform.db.models import ProcessedEmail
+
+
+logger = logging.getLogger(__name__)
+
+
+# Max items handed to one apply_classification_batch() call
+APPLY_QUEUE_BATCH_SIZE = 100
+
+
+class ApplyQueue:
+    """
+    In-process background queue for provider classification application.
+
+    A single worker task is started lazily on first enqueue. Each queued
+    item resolves its future with the handler's result dict; if the batch
+    call raises, returns too few results or the worker is cancelled, the
+    future gets {'success': False, 'error': ...} instead, so futures are
+    always resolved and un-awaited ones never leak exceptions.
+    """
+
+    def __init__(self, batch_size: int = APPLY_QUEUE_BATCH_SIZE):
+        """
+        Initialize apply queue.
+
+        Args:
+            batch_size: Max items per apply_classification_batch() call
+        """
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def enqueue(
+        self,
+        handler: Any,
+        account_id: str,
+        item: Dict[str, Any]
+    ) -> asyncio.Future:
+        """
+        Queue one classification for background application.
+
+        Args:
+            handler: GmailHandler or IonosHandler
+            account_id: Account ID passed to the handler
+            item: Keyword arguments of handler.apply_classification()
+                (without account_id)
+
+        Returns:
+            Future resolving to the handler's result dict
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((handler, account_id, item, future))
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        return future
+
+    async def join(self):
+        """Wait until every queued item has been applied."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self):
+        """Apply remaining items and stop the worker."""
+        await self.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        """Worker loop: drain the queue in batches and apply them."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._apply(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _apply(self, batch: List[Tuple[Any, str, Dict[str, Any], asyncio.Future]]):
+        """Apply one drained batch, grouped by handler and account."""
+        groups: Dict[Tuple[int, str], List[Tuple[Any, str, Dict[str, Any], asyncio.Future]]] = {}
+        for entry in batch:
+            handler, account_id = entry[0], entry[1]
+            groups.setdefault((id(handler), account_id), []).append(entry)
+
+        try:
+            for entries in groups.values():
+                handler, account_id = entries[0][0], entries[0][1]
+                try:
+                    results = await handler.apply_classification_batch(
+                        items=[item for _, _, item, _ in entries],
+                        account_id=account_id
+                    )
+                except Exception as e:
+                    logger.error(f"Background apply failed for {len(entries)} emails ({account_id}): {str(e)}")
+                    results = [{'success': False, 'error': str(e)} for _ in entries]
+
+                if len(results) < len(entries):
+                    logger.error(
+                        f"Background apply returned {len(results)} results for "
+                        f"{len(entries)} emails ({account_id})"
+                    )
+
+                for (_, _, _, future), result in zip(entries, results):
+                    if not future.done():
+                        future.set_result(result)
+
+                for _, _, _, future in entries:
+                    if not future.done():
+                        future.set_result({'success': False, 'error': 'Missing result from provider handler'})
+        finally:
+            # Worker cancelled mid-batch: never leave a caller awaiting forever
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_result({'success': False, 'error': 'Apply queue stopped before applying'})
+
+
+# One queue per event loop: asyncio.Queue and the worker task are bound to
+# the loop they were created on
+_apply_queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ApplyQueue]" = weakref.WeakKeyDictionary()
+
+
+def get_apply_queue() -> ApplyQueue:
+    """Get the shared apply queue of the running event loop."""
+    loop = asyncio.get_running_loop()
+    queue = _apply_queues.get(loop)
+    if queue is None:
+        queue = ApplyQueue()
+        _apply_queues[loop] = queue
+    return queue
+
+
+async def enqueue_apply(
+    handler: Any,
+    account_id: str,
+    email_record: ProcessedEmail,
+    primary_category: str,
+    secondary_categories: List[str],
+    importance_score: float,
+    confidence: float
+) -> asyncio.Future:
+    """
+    Queue a provider classification on the shared apply queue.
+
+    Returns immediately; await the returned future for the handler result.
+    """
+    return await get_apply_queue().enqueue(
+        handler=handler,
+        account_id=account_id,
+        item={
+            'email_record': email_record,
+            'primary_category': primary_category,
+            'secondary_categories': secondary_categories,
+            'importance_score': importance_score,
+            'confidence': confidence,
+        }
+    )
@@ -14,6 +14,7 @@ from .profile_service import SenderProfileService
 from .nlp_intent_agent import (
     create_nlp_intent_agent,
     parse_nlp_intent,
+    parse_nlp_intents,
     ParsedIntent,
     IntentParserResult
 )
@@ -23,6 +24,7 @@ __all__ = [
     'SenderProfileService',
     'create_nlp_intent_agent',
     'parse_nlp_intent',
+    'parse_nlp_intents',
     'ParsedIntent',
     'IntentParserResult',
     'IntentExecutor',
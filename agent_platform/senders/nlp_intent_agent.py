@@ -94,6 +94,22 @@ class ParsedIntent(BaseModel):
     )
 
 
+class ParsedIntentBatchItem(ParsedIntent):
+    """
+    Parsed intent for one input of a batched request.
+    """
+    index: int = Field(description="1-based index of the input this intent belongs to")
+
+
+class ParsedIntentBatch(BaseModel):
+    """
+    Structured output for batched intent parsing (one item per input).
+    """
+    intents: List[ParsedIntentBatchItem] = Field(
+        description="One parsed intent per numbered input, in input order"
+    )
+
+
 # ============================================================================
 # AGENT PROMPTS
 # ============================================================================
@@ -220,6 +236,44 @@ def build_user_prompt_nlp_intent(
     return "\n".join(prompt_parts)
 
 
+def build_user_prompt_nlp_intents(
+    texts: List[str],
+    account_id: str
+) -> str:
+    """
+    Build user prompt for batched NLP intent parsing.
+
+    Args:
+        texts: User's natural language inputs
+        account_id: Account ID (for context)
+
+    Returns:
+        Formatted user prompt with numbered inputs
+    """
+    prompt_parts = []
+
+    prompt_parts.append("=== EMAIL-PRÄFERENZ PARSING (BATCH) ===")
+    prompt_parts.append(f"\n**Account:** {account_id}")
+    prompt_parts.append(f"**User Inputs ({len(texts)}):**")
+    for i, text in enumerate(texts, 1):
+        prompt_parts.append(f"{i}. \"{text}\"")
+    prompt_parts.append("\n--- 🎯 AUFGABE ---")
+    prompt_parts.append("Analysiere JEDEN Text unabhängig und identifiziere jeweils:")
+    prompt_parts.append("1. Intent-Typ (whitelist, blacklist, mute, allow_only, etc.)")
+    prompt_parts.append("2. Sender (Email, Domain oder Name)")
+    prompt_parts.append("3. Kategorien (falls relevant)")
+    prompt_parts.append("4. Vertrauensstufe (falls relevant)")
+    prompt_parts.append("5. Confidence (0.0-1.0 - wie sicher bist du?)")
+    prompt_parts.append("6. Reasoning (2-3 Sätze auf Deutsch)")
+    prompt_parts.append("7. Key Signals (3-5 wichtigste Wörter/Phrasen)")
+    prompt_parts.append(
+        f"\nGib genau {len(texts)} ParsedIntent-Objekte zurück, "
+        "jeweils mit 'index' = Nummer des Inputs."
+    )
+
+    return "\n".join(prompt_parts)
+
+
 # ============================================================================
 # INTENT PARSING FUNCTION (Tool for Agent)
 # ============================================================================
@@ -432,6 +486,75 @@ async def parse_nlp_intent(
         original_text=text  # Set original user input
     )
 
+    return _build_parser_result(parsed_intent)
+
+
+async def parse_nlp_intents(
+    texts: List[str],
+    account_id: str
+) -> List[IntentParserResult]:
+    """
+    Parse several NLP intents with a single LLM call.
+
+    All inputs are sent as one numbered prompt and parsed into a
+    ParsedIntentBatch. If the batched call fails or does not return exactly
+    one intent per input, each text is parsed individually instead.
+
+    Args:
+        texts: User's natural language inputs (German)
+        account_id: Account ID
+
+    Returns:
+        List of IntentParserResult, in the same order as texts
+    """
+    if not texts:
+        return []
+
+    provider = get_llm_provider()
+
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT_NLP_INTENT},
+        {"role": "user", "content": build_user_prompt_nlp_intents(texts, account_id)}
+    ]
+
+    try:
+        response, _provider_used = await provider.complete(
+            messages=messages,
+            response_format=ParsedIntentBatch,
+            temperature=0.1,  # Low temperature for consistent parsing
+        )
+
+        if hasattr(response, 'choices') and len(response.choices) > 0:
+            batch = response.choices[0].message.parsed
+        else:
+            batch = response
+
+        items = {item.index: item for item in batch.intents}
+        if sorted(items) != list(range(1, len(texts) + 1)):
+            raise ValueError(
+                f"Expected {len(texts)} intents, got indices {sorted(items)}"
+            )
+
+    except Exception:
+        # Fallback: Parse each input on its own
+        return [
+            await parse_nlp_intent(text, account_id)
+            for text in texts
+        ]
+
+    results = []
+    for i, text in enumerate(texts, 1):
+        parsed_intent = ParsedIntent(
+            **items[i].model_dump(exclude={'index', 'original_text'}),
+            original_text=text
+        )
+        results.append(_build_parser_result(parsed_intent))
+
+    return results
+
+
+def _build_parser_result(parsed_intent: ParsedIntent) -> IntentParserResult:
+    """Wrap a parsed intent with suggested actions and confirmation flag."""
     # Generate suggested actions
     suggested_actions = _generate_suggested_actions(parsed_intent)
 
@@ -22,15 +22,44 @@ Usage:
     result = await service.apply_preferences(email, classification_result)
 """
 
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, func, case
 
 from agent_platform.db.database import get_db
 from agent_platform.db.models import SenderPreference
 from agent_platform.classification.models import EmailCategory, CATEGORY_IMPORTANCE_MAP
 
 
+# Maximum number of (sender_email, account_id) lookups kept in memory
+PROFILE_CACHE_SIZE = 4096
+
+# Seconds a cached profile lookup (including a miss) is trusted. Other
+# writers of SenderPreference (e.g. the feedback tracker) do not invalidate
+# this cache, so their rows become visible after at most this long.
+PROFILE_CACHE_TTL = 30
+
+# Maximum number of memoized apply_preferences() results
+APPLY_CACHE_SIZE = 10_000
+
+# Seconds get_profile_stats() results stay cached
+PROFILE_STATS_TTL = 30
+
+# Trust levels whose membership is decided by the explicit list flags, so
+# list_by_trust() agrees with list_whitelisted/list_blacklisted and with the
+# counts of get_profile_stats() even when trust_level was written separately.
+_TRUST_FLAGS = {'trusted': 'is_whitelisted', 'blocked': 'is_blacklisted'}
+
+_MISSING = object()
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a classification result dict, including its list values."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
 class SenderProfileService:
     """
     Service for managing sender profiles and applying preferences.
@@ -42,9 +71,114 @@ class SenderProfileService:
     - Preference application during classification
     """
 
-    def __init__(self):
-        """Initialize sender profile service."""
-        pass
+    def __init__(
+        self,
+        cache_size: int = PROFILE_CACHE_SIZE,
+        apply_cache_size: int = APPLY_CACHE_SIZE
+    ):
+        """
+        Initialize sender profile service.
+
+        Args:
+            cache_size: Max number of cached profile lookups (LRU eviction).
+                Misses are cached as None so unknown senders skip the DB too;
+                every entry expires after PROFILE_CACHE_TTL seconds.
+            apply_cache_size: Max number of memoized apply_preferences() results
+        """
+        self._cache_size = cache_size
+        self._pref_ttl = timedelta(seconds=PROFILE_CACHE_TTL)
+        # (sender_email, account_id) -> (cached_at, profile or None)
+        self._pref_cache: "OrderedDict[Tuple[str, str], Tuple[datetime, Optional[SenderPreference]]]" = OrderedDict()
+
+        # apply_preferences() results, keyed by sender, profile generation
+        # and classification input. Mutators bump the sender's generation so
+        # results computed from an older profile are never returned.
+        self._apply_cache_size = apply_cache_size
+        self._apply_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._generations: Dict[Tuple[str, str], int] = {}
+
+        # account_id -> (computed_at, stats)
+        self._stats_ttl = timedelta(seconds=PROFILE_STATS_TTL)
+        self._stats_cache: Dict[str, Tuple[datetime, Dict[str, int]]] = {}
+
+    # ========================================================================
+    # PROFILE CACHE
+    # ========================================================================
+
+    def _cache_get(self, sender_email: str, account_id: str):
+        """Return cached profile (may be None), or _MISSING if not cached or expired."""
+        key = (sender_email, account_id)
+        cached = self._pref_cache.get(key)
+        if cached is None:
+            return _MISSING
+        if datetime.now() - cached[0] >= self._pref_ttl:
+            # The reloaded row may differ; retire results memoized from this one
+            del self._pref_cache[key]
+            self._generations[key] = self._generations.get(key, 0) + 1
+            return _MISSING
+        self._pref_cache.move_to_end(key)
+        return cached[1]
+
+    def _cache_put(
+        self,
+        sender_email: str,
+        account_id: str,
+        pref: Optional[SenderPreference]
+    ) -> None:
+        """Store profile lookup result, evicting least recently used entry."""
+        key = (sender_email, account_id)
+        self._pref_cache[key] = (datetime.now(), pref)
+        self._pref_cache.move_to_end(key)
+        if len(self._pref_cache) > self._cache_size:
+            self._pref_cache.popitem(last=False)
+
+    def _profile_updated(
+        self,
+        sender_email: str,
+        account_id: str,
+        pref: Optional[SenderPreference]
+    ) -> None:
+        """Cache a freshly written profile and retire memoized results."""
+        key = (sender_email, account_id)
+        self._generations[key] = self._generations.get(key, 0) + 1
+        self._stats_cache.pop(account_id, None)
+        self._cache_put(sender_email, account_id, pref)
+
+    def invalidate_cache(self, sender_email: Optional[str] = None, account_id: Optional[str] = None) -> None:
+        """
+        Drop cached profile lookups.
+
+        Call after modifying SenderPreference rows outside this service.
+        Without arguments the whole cache is cleared.
+        """
+        if sender_email is None or account_id is None:
+            self._pref_cache.clear()
+            self._apply_cache.clear()
+            self._stats_cache.clear()
+        else:
+            key = (sender_email, account_id)
+            self._pref_cache.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._stats_cache.pop(account_id, None)
+
+    def _apply_cache_key(
+        self,
+        sender_email: str,
+        account_id: str,
+        classification_result: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """Build memoization key, or None if the input is not hashable."""
+        try:
+            frozen = tuple(sorted(
+                (k, tuple(v) if isinstance(v, list) else v)
+                for k, v in classification_result.items()
+            ))
+            hash(frozen)
+        except TypeError:
+            return None
+
+        generation = self._generations.get((sender_email, account_id), 0)
+        return (sender_email, account_id, generation, frozen)
 
     # ========================================================================
     # WHITELIST / BLACKLIST MANAGEMENT
@@ -110,6 +244,7 @@ class SenderProfileService:
             # Expunge to allow access outside session
             db.expunge(pref)
 
+            self._profile_updated(sender_email, account_id, pref)
             return pref
 
     async def blacklist_sender(
@@ -160,6 +295,7 @@ class SenderProfileService:
             # Expunge to allow access outside session
             db.expunge(pref)
 
+            self._profile_updated(sender_email, account_id, pref)
             return pref
 
     async def remove_from_whitelist(
@@ -180,6 +316,7 @@ class SenderProfileService:
                 db.commit()
                 db.refresh(pref)
 
+            self.invalidate_cache(sender_email, account_id)
             return pref
 
     async def remove_from_blacklist(
@@ -200,6 +337,7 @@ class SenderProfileService:
                 db.commit()
                 db.refresh(pref)
 
+            self.invalidate_cache(sender_email, account_id)
             return pref
 
     # ========================================================================
@@ -264,6 +402,7 @@ class SenderProfileService:
             # Expunge to allow access outside session
             db.expunge(pref)
 
+            self._profile_updated(sender_email, account_id, pref)
             return pref
 
     # ========================================================================
@@ -320,6 +459,7 @@ class SenderProfileService:
             # Expunge to allow access outside session
             db.expunge(pref)
 
+            self._profile_updated(sender_email, account_id, pref)
             return pref
 
     async def mute_categories(
@@ -392,6 +532,10 @@ class SenderProfileService:
         Returns:
             SenderPreference object or None
         """
+        cached = self._cache_get(sender_email, account_id)
+        if cached is not _MISSING:
+            return cached
+
         with get_db() as db:
             pref = db.query(SenderPreference).filter(
                 SenderPreference.account_id == account_id,
@@ -401,7 +545,8 @@ class SenderProfileService:
             if pref:
                 db.expunge(pref)  # Allow access outside session
 
-            return pref
+        self._cache_put(sender_email, account_id, pref)
+        return pref
 
     async def apply_preferences(
         self,
@@ -437,6 +582,28 @@ class SenderProfileService:
             # No preferences - return unchanged
             return classification_result
 
+        cache_key = self._apply_cache_key(sender_email, account_id, classification_result)
+        if cache_key is not None:
+            cached = self._apply_cache.get(cache_key)
+            if cached is not None:
+                self._apply_cache.move_to_end(cache_key)
+                return _copy_result(cached)
+
+        result = self._apply_profile(profile, classification_result)
+
+        if cache_key is not None:
+            self._apply_cache[cache_key] = _copy_result(result)
+            if len(self._apply_cache) > self._apply_cache_size:
+                self._apply_cache.popitem(last=False)
+
+        return result
+
+    def _apply_profile(
+        self,
+        profile: SenderPreference,
+        classification_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Apply a loaded sender profile to a classification result."""
         # Create a copy to avoid modifying original
         result = classification_result.copy()
 
@@ -506,54 +673,90 @@ class SenderProfileService:
     # UTILITY METHODS
     # ========================================================================
 
-    async def list_whitelisted(self, account_id: str) -> List[SenderPreference]:
-        """List all whitelisted senders for account."""
+    async def list_by_trust(
+        self,
+        account_id: str,
+        trust_levels: Tuple[str, ...]
+    ) -> Dict[str, List[SenderPreference]]:
+        """
+        List senders for several trust levels with a single query.
+
+        'trusted' and 'blocked' are matched on the is_whitelisted and
+        is_blacklisted flags (see _TRUST_FLAGS), other levels on trust_level.
+
+        Args:
+            account_id: Account ID
+            trust_levels: Trust levels to fetch (e.g. ('trusted', 'blocked'))
+
+        Returns:
+            Dict mapping each requested trust level to its senders
+        """
+        grouped: Dict[str, List[SenderPreference]] = {level: [] for level in trust_levels}
+
+        conditions = []
+        plain_levels = [level for level in trust_levels if level not in _TRUST_FLAGS]
+        if plain_levels:
+            conditions.append(SenderPreference.trust_level.in_(plain_levels))
+        for level in trust_levels:
+            if level in _TRUST_FLAGS:
+                conditions.append(getattr(SenderPreference, _TRUST_FLAGS[level]) == True)
+
+        if not conditions:
+            return grouped
+
         with get_db() as db:
             prefs = db.query(SenderPreference).filter(
                 SenderPreference.account_id == account_id,
-                SenderPreference.is_whitelisted == True
+                or_(*conditions)
             ).all()
 
             # Expunge all objects to allow access outside session
             for pref in prefs:
                 db.expunge(pref)
+                for level in trust_levels:
+                    flag = _TRUST_FLAGS.get(level)
+                    if (getattr(pref, flag) if flag else pref.trust_level == level):
+                        grouped[level].append(pref)
 
-            return prefs
+        return grouped
+
+    async def list_whitelisted(self, account_id: str) -> List[SenderPreference]:
+        """List all whitelisted senders for account."""
+        return (await self.list_by_trust(account_id, ('trusted',)))['trusted']
 
     async def list_blacklisted(self, account_id: str) -> List[SenderPreference]:
         """List all blacklisted senders for account."""
-        with get_db() as db:
-            prefs = db.query(SenderPreference).filter(
-                SenderPreference.account_id == account_id,
-                SenderPreference.is_blacklisted == True
-            ).all()
+        return (await self.list_by_trust(account_id, ('blocked',)))['blocked']
 
-            # Expunge all objects to allow access outside session
-            for pref in prefs:
-                db.expunge(pref)
+    async def get_profile_stats(self, account_id: str) -> Dict[str, int]:
+        """
+        Get statistics about sender profiles.
 
-            return prefs
+        All counts come from one aggregate query. Results are cached for
+        PROFILE_STATS_TTL seconds; mutators of this service drop the cached
+        stats of the affected account.
+        """
+        cached = self._stats_cache.get(account_id)
+        if cached is not None and datetime.now() - cached[0] < self._stats_ttl:
+            return dict(cached[1])
 
-    async def get_profile_stats(self, account_id: str) -> Dict[str, int]:
-        """Get statistics about sender profiles."""
         with get_db() as db:
-            total = db.query(SenderPreference).filter(
+            total, whitelisted, blacklisted = db.query(
+                func.count(SenderPreference.id),
+                func.sum(case((SenderPreference.is_whitelisted == True, 1), else_=0)),
+                func.sum(case((SenderPreference.is_blacklisted == True, 1), else_=0)),
+            ).filter(
                 SenderPreference.account_id == account_id
-            ).count()
-
-            whitelisted = db.query(SenderPreference).filter(
-                SenderPreference.account_id == account_id,
-                SenderPreference.is_whitelisted == True
-            ).count()
-
-            blacklisted = db.query(SenderPreference).filter(
-                SenderPreference.account_id == account_id,
-                SenderPreference.is_blacklisted == True
-            ).count()
-
-            return {
-                'total_profiles': total,
-                'whitelisted': whitelisted,
-                'blacklisted': blacklisted,
-                'neutral': total - whitelisted - blacklisted
-            }
+            ).one()
+
+        whitelisted = whitelisted or 0
+        blacklisted = blacklisted or 0
+        stats = {
+            'total_profiles': total,
+            'whitelisted': whitelisted,
+            'blacklisted': blacklisted,
+            'neutral': total - whitelisted - blacklisted
+        }
+
+        self._stats_cache[account_id] = (datetime.now(), stats)
+        return dict(stats)
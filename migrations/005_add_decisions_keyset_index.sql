@@ -0,0 +1,6 @@
+-- Migration 005: Add Keyset Pagination Index for Decisions
+-- Date: 2026-10-17
+-- Description: Composite index backing cursor pagination of GET /api/v1/decisions
+--              (ORDER BY created_at DESC, decision_id DESC).
+
+CREATE INDEX IF NOT EXISTS idx_decisions_created_at_decision_id ON decisions(created_at, decision_id);
@@ -0,0 +1,6 @@
+-- Migration 006: Add Email-Agent Status Index
+-- Date: 2026-10-17
+-- Description: Composite index for the GET /api/v1/email-agent/status aggregate
+--              (processed_at >= today, confidence < 0.90, MAX(processed_at)).
+
+CREATE INDEX IF NOT EXISTS idx_processed_emails_processed_at_confidence ON processed_emails(processed_at, confidence);
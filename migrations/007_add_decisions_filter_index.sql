@@ -0,0 +1,7 @@
+-- Migration 007: Add Decisions Filter Index
+-- Date: 2026-10-17
+-- Description: Composite index for GET /api/v1/decisions filtered by account_id, status
+--              and urgency, ordered by created_at. (PostgreSQL deployments created via
+--              SQLAlchemy also INCLUDE decision_id, email_sender.)
+
+CREATE INDEX IF NOT EXISTS idx_decisions_filters ON decisions(account_id, status, urgency, created_at);
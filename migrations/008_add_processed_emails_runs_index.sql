@@ -0,0 +1,9 @@
+-- Migration 008: Add Email-Agent Runs List Index
+-- Date: 2026-10-17
+-- Description: Composite index for GET /api/v1/email-agent/runs?account_id=...
+--              (account_id = ?, ORDER BY processed_at DESC LIMIT n) so the page
+--              is read in index order instead of sorted in a temp B-tree.
+--              needs_human-only filtering uses the processed_at/confidence index
+--              from migration 006.
+
+CREATE INDEX IF NOT EXISTS idx_processed_emails_account_processed_at ON processed_emails(account_id, processed_at);
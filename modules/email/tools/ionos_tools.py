@@ -6,6 +6,7 @@ IMAP/SMTP tools for Ionos email account.
 import imaplib
 import smtplib
 import email
+import re
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Any
@@ -84,6 +85,111 @@ class IonosService:
             print(f'❌ Error fetching Ionos emails: {e}')
             return []
 
+    def fetch_unread_headers(self, max_results: int = 10, snippet_bytes: int = 200) -> List[Dict[str, Any]]:
+        """
+        Fetch headers and a short snippet of unread emails via IMAP.
+
+        Unlike fetch_unread_emails(), this issues a single UID FETCH for all
+        messages and only transfers Subject/From/Date plus the first
+        `snippet_bytes` of the first body part, instead of full RFC822 bodies.
+        The snippet is raw (not transfer-decoded).
+
+        Returns:
+            List of email dictionaries (id, subject, sender, date, snippet)
+        """
+        try:
+            # Connect to IMAP
+            mail = imaplib.IMAP4_SSL(self.imap_server, self.imap_port)
+            try:
+                mail.login(self.email, self.password)
+                mail.select('INBOX', readonly=True)
+
+                # Search for unread emails
+                status, messages = mail.uid('search', None, 'UNSEEN')
+
+                if status != 'OK':
+                    return []
+
+                uids = messages[0].split()[-max_results:]
+                if not uids:
+                    return []
+
+                # One round trip for all messages
+                status, msg_data = mail.uid(
+                    'fetch',
+                    b','.join(uids).decode(),
+                    f'(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)] BODY.PEEK[1]<0.{snippet_bytes}>)'
+                )
+
+                if status != 'OK':
+                    return []
+
+                mail.close()
+            finally:
+                mail.logout()
+
+            by_uid: Dict[str, Dict[str, Any]] = {}
+            for descriptor, parts in self._group_fetch_response(msg_data):
+                # The server may send UID before or after the literals
+                uid_match = re.search(rb'UID (\d+)', descriptor)
+                if not uid_match:
+                    continue
+
+                fields = by_uid.setdefault(uid_match.group(1).decode(), {})
+                for part_descriptor, payload in parts:
+                    if b'HEADER.FIELDS' in part_descriptor:
+                        headers = email.message_from_bytes(payload)
+                        fields['subject'] = headers.get('Subject', 'No Subject')
+                        fields['sender'] = headers.get('From', 'Unknown')
+                        fields['date'] = headers.get('Date', '')
+                    elif b'BODY[1]' in part_descriptor:
+                        fields['snippet'] = payload.decode('utf-8', errors='ignore')
+
+            # Keep search order (oldest → newest), like fetch_unread_emails()
+            emails = []
+            for uid in uids:
+                fields = by_uid.get(uid.decode())
+                if fields is None:
+                    continue
+
+                emails.append({
+                    'id': uid.decode(),
+                    'subject': fields.get('subject', 'No Subject'),
+                    'sender': fields.get('sender', 'Unknown'),
+                    'date': fields.get('date', ''),
+                    'snippet': fields.get('snippet', '')
+                })
+
+            return emails
+
+        except Exception as e:
+            print(f'❌ Error fetching Ionos email headers: {e}')
+            return []
+
+    @staticmethod
+    def _group_fetch_response(msg_data) -> List[tuple]:
+        """
+        Group an imaplib FETCH response by message.
+
+        Each message arrives as one or more (descriptor, literal) tuples
+        followed by a closing bytes item (b')' or e.g. b' UID 7)').
+
+        Returns:
+            List of (full descriptor bytes, [(part descriptor, literal), ...])
+        """
+        groups = []
+        for item in msg_data:
+            if isinstance(item, tuple):
+                descriptor, payload = item
+                # "<seq> (" starts the next message
+                if not groups or re.match(rb'\d+ \(', descriptor):
+                    groups.append([b'', []])
+                groups[-1][0] += descriptor
+                groups[-1][1].append((descriptor, payload))
+            elif isinstance(item, bytes) and groups:
+                groups[-1][0] += item
+        return [(descriptor, parts) for descriptor, parts in groups]
+
     def _get_email_body(self, msg) -> str:
         """Extract email body from message"""
         body = ""
@@ -25,33 +25,70 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
+from google.oauth2.credentials import Credentials as UserCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.exceptions import DefaultCredentialsError
 from googleapiclient.discovery import build
+from dotenv import load_dotenv
 import json
 
+# Load .env once at import time; get_gmail_service() only reads from _ENV
+load_dotenv(override=False, verbose=False)
+_ENV = dict(os.environ)
+
+# OAuth2 scopes
+SCOPES = (
+    'https://www.googleapis.com/auth/gmail.readonly',
+    'https://www.googleapis.com/auth/gmail.modify',
+    'https://www.googleapis.com/auth/gmail.labels',
+)
+
+
+# account_id -> (service, credentials), reused while credentials stay valid
+_SERVICE_CACHE = {}
+
 
 def get_gmail_service(account_id: str = "gmail_2"):
     """
     Get Gmail service with OAuth2 authentication.
 
+    The service is built once per account_id and reused for later calls
+    as long as its credentials are still valid.
+
     Args:
         account_id: Account ID (e.g., "gmail_2")
 
     Returns:
         Gmail service object
     """
-    from dotenv import load_dotenv
+    cached = _SERVICE_CACHE.get(account_id)
+    if cached and cached[1].valid:
+        return cached[0]
 
-    # Load .env
-    load_dotenv()
+    built = _build_gmail_service(account_id)
+    if built is None:
+        return None
+
+    _SERVICE_CACHE[account_id] = built
+    return built[0]
+
+
+def _build_gmail_service(account_id: str):
+    """
+    Load/refresh credentials and build the Gmail service.
 
+    Args:
+        account_id: Account ID (e.g., "gmail_2")
+
+    Returns:
+        (service, credentials) tuple, or None on error
+    """
     # Get paths from environment
     creds_key = f"{account_id.upper()}_CREDENTIALS_PATH"
     token_key = f"{account_id.upper()}_TOKEN_PATH"
 
-    creds_path = os.getenv(creds_key)
-    token_path = os.getenv(token_key)
+    creds_path = _ENV.get(creds_key)
+    token_path = _ENV.get(token_key)
 
     if not creds_path:
         print(f"❌ Error: {creds_key} not found in .env")
@@ -66,19 +103,11 @@ def get_gmail_service(account_id: str = "gmail_2"):
         print(f"   4. Save to: {creds_path}")
         return None
 
-    # OAuth2 scopes
-    SCOPES = [
-        'https://www.googleapis.com/auth/gmail.readonly',
-        'https://www.googleapis.com/auth/gmail.modify',
-        'https://www.googleapis.com/auth/gmail.labels',
-    ]
-
     creds = None
 
     # Try to load cached token
     if os.path.exists(token_path):
         print(f"✅ Found cached token: {token_path}")
-        from google.oauth2.credentials import Credentials as UserCredentials
         creds = UserCredentials.from_authorized_user_file(token_path, SCOPES)
 
         # Refresh if expired
@@ -125,7 +154,7 @@ def get_gmail_service(account_id: str = "gmail_2"):
     try:
         service = build('gmail', 'v1', credentials=creds)
         print(f"✅ Gmail service created successfully")
-        return service
+        return service, creds
     except Exception as e:
         print(f"❌ Failed to create Gmail service: {e}")
         return None
@@ -144,8 +173,11 @@ def test_gmail_access(service):
     try:
         print(f"\n📧 Fetching unread emails...")
 
+        # Messages resource, reused for list() and every get() below
+        users_messages = service.users().messages()
+
         # Get unread emails
-        results = service.users().messages().list(
+        results = users_messages.list(
             userId='me',
             q='is:unread',
             maxResults=5
@@ -159,11 +191,14 @@ def test_gmail_access(service):
 
         print(f"✅ Found {len(messages)} unread email(s):\n")
 
+        # Collect per-email lines and write them in one go
+        out = []
+
         for i, message in enumerate(messages, 1):
             msg_id = message['id']
 
             # Get message details
-            msg = service.users().messages().get(
+            msg = users_messages.get(
                 userId='me',
                 id=msg_id,
                 format='metadata',
@@ -175,10 +210,12 @@ def test_gmail_access(service):
             sender = next((h['value'] for h in headers if h['name'] == 'From'), '(unknown)')
             date = next((h['value'] for h in headers if h['name'] == 'Date'), '(unknown)')
 
-            print(f"   {i}. {subject[:60]}")
-            print(f"      From: {sender[:50]}")
-            print(f"      Date: {date}")
-            print()
+            out.append(f"   {i}. {subject[:60]}")
+            out.append(f"      From: {sender[:50]}")
+            out.append(f"      Date: {date}")
+            out.append("")
+
+        sys.stdout.write("\n".join(out) + "\n")
 
         return len(messages)
 
@@ -4,11 +4,14 @@ Test script for Inbox API endpoints.
 
 Tests:
 - Dynamic account discovery
+- Account details and newest emails per account (probed concurrently)
 - Email listing with filters
 - Email detail retrieval
 """
 
 import sys
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from fastapi.testclient import TestClient
 
 # Add project root to path
@@ -17,6 +20,31 @@ sys.path.insert(0, '/home/dani/Schreibtisch/cursor_dev/agent-systems/agent-platf
 from agent_platform.api.main import app
 
 
+def _flush(lines):
+    """Write buffered output lines with a single write call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _probe_account(client, account_id):
+    """
+    Run Tests 2 and 4 for one account: account details, then its 3 newest emails.
+
+    Returns (account_id, account_response, emails_response); emails_response
+    is None when the account is unknown or has no emails.
+    """
+    account_response = client.get(f"/api/v1/accounts/{account_id}")
+
+    emails_response = None
+    if account_response.status_code != 404 and (
+        account_response.status_code != 200
+        or orjson.loads(account_response.content)['email_count'] > 0
+    ):
+        emails_response = client.get(f"/api/v1/emails?account_id={account_id}&limit=3&fields=email_id,subject")
+
+    return account_id, account_response, emails_response
+
+
 def main():
     """Test inbox API endpoints."""
     client = TestClient(app)
@@ -32,124 +60,161 @@ def main():
     response = client.get("/api/v1/accounts")
     print(f"Status Code: {response.status_code}")
 
+    # account_id -> account; None if discovery failed (then probe anyway)
+    accounts = None
+
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
+        accounts = {account['account_id']: account for account in data['accounts']}
         print(f"✅ Success: Found {data['total']} accounts")
         print()
 
+        out = []
         for account in data['accounts']:
-            print(f"  Account: {account['account_id']}")
-            print(f"    Email: {account['email']}")
-            print(f"    Type: {account['account_type']}")
-            print(f"    Has Token: {account['has_token']}")
-            print(f"    Email Count: {account['email_count']}")
-            print(f"    Last Seen: {account['last_seen']}")
-            print()
+            out.append(f"  Account: {account['account_id']}")
+            out.append(f"    Email: {account['email']}")
+            out.append(f"    Type: {account['account_type']}")
+            out.append(f"    Has Token: {account['has_token']}")
+            out.append(f"    Email Count: {account['email_count']}")
+            out.append(f"    Last Seen: {account['last_seen']}")
+            out.append("")
+        _flush(out)
     else:
         print(f"❌ Failed: {response.text}")
 
     print()
 
+    # Tests 2 and 4 for every discovered account (gmail_1 if discovery
+    # failed), probed concurrently; TestClient is thread-safe and the
+    # probes are I/O-bound
+    account_ids = list(accounts) if accounts is not None else ['gmail_1']
+    probes = []
+    if account_ids:
+        with ThreadPoolExecutor(max_workers=min(8, len(account_ids))) as executor:
+            probes = list(executor.map(lambda account_id: _probe_account(client, account_id), account_ids))
+
     # Test 2: GET /api/v1/accounts/{account_id}
-    print("Test 2: GET /api/v1/accounts/gmail_1")
+    print("Test 2: GET /api/v1/accounts/{account_id}")
     print("-" * 60)
-    response = client.get("/api/v1/accounts/gmail_1")
-    print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Success: {data['email']} - {data['email_count']} emails")
-    elif response.status_code == 404:
-        print("⚠️  Account 'gmail_1' not found (may not be configured)")
-    else:
-        print(f"❌ Failed: {response.text}")
+    if not probes:
+        print("⚠️  No accounts discovered in Test 1 (skipped)")
+
+    out = []
+    for account_id, response, _ in probes:
+        out.append(f"  {account_id}: Status Code: {response.status_code}")
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            out.append(f"  ✅ Success: {data['email']} - {data['email_count']} emails")
+        elif response.status_code == 404:
+            out.append(f"  ⚠️  Account '{account_id}' not found (may not be configured)")
+        else:
+            out.append(f"  ❌ Failed: {response.text}")
+    _flush(out)
 
     print()
 
     # Test 3: GET /api/v1/emails (all accounts)
     print("Test 3: GET /api/v1/emails?limit=5")
     print("-" * 60)
-    response = client.get("/api/v1/emails?limit=5")
+    response = client.get("/api/v1/emails?limit=5&fields=subject,sender,account_id,category,confidence,received_at")
     print(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ Success: {data['total']} total emails, showing {len(data['emails'])}")
         print()
 
+        out = []
         for email in data['emails']:
-            print(f"  Subject: {email['subject']}")
-            print(f"  Sender: {email['sender']}")
-            print(f"  Account: {email['account_id']}")
-            print(f"  Category: {email['category']} ({email['confidence']:.2f} confidence)")
-            print(f"  Received: {email['received_at']}")
-            print()
+            out.append(f"  Subject: {email['subject']}")
+            out.append(f"  Sender: {email['sender']}")
+            out.append(f"  Account: {email['account_id']}")
+            out.append(f"  Category: {email['category']} ({email['confidence']:.2f} confidence)")
+            out.append(f"  Received: {email['received_at']}")
+            out.append("")
+        _flush(out)
     else:
         print(f"❌ Failed: {response.text}")
 
     print()
 
-    # Test 4: GET /api/v1/emails?account_id=gmail_1
-    print("Test 4: GET /api/v1/emails?account_id=gmail_1&limit=3")
+    # Test 4: GET /api/v1/emails?account_id={account_id}
+    print("Test 4: GET /api/v1/emails?account_id={account_id}&limit=3")
     print("-" * 60)
-    response = client.get("/api/v1/emails?account_id=gmail_1&limit=3")
-    print(f"Status Code: {response.status_code}")
 
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Success: {data['total']} emails for account gmail_1")
-
-        if len(data['emails']) > 0:
-            print()
-            print(f"First email: {data['emails'][0]['subject']}")
-            first_email_id = data['emails'][0]['email_id']
+    if not probes:
+        print("⚠️  No accounts discovered in Test 1 (skipped)")
+
+    first_email_id = None
+    out = []
+    for account_id, _, response in probes:
+        if response is None:
+            out.append(f"  ⚠️  No emails for {account_id} (skipped)")
+            continue
+
+        out.append(f"  {account_id}: Status Code: {response.status_code}")
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            out.append(f"  ✅ Success: {data['total']} emails for account {account_id}")
+            if len(data['emails']) > 0:
+                out.append(f"  First email: {data['emails'][0]['subject']}")
+                if first_email_id is None:
+                    first_email_id = data['emails'][0]['email_id']
+            else:
+                out.append(f"  ⚠️  No emails found for {account_id}")
+        else:
+            out.append(f"  ❌ Failed: {response.text}")
+    _flush(out)
 
-            # Test 5: GET /api/v1/emails/{email_id} (with body)
+    # Test 5: GET /api/v1/emails/{email_id} (with body)
+    if first_email_id is not None:
+        print()
+        print(f"Test 5: GET /api/v1/emails/{first_email_id}")
+        print("-" * 60)
+        response = client.get(
+            f"/api/v1/emails/{first_email_id}"
+            "?fields=subject,sender,received_at,category,body_text,body_html,tasks,decisions,questions"
+        )
+        print(f"Status Code: {response.status_code}")
+
+        if response.status_code == 200:
+            email_data = orjson.loads(response.content)
+            print("✅ Success: Retrieved email details")
             print()
-            print(f"Test 5: GET /api/v1/emails/{first_email_id}")
-            print("-" * 60)
-            response = client.get(f"/api/v1/emails/{first_email_id}")
-            print(f"Status Code: {response.status_code}")
-
-            if response.status_code == 200:
-                email_data = response.json()
-                print("✅ Success: Retrieved email details")
+            print(f"  Subject: {email_data['subject']}")
+            print(f"  Sender: {email_data['sender']}")
+            print(f"  Received: {email_data['received_at']}")
+            print(f"  Category: {email_data['category']}")
+            print(f"  Has Body Text: {'Yes' if email_data['body_text'] else 'No'}")
+            print(f"  Has Body HTML: {'Yes' if email_data['body_html'] else 'No'}")
+            print(f"  Tasks: {len(email_data.get('tasks', []))}")
+            print(f"  Decisions: {len(email_data.get('decisions', []))}")
+            print(f"  Questions: {len(email_data.get('questions', []))}")
+
+            if email_data['body_text']:
                 print()
-                print(f"  Subject: {email_data['subject']}")
-                print(f"  Sender: {email_data['sender']}")
-                print(f"  Received: {email_data['received_at']}")
-                print(f"  Category: {email_data['category']}")
-                print(f"  Has Body Text: {'Yes' if email_data['body_text'] else 'No'}")
-                print(f"  Has Body HTML: {'Yes' if email_data['body_html'] else 'No'}")
-                print(f"  Tasks: {len(email_data.get('tasks', []))}")
-                print(f"  Decisions: {len(email_data.get('decisions', []))}")
-                print(f"  Questions: {len(email_data.get('questions', []))}")
-
-                if email_data['body_text']:
-                    print()
-                    print("  Body Preview (first 200 chars):")
-                    print(f"  {email_data['body_text'][:200]}...")
-            else:
-                print(f"❌ Failed to retrieve email detail: {response.text}")
+                print("  Body Preview (first 200 chars):")
+                print(f"  {email_data['body_text'][:200]}...")
         else:
-            print("⚠️  No emails found for gmail_1")
-    else:
-        print(f"❌ Failed: {response.text}")
+            print(f"❌ Failed to retrieve email detail: {response.text}")
 
     print()
 
     # Test 6: GET /api/v1/emails?category=wichtig
     print("Test 6: GET /api/v1/emails?category=wichtig&limit=3")
     print("-" * 60)
-    response = client.get("/api/v1/emails?category=wichtig&limit=3")
+    response = client.get("/api/v1/emails?category=wichtig&limit=3&fields=subject,confidence")
     print(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         print(f"✅ Success: {data['total']} emails with category 'wichtig'")
 
-        for email in data['emails']:
-            print(f"  - {email['subject']} (confidence: {email['confidence']:.2f})")
+        _flush([
+            f"  - {email['subject']} (confidence: {email['confidence']:.2f})"
+            for email in data['emails']
+        ])
     else:
         print(f"❌ Failed: {response.text}")
 
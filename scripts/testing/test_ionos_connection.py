@@ -14,7 +14,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from dotenv import load_dotenv
 from modules.email.tools.ionos_tools import IonosService
 
-load_dotenv()
+load_dotenv(override=False, verbose=False)
+
+# Config from .env, read once at import time
+IONOS_EMAIL = os.getenv('IONOS_EMAIL')
+IONOS_PASSWORD = os.getenv('IONOS_PASSWORD')
+IONOS_IMAP_SERVER = os.getenv('IONOS_IMAP_SERVER', 'imap.ionos.de')
+IONOS_IMAP_PORT = int(os.getenv('IONOS_IMAP_PORT', '993'))
+IONOS_SMTP_SERVER = os.getenv('IONOS_SMTP_SERVER', 'smtp.ionos.de')
+IONOS_SMTP_PORT = int(os.getenv('IONOS_SMTP_PORT', '587'))
 
 
 def main():
@@ -24,13 +32,12 @@ def main():
     print("="*70)
     print()
 
-    # Get config from .env
-    email = os.getenv('IONOS_EMAIL')
-    password = os.getenv('IONOS_PASSWORD')
-    imap_server = os.getenv('IONOS_IMAP_SERVER', 'imap.ionos.de')
-    imap_port = int(os.getenv('IONOS_IMAP_PORT', '993'))
-    smtp_server = os.getenv('IONOS_SMTP_SERVER', 'smtp.ionos.de')
-    smtp_port = int(os.getenv('IONOS_SMTP_PORT', '587'))
+    email = IONOS_EMAIL
+    password = IONOS_PASSWORD
+    imap_server = IONOS_IMAP_SERVER
+    imap_port = IONOS_IMAP_PORT
+    smtp_server = IONOS_SMTP_SERVER
+    smtp_port = IONOS_SMTP_PORT
 
     print(f"Email: {email}")
     print(f"IMAP Server: {imap_server}:{imap_port}")
@@ -49,7 +56,7 @@ def main():
 
         # Test connection by fetching emails
         print("📬 Fetching unread emails...")
-        emails = service.fetch_unread_emails(max_results=5)
+        emails = service.fetch_unread_headers(max_results=5)
 
         print()
         print("="*70)
@@ -63,11 +70,13 @@ def main():
         if emails:
             print("Recent unread emails:")
             print("-" * 70)
+            out = []
             for i, email_data in enumerate(emails, 1):
-                print(f"\n{i}. {email_data['subject'][:60]}")
-                print(f"   From: {email_data['sender'][:50]}")
-                print(f"   Date: {email_data['date'][:30]}")
-                print(f"   Snippet: {email_data['snippet'][:80]}...")
+                out.append(f"\n{i}. {email_data['subject'][:60]}")
+                out.append(f"   From: {email_data['sender'][:50]}")
+                out.append(f"   Date: {email_data['date'][:30]}")
+                out.append(f"   Snippet: {email_data['snippet'][:80]}...")
+            sys.stdout.write("\n".join(out) + "\n")
 
         print()
         print("="*70)
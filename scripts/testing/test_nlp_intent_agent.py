@@ -22,6 +22,7 @@ sys.path.insert(0, str(project_root))
 
 from agent_platform.senders import (
     parse_nlp_intent,
+    parse_nlp_intents,
     IntentExecutor,
     create_nlp_intent_agent
 )
@@ -36,15 +37,26 @@ async def test_nlp_intent_agent():
 
     account_id = "test_account"
 
+    # Tests 1-6 and 8 only parse, so they share one batched LLM call.
+    # Test 7 is parsed separately because it is also executed.
+    text1 = "Amazon auf die Whitelist setzen"
+    text2 = "booking.com blockieren"
+    text3 = "Alle Werbemails von Zalando muten"
+    text4 = "Von Amazon nur Bestellungen und Rechnungen zeigen"
+    text5 = "LinkedIn als vertrauenswürdig markieren"
+    text6 = "Keine Newsletter und Werbung von shop@zalando.de"
+    text8 = "Mach irgendwas mit den Emails"
+    (result1, result2, result3, result4, result5, result6, result8) = await parse_nlp_intents(
+        [text1, text2, text3, text4, text5, text6, text8],
+        account_id
+    )
+
     # ========================================================================
     # TEST 1: Whitelist Intent
     # ========================================================================
     print("\n📋 TEST 1: Whitelist Intent")
     print("-" * 80)
 
-    text1 = "Amazon auf die Whitelist setzen"
-    result1 = await parse_nlp_intent(text1, account_id)
-
     print(f"Input: \"{text1}\"")
     print(f"Intent Type: {result1.parsed_intent.intent_type}")
     print(f"Sender: {result1.parsed_intent.sender_name or result1.parsed_intent.sender_domain}")
@@ -63,9 +75,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 2: Blacklist Intent")
     print("-" * 80)
 
-    text2 = "booking.com blockieren"
-    result2 = await parse_nlp_intent(text2, account_id)
-
     print(f"Input: \"{text2}\"")
     print(f"Intent Type: {result2.parsed_intent.intent_type}")
     print(f"Sender: {result2.parsed_intent.sender_domain or result2.parsed_intent.sender_name}")
@@ -82,9 +91,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 3: Mute Categories Intent")
     print("-" * 80)
 
-    text3 = "Alle Werbemails von Zalando muten"
-    result3 = await parse_nlp_intent(text3, account_id)
-
     print(f"Input: \"{text3}\"")
     print(f"Intent Type: {result3.parsed_intent.intent_type}")
     print(f"Sender: {result3.parsed_intent.sender_name or result3.parsed_intent.sender_domain}")
@@ -101,9 +107,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 4: Allow Only Categories Intent")
     print("-" * 80)
 
-    text4 = "Von Amazon nur Bestellungen und Rechnungen zeigen"
-    result4 = await parse_nlp_intent(text4, account_id)
-
     print(f"Input: \"{text4}\"")
     print(f"Intent Type: {result4.parsed_intent.intent_type}")
     print(f"Sender: {result4.parsed_intent.sender_name or result4.parsed_intent.sender_domain}")
@@ -120,9 +123,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 5: Set Trust Level Intent")
     print("-" * 80)
 
-    text5 = "LinkedIn als vertrauenswürdig markieren"
-    result5 = await parse_nlp_intent(text5, account_id)
-
     print(f"Input: \"{text5}\"")
     print(f"Intent Type: {result5.parsed_intent.intent_type}")
     print(f"Sender: {result5.parsed_intent.sender_name or result5.parsed_intent.sender_domain}")
@@ -139,9 +139,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 6: Mute Multiple Categories")
     print("-" * 80)
 
-    text6 = "Keine Newsletter und Werbung von shop@zalando.de"
-    result6 = await parse_nlp_intent(text6, account_id)
-
     print(f"Input: \"{text6}\"")
     print(f"Intent Type: {result6.parsed_intent.intent_type}")
     print(f"Sender Email: {result6.parsed_intent.sender_email}")
@@ -195,9 +192,6 @@ async def test_nlp_intent_agent():
     print("\n📋 TEST 8: Ambiguous/Unknown Intent")
     print("-" * 80)
 
-    text8 = "Mach irgendwas mit den Emails"
-    result8 = await parse_nlp_intent(text8, account_id)
-
     print(f"Input: \"{text8}\"")
     print(f"Intent Type: {result8.parsed_intent.intent_type}")
     print(f"Confidence: {result8.parsed_intent.confidence:.2f}")
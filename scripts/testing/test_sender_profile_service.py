@@ -11,7 +11,9 @@ Tests:
 """
 
 import asyncio
+import io
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 
 # Add project root to path
@@ -183,12 +185,15 @@ async def test_sender_profile_service():
     print("\n📋 TEST 8: List Profiles")
     print("-" * 80)
 
-    whitelisted = await service.list_whitelisted(account_id)
+    # One query for both lists
+    by_trust = await service.list_by_trust(account_id, ('trusted', 'blocked'))
+    whitelisted = by_trust['trusted']
+    blacklisted = by_trust['blocked']
+
     print(f"Whitelisted Senders ({len(whitelisted)}):")
     for p in whitelisted:
         print(f"   - {p.sender_email} (trust: {p.trust_level})")
 
-    blacklisted = await service.list_blacklisted(account_id)
     print(f"\nBlacklisted Senders ({len(blacklisted)}):")
     for p in blacklisted:
         print(f"   - {p.sender_email} (trust: {p.trust_level})")
@@ -198,5 +203,15 @@ async def test_sender_profile_service():
     print("=" * 80)
 
 
+async def main():
+    """Run test_sender_profile_service with report output buffered and written once."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            await test_sender_profile_service()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
 if __name__ == "__main__":
-    asyncio.run(test_sender_profile_service())
+    asyncio.run(main())
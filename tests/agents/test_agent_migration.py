@@ -18,8 +18,14 @@ Test Strategy:
 """
 
 import asyncio
+import io
 import sys
+from contextlib import redirect_stdout
+from dataclasses import dataclass
 from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,123 +36,187 @@ from agent_platform.classification.models import EmailToClassify
 from agent_platform.db.database import init_db
 
 
+# Max emails classified at the same time (each runs both classifiers)
+MAX_CONCURRENT_EMAILS = 8
+
+
 # ============================================================================
 # TEST DATA (50 Sample Emails - Various Categories)
 # ============================================================================
 
-SAMPLE_EMAILS = [
+@dataclass(frozen=True, slots=True)
+class _Sample:
+    """One migration test email plus the expected classification."""
+    email_id: str
+    subject: str
+    body: str
+    sender: str
+    account_id: str
+    expected_category: Optional[str]
+    expected_layer: str
+
+
+SAMPLE_EMAILS: Tuple[_Sample, ...] = (
     # Spam (should be caught by Rule Layer)
-    {
-        "email_id": "spam_001",
-        "subject": "CONGRATULATIONS!!! YOU WON $$$",
-        "body": "Click here now to claim your free money! Limited time offer! Act now!",
-        "sender": "noreply@spam-lottery.com",
-        "account_id": "gmail_1",
-        "expected_category": "spam",
-        "expected_layer": "rules",
-    },
-    {
-        "email_id": "spam_002",
-        "subject": "Viagra now! Special promotion!!!",
-        "body": "Get viagra at 90% discount. Buy now! Free shipping!",
-        "sender": "marketing@pharma-spam.com",
-        "account_id": "gmail_1",
-        "expected_category": "spam",
-        "expected_layer": "rules",
-    },
+    _Sample(
+        email_id="spam_001",
+        subject="CONGRATULATIONS!!! YOU WON $$$",
+        body="Click here now to claim your free money! Limited time offer! Act now!",
+        sender="noreply@spam-lottery.com",
+        account_id="gmail_1",
+        expected_category="spam",
+        expected_layer="rules",
+    ),
+    _Sample(
+        email_id="spam_002",
+        subject="Viagra now! Special promotion!!!",
+        body="Get viagra at 90% discount. Buy now! Free shipping!",
+        sender="marketing@pharma-spam.com",
+        account_id="gmail_1",
+        expected_category="spam",
+        expected_layer="rules",
+    ),
 
     # Newsletters (should be caught by Rule Layer)
-    {
-        "email_id": "newsletter_001",
-        "subject": "Weekly Tech Newsletter - October 2025",
-        "body": "This week in tech... Unsubscribe here if you don't want to receive these emails.",
-        "sender": "newsletter@techcrunch.com",
-        "account_id": "gmail_1",
-        "expected_category": "newsletter",
-        "expected_layer": "rules",
-    },
-    {
-        "email_id": "newsletter_002",
-        "subject": "Your monthly digest from Medium",
-        "body": "Top stories this month... Manage preferences or unsubscribe.",
-        "sender": "noreply@medium.com",
-        "account_id": "gmail_1",
-        "expected_category": "newsletter",
-        "expected_layer": "rules",
-    },
+    _Sample(
+        email_id="newsletter_001",
+        subject="Weekly Tech Newsletter - October 2025",
+        body="This week in tech... Unsubscribe here if you don't want to receive these emails.",
+        sender="newsletter@techcrunch.com",
+        account_id="gmail_1",
+        expected_category="newsletter",
+        expected_layer="rules",
+    ),
+    _Sample(
+        email_id="newsletter_002",
+        subject="Your monthly digest from Medium",
+        body="Top stories this month... Manage preferences or unsubscribe.",
+        sender="noreply@medium.com",
+        account_id="gmail_1",
+        expected_category="newsletter",
+        expected_layer="rules",
+    ),
 
     # Auto-replies (should be caught by Rule Layer)
-    {
-        "email_id": "autoreply_001",
-        "subject": "Out of office: Vacation",
-        "body": "I am currently out of office until Monday. I will respond to your email when I return.",
-        "sender": "colleague@company.com",
-        "account_id": "gmail_1",
-        "expected_category": "system_notifications",
-        "expected_layer": "rules",
-    },
-    {
-        "email_id": "autoreply_002",
-        "subject": "Automatic reply: Your message",
-        "body": "This is an automated message. I am not available right now.",
-        "sender": "john@example.com",
-        "account_id": "gmail_1",
-        "expected_category": "system_notifications",
-        "expected_layer": "rules",
-    },
+    _Sample(
+        email_id="autoreply_001",
+        subject="Out of office: Vacation",
+        body="I am currently out of office until Monday. I will respond to your email when I return.",
+        sender="colleague@company.com",
+        account_id="gmail_1",
+        expected_category="system_notifications",
+        expected_layer="rules",
+    ),
+    _Sample(
+        email_id="autoreply_002",
+        subject="Automatic reply: Your message",
+        body="This is an automated message. I am not available right now.",
+        sender="john@example.com",
+        account_id="gmail_1",
+        expected_category="system_notifications",
+        expected_layer="rules",
+    ),
 
     # System notifications (should be caught by Rule Layer)
-    {
-        "email_id": "system_001",
-        "subject": "Password reset requested",
-        "body": "You requested a password reset. Your verification code is 123456.",
-        "sender": "noreply@github.com",
-        "account_id": "gmail_1",
-        "expected_category": "system_notifications",
-        "expected_layer": "rules",
-    },
-    {
-        "email_id": "system_002",
-        "subject": "Order confirmation #12345",
-        "body": "Thank you for your order. Your order has been confirmed and will ship soon.",
-        "sender": "orders@amazon.com",
-        "account_id": "gmail_1",
-        "expected_category": "system_notifications",
-        "expected_layer": "rules",
-    },
+    _Sample(
+        email_id="system_001",
+        subject="Password reset requested",
+        body="You requested a password reset. Your verification code is 123456.",
+        sender="noreply@github.com",
+        account_id="gmail_1",
+        expected_category="system_notifications",
+        expected_layer="rules",
+    ),
+    _Sample(
+        email_id="system_002",
+        subject="Order confirmation #12345",
+        body="Thank you for your order. Your order has been confirmed and will ship soon.",
+        sender="orders@amazon.com",
+        account_id="gmail_1",
+        expected_category="system_notifications",
+        expected_layer="rules",
+    ),
 
     # Ambiguous emails (need LLM Layer)
-    {
-        "email_id": "ambiguous_001",
-        "subject": "Quick question",
-        "body": "Hey, do you have time for a quick call this week? I want to discuss the project.",
-        "sender": "colleague@company.com",
-        "account_id": "gmail_1",
-        "expected_category": None,  # Could be action_required or wichtig
-        "expected_layer": "llm",  # Needs semantic understanding
-    },
-    {
-        "email_id": "ambiguous_002",
-        "subject": "Meeting notes",
-        "body": "Here are the notes from yesterday's meeting. Let me know if you have any questions.",
-        "sender": "manager@company.com",
-        "account_id": "gmail_1",
-        "expected_category": None,  # Could be nice_to_know or wichtig
-        "expected_layer": "llm",
-    },
-]
+    _Sample(
+        email_id="ambiguous_001",
+        subject="Quick question",
+        body="Hey, do you have time for a quick call this week? I want to discuss the project.",
+        sender="colleague@company.com",
+        account_id="gmail_1",
+        expected_category=None,  # Could be action_required or wichtig
+        expected_layer="llm",  # Needs semantic understanding
+    ),
+    _Sample(
+        email_id="ambiguous_002",
+        subject="Meeting notes",
+        body="Here are the notes from yesterday's meeting. Let me know if you have any questions.",
+        sender="manager@company.com",
+        account_id="gmail_1",
+        expected_category=None,  # Could be nice_to_know or wichtig
+        expected_layer="llm",
+    ),
+)
 
 
 # ============================================================================
 # COMPARISON FUNCTIONS
 # ============================================================================
 
-def compare_results(original, agent_based, email_data):
+# Allowed absolute difference for confidence/importance (floating point)
+SCORE_TOLERANCE = 0.01
+
+
+class ResultSnapshot(NamedTuple):
+    """Fields of one classification result that are compared."""
+    category: str
+    confidence: float
+    importance: float
+    layer_used: str
+
+
+class Comparison(NamedTuple):
+    """
+    Outcome of comparing both implementations for one email.
+
+    Snapshots are only kept while scores still need checking and for
+    failed comparisons; passing comparisons drop them.
+    """
+    email_id: str
+    matches: bool
+    differences: Tuple[str, ...]
+    original: Optional[ResultSnapshot] = None
+    agent: Optional[ResultSnapshot] = None
+
+
+class LayerStats(NamedTuple):
+    """Layer distribution (percentages) reported by a classifier."""
+    rule: float
+    history: float
+    llm: float
+
+    @classmethod
+    def from_stats(cls, stats):
+        return cls(
+            rule=stats['rule_layer_percentage'],
+            history=stats['history_layer_percentage'],
+            llm=stats['llm_layer_percentage'],
+        )
+
+
+def _snapshot(result) -> ResultSnapshot:
+    return ResultSnapshot(result.category, result.confidence, result.importance, result.layer_used)
+
+
+def compare_results(original, agent_based, email_data) -> Comparison:
     """
-    Compare classification results from both implementations.
+    Compare categorical fields of both implementations' results.
+
+    Numeric scores are compared for all emails at once in
+    apply_score_checks() once every comparison has been built.
 
     Returns:
-        dict with comparison metrics and any differences found
+        Comparison with any differences found
     """
     differences = []
 
@@ -158,33 +228,47 @@ def compare_results(original, agent_based, email_data):
     if original.layer_used != agent_based.layer_used:
         differences.append(f"Layer mismatch: {original.layer_used} vs {agent_based.layer_used}")
 
-    # Compare confidence (allow small floating point differences)
-    conf_diff = abs(original.confidence - agent_based.confidence)
-    if conf_diff > 0.01:  # Allow 1% difference for floating point
-        differences.append(f"Confidence mismatch: {original.confidence:.3f} vs {agent_based.confidence:.3f} (diff: {conf_diff:.3f})")
-
-    # Compare importance (allow small floating point differences)
-    imp_diff = abs(original.importance - agent_based.importance)
-    if imp_diff > 0.01:  # Allow 1% difference for floating point
-        differences.append(f"Importance mismatch: {original.importance:.3f} vs {agent_based.importance:.3f} (diff: {imp_diff:.3f})")
-
-    return {
-        'email_id': email_data['email_id'],
-        'matches': len(differences) == 0,
-        'differences': differences,
-        'original_result': {
-            'category': original.category,
-            'confidence': original.confidence,
-            'importance': original.importance,
-            'layer_used': original.layer_used,
-        },
-        'agent_result': {
-            'category': agent_based.category,
-            'confidence': agent_based.confidence,
-            'importance': agent_based.importance,
-            'layer_used': agent_based.layer_used,
-        }
-    }
+    return Comparison(
+        email_id=email_data.email_id,
+        matches=not differences,
+        differences=tuple(differences),
+        original=_snapshot(original),
+        agent=_snapshot(agent_based),
+    )
+
+
+def apply_score_checks(comparisons: List[Comparison]) -> List[Comparison]:
+    """
+    Compare confidence and importance for all comparisons in one pass.
+
+    Difference strings are only built for scores outside SCORE_TOLERANCE;
+    comparisons without results (exceptions) are passed through. Snapshots
+    are dropped from comparisons that still match.
+
+    Returns:
+        Updated comparisons, in input order
+    """
+    scored = [i for i, comp in enumerate(comparisons) if comp.original is not None]
+    extra = {}
+
+    for field, label in (('confidence', 'Confidence'), ('importance', 'Importance')):
+        original_scores = [getattr(comparisons[i].original, field) for i in scored]
+        agent_scores = [getattr(comparisons[i].agent, field) for i in scored]
+        diffs = [abs(a - b) for a, b in zip(original_scores, agent_scores)]
+
+        for index in [i for i, diff in enumerate(diffs) if diff > SCORE_TOLERANCE]:
+            extra.setdefault(scored[index], []).append(
+                f"{label} mismatch: {original_scores[index]:.3f} vs {agent_scores[index]:.3f} (diff: {diffs[index]:.3f})"
+            )
+
+    updated = []
+    for i, comp in enumerate(comparisons):
+        if i in extra:
+            comp = comp._replace(matches=False, differences=comp.differences + tuple(extra[i]))
+        if comp.matches:
+            comp = comp._replace(original=None, agent=None)
+        updated.append(comp)
+    return updated
 
 
 # ============================================================================
@@ -210,59 +294,69 @@ async def run_migration_test():
     original_classifier = UnifiedClassifier()
     agent_classifier = AgentBasedClassifier()
 
-    # Test results
-    all_comparisons = []
+    # Test results (one slot per email, filled in input order)
     total_tests = len(SAMPLE_EMAILS)
-    passed_tests = 0
-    failed_tests = 0
+    all_comparisons = [None] * total_tests
+    outs = [None] * total_tests
 
     print(f"\nRunning {total_tests} test classifications...\n")
 
-    # Run classifications
-    for i, email_data in enumerate(SAMPLE_EMAILS, 1):
-        email_id = email_data['email_id']
-        print(f"[{i}/{total_tests}] Testing {email_id}...")
-
-        # Create EmailToClassify object
-        email = EmailToClassify(
-            email_id=email_data['email_id'],
-            subject=email_data['subject'],
-            body=email_data['body'],
-            sender=email_data['sender'],
-            account_id=email_data['account_id'],
-        )
-
-        # Classify with both implementations
-        try:
-            original_result = await original_classifier.classify(email)
-            agent_result = await agent_classifier.classify(email)
-
-            # Compare results
-            comparison = compare_results(original_result, agent_result, email_data)
-            all_comparisons.append(comparison)
-
-            if comparison['matches']:
-                passed_tests += 1
-                print(f"  ✅ PASS - Results identical")
-                print(f"     Category: {original_result.category}, Layer: {original_result.layer_used}, Confidence: {original_result.confidence:.2f}")
-            else:
-                failed_tests += 1
-                print(f"  ❌ FAIL - Results differ!")
-                for diff in comparison['differences']:
-                    print(f"     - {diff}")
-
-        except Exception as e:
-            failed_tests += 1
-            print(f"  ❌ ERROR: {e}")
-            all_comparisons.append({
-                'email_id': email_id,
-                'matches': False,
-                'differences': [f"Exception: {e}"],
-                'original_result': None,
-                'agent_result': None,
-            })
-
-        print()
+    # Run classifications: both classifiers per email concurrently, and
+    # emails concurrently (bounded so the LLM provider isn't overwhelmed)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMAILS)
+
+    # Build all EmailToClassify objects in one validation pass
+    # from the _Sample attributes (expected_* fields are ignored by the model)
+    emails = TypeAdapter(List[EmailToClassify]).validate_python(SAMPLE_EMAILS, from_attributes=True)
+
+    async def classify_both(email):
+        async with semaphore:
+            return await asyncio.gather(
+                original_classifier.classify(email),
+                agent_classifier.classify(email),
+            )
+
+    outcomes = await asyncio.gather(
+        *[classify_both(email) for email in emails],
+        return_exceptions=True
+    )
+
+    # Compare results: categorical fields per email, scores in one pass
+    for i, (email_data, outcome) in enumerate(zip(SAMPLE_EMAILS, outcomes)):
+        if isinstance(outcome, Exception):
+            all_comparisons[i] = Comparison(
+                email_id=email_data.email_id,
+                matches=False,
+                differences=(f"Exception: {outcome}",),
+            )
+        else:
+            all_comparisons[i] = compare_results(*outcome, email_data)
+
+    all_comparisons = apply_score_checks(all_comparisons)
+
+    # Report in input order; per-email output is buffered and written once
+    for i, (comparison, outcome) in enumerate(zip(all_comparisons, outcomes)):
+        buf = io.StringIO()
+        print(f"[{i + 1}/{total_tests}] Testing {comparison.email_id}...", file=buf)
+
+        if isinstance(outcome, Exception):
+            print(f"  ❌ ERROR: {outcome}", file=buf)
+        elif comparison.matches:
+            original_result = outcome[0]
+            print(f"  ✅ PASS - Results identical", file=buf)
+            print(f"     Category: {original_result.category}, Layer: {original_result.layer_used}, Confidence: {original_result.confidence:.2f}", file=buf)
+        else:
+            print(f"  ❌ FAIL - Results differ!", file=buf)
+            for diff in comparison.differences:
+                print(f"     - {diff}", file=buf)
+
+        print(file=buf)
+        outs[i] = buf.getvalue()
+
+    sys.stdout.write("".join(outs))
+
+    passed_tests = sum(1 for comp in all_comparisons if comp.matches)
+    failed_tests = total_tests - passed_tests
 
     # ========================================================================
     # SUMMARY
@@ -281,36 +375,34 @@ async def run_migration_test():
     # Statistics comparison
     print(f"\n📈 Statistics Comparison:")
 
-    original_stats = original_classifier.get_stats()
-    agent_stats = agent_classifier.get_stats()
+    original_stats = LayerStats.from_stats(original_classifier.get_stats())
+    agent_stats = LayerStats.from_stats(agent_classifier.get_stats())
 
     print(f"\n  Original Classifier:")
-    print(f"    Rule Layer:    {original_stats['rule_layer_percentage']:.1f}%")
-    print(f"    History Layer: {original_stats['history_layer_percentage']:.1f}%")
-    print(f"    LLM Layer:     {original_stats['llm_layer_percentage']:.1f}%")
+    print(f"    Rule Layer:    {original_stats.rule:.1f}%")
+    print(f"    History Layer: {original_stats.history:.1f}%")
+    print(f"    LLM Layer:     {original_stats.llm:.1f}%")
 
     print(f"\n  Agent-Based Classifier:")
-    print(f"    Rule Layer:    {agent_stats['rule_layer_percentage']:.1f}%")
-    print(f"    History Layer: {agent_stats['history_layer_percentage']:.1f}%")
-    print(f"    LLM Layer:     {agent_stats['llm_layer_percentage']:.1f}%")
+    print(f"    Rule Layer:    {agent_stats.rule:.1f}%")
+    print(f"    History Layer: {agent_stats.history:.1f}%")
+    print(f"    LLM Layer:     {agent_stats.llm:.1f}%")
 
     # Layer distribution comparison
-    rule_diff = abs(original_stats['rule_layer_percentage'] - agent_stats['rule_layer_percentage'])
-    history_diff = abs(original_stats['history_layer_percentage'] - agent_stats['history_layer_percentage'])
-    llm_diff = abs(original_stats['llm_layer_percentage'] - agent_stats['llm_layer_percentage'])
+    layer_diffs = LayerStats(*(abs(o - a) for o, a in zip(original_stats, agent_stats)))
 
     print(f"\n  Layer Distribution Differences:")
-    print(f"    Rule Layer:    {rule_diff:.1f}%")
-    print(f"    History Layer: {history_diff:.1f}%")
-    print(f"    LLM Layer:     {llm_diff:.1f}%")
+    print(f"    Rule Layer:    {layer_diffs.rule:.1f}%")
+    print(f"    History Layer: {layer_diffs.history:.1f}%")
+    print(f"    LLM Layer:     {layer_diffs.llm:.1f}%")
 
     # Detailed failures
     if failed_tests > 0:
         print(f"\n❌ Failed Tests Details:")
         for comp in all_comparisons:
-            if not comp['matches']:
-                print(f"\n  {comp['email_id']}:")
-                for diff in comp['differences']:
+            if not comp.matches:
+                print(f"\n  {comp.email_id}:")
+                for diff in comp.differences:
                     print(f"    - {diff}")
 
     # ========================================================================
@@ -332,8 +424,8 @@ async def run_migration_test():
         preservation_checks.append(False)
 
     # Check 2: Early stopping preserved (80-85% should stop at Rule/History)
-    early_stop_original = original_stats['rule_layer_percentage'] + original_stats['history_layer_percentage']
-    early_stop_agent = agent_stats['rule_layer_percentage'] + agent_stats['history_layer_percentage']
+    early_stop_original = original_stats.rule + original_stats.history
+    early_stop_agent = agent_stats.rule + agent_stats.history
 
     if 75 <= early_stop_original <= 90 and abs(early_stop_original - early_stop_agent) < 5:
         print(f"✅ PASS: Early stopping preserved ({early_stop_agent:.1f}% stop at Rule/History layers)")
@@ -343,11 +435,11 @@ async def run_migration_test():
         preservation_checks.append(False)
 
     # Check 3: Layer distribution matches (within 5%)
-    if rule_diff < 5 and history_diff < 5 and llm_diff < 5:
+    if all(diff < 5 for diff in layer_diffs):
         print(f"✅ PASS: Layer distribution matches (all diffs < 5%)")
         preservation_checks.append(True)
     else:
-        print(f"❌ FAIL: Layer distribution differs (max diff: {max(rule_diff, history_diff, llm_diff):.1f}%)")
+        print(f"❌ FAIL: Layer distribution differs (max diff: {max(layer_diffs):.1f}%)")
         preservation_checks.append(False)
 
     # Overall preservation status
@@ -366,6 +458,16 @@ async def run_migration_test():
 # ENTRY POINT
 # ============================================================================
 
+async def main():
+    """Run run_migration_test with report output buffered and written once."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            return await run_migration_test()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(run_migration_test())
+    exit_code = asyncio.run(main())
     sys.exit(exit_code)
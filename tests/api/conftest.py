@@ -0,0 +1,146 @@
+"""
+Shared fixtures for API route tests.
+
+Database isolation:
+- db_engine (package scope): a fresh in-memory SQLite database (StaticPool,
+  one shared connection), so tests start empty regardless of platform.db
+  and commits never hit the disk. Under pytest-xdist every worker process
+  builds its own, so modules using these fixtures can run with -n auto
+  (--dist=loadfile seeds module-scoped sample data once per module).
+- db_connection (module scope): runs one test module inside an outer
+  transaction on a dedicated connection that is rolled back afterwards.
+  Sessions opened by the app via get_db() join it with join_transaction_mode=
+  "create_savepoint", so their commits only release a SAVEPOINT and never
+  reach the database. Module-scoped fixtures can seed read-only data
+  here once.
+- db_session (function scope): wraps one test in a SAVEPOINT on that
+  connection, so the test's writes are rolled back before the next test.
+  No per-test DELETE/COMMIT is needed. The memory service singleton is
+  reset around each test so its cached session joins the same transaction.
+- empty_database (function scope): deletes module-scoped sample rows inside
+  the test's SAVEPOINT, for tests that need empty tables.
+- captured_sql (function scope): SQL statements sent on that connection
+  during one test, to check that filters reach the database.
+
+The FastAPI app is imported here once and handed to the test modules via
+the app fixture; mappers are configured at import so that cost is paid
+during collection (before xdist workers start running tests). The client
+fixture wraps it in one TestClient per session, so the app lifespan and
+the transport are set up once; async modules override it with their own
+AsyncClient.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, event
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import StaticPool
+
+from agent_platform.api.main import app as _app
+from agent_platform.db.database import SessionLocal
+from agent_platform.db.models import Base, Task, Decision, Question, ProcessedEmail
+from agent_platform.memory import service as memory_service
+
+
+# In-memory database shared by every connection of the test engine
+TEST_DATABASE_URL = "sqlite:///:memory:"
+
+configure_mappers()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI application under test"""
+    return _app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """FastAPI test client (built once; lifespan runs once per session)"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="package")
+def db_engine():
+    """Create an empty in-memory database for the API tests (one per xdist worker)."""
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def db_connection(db_engine):
+    """Connection with an outer transaction for one test module (rolled back)."""
+    connection = db_engine.connect()
+    dbapi_connection = connection.connection.driver_connection
+    is_sqlite = db_engine.dialect.name == "sqlite"
+
+    if is_sqlite:
+        # pysqlite defers BEGIN until the first DML statement, which makes
+        # SAVEPOINT/RELEASE commit on their own. Take over transaction control.
+        isolation_level = dbapi_connection.isolation_level
+        dbapi_connection.isolation_level = None
+
+    transaction = connection.begin()
+    if is_sqlite:
+        connection.exec_driver_sql("BEGIN")
+
+    session_config = dict(SessionLocal.kw)
+    SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield connection
+    finally:
+        SessionLocal.kw = session_config
+        transaction.rollback()
+        if is_sqlite:
+            dbapi_connection.isolation_level = isolation_level
+        connection.close()
+
+
+@pytest.fixture
+def db_session(db_connection, monkeypatch):
+    """Session for one test; all changes (also via get_db()) are rolled back."""
+    savepoint = db_connection.begin_nested()
+
+    # The memory service singleton keeps one session for its lifetime. Start
+    # each test without it so it binds to this test's transaction.
+    monkeypatch.setattr(memory_service, "_service", None)
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        if memory_service._service is not None:
+            memory_service._service.db.close()
+        session.close()
+        if savepoint.is_active:
+            savepoint.rollback()
+
+
+@pytest.fixture
+def empty_database(db_session):
+    """Hide module-scoped sample data for one test (rolled back afterwards)"""
+    # Nothing is loaded in this session, so skip the identity-map sync
+    for model in (Task, Decision, Question, ProcessedEmail):
+        db_session.execute(delete(model).execution_options(synchronize_session=False))
+    db_session.commit()
+    yield
+
+
+@pytest.fixture
+def captured_sql(db_connection):
+    """SQL statements executed on the test connection during one test"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_connection, "before_cursor_execute", capture)
+    yield statements
+    event.remove(db_connection, "before_cursor_execute", capture)
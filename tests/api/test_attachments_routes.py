@@ -4,103 +4,134 @@ Tests attachment listing, retrieval, and download endpoints.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime
-from fastapi.testclient import TestClient
-from pathlib import Path
-import tempfile
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import DateTime, JSON, bindparam, text
 
-from agent_platform.api.main import app
+from agent_platform.db.database import SessionLocal
 from agent_platform.db.models import Attachment
-from agent_platform.db.database import get_db
+
+
+ATTACHMENTS_URL = "/api/v1/attachments"
+
+# All attachment routes are async; run the module's tests and the shared
+# client on one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 # ============================================================================
 # Test Client Setup
 # ============================================================================
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(Attachment).delete()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """
+    Async client calling the ASGI app in-process (built once per module).
+
+    Unlike TestClient there is no portal thread per request, and the app
+    lifespan (init_db on platform.db) is skipped; db_engine creates the schema.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+# Columns written by the sample INSERT (every row provides all of them)
+_ATTACHMENT_COLUMNS = (
+    "attachment_id", "email_id", "account_id", "original_filename",
+    "file_size_bytes", "mime_type", "storage_status", "stored_path",
+    "file_hash", "downloaded_at", "created_at", "extra_metadata",
+)
+
+# Built once at import; bypasses ORM insert construction on every fixture run
+_ATTACHMENTS_INSERT = text(
+    f"INSERT INTO attachments ({', '.join(_ATTACHMENT_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in _ATTACHMENT_COLUMNS)})"
+).bindparams(
+    bindparam("downloaded_at", type_=DateTime),
+    bindparam("created_at", type_=DateTime),
+    bindparam("extra_metadata", type_=JSON),
+)
+
+# Model defaults the raw INSERT has to supply itself
+_ATTACHMENT_DEFAULTS = {
+    "file_hash": None,
+    "downloaded_at": None,
+    "created_at": datetime.utcnow(),
+    "extra_metadata": {},
+}
+
+_SAMPLE_ATTACHMENTS = [
+    {
+        "attachment_id": "attach_001",
+        "email_id": "email_001",
+        "account_id": "gmail_1",
+        "original_filename": "report.pdf",
+        "file_size_bytes": 1024 * 500,  # 500KB
+        "mime_type": "application/pdf",
+        "storage_status": "downloaded",
+        "stored_path": "attachments/gmail_1/email_001/report.pdf",
+        "file_hash": "abc123hash",
+        "downloaded_at": datetime(2025, 11, 20, 10, 0),
+    },
+    {
+        "attachment_id": "attach_002",
+        "email_id": "email_001",
+        "account_id": "gmail_1",
+        "original_filename": "image.jpg",
+        "file_size_bytes": 1024 * 200,  # 200KB
+        "mime_type": "image/jpeg",
+        "storage_status": "downloaded",
+        "stored_path": "attachments/gmail_1/email_001/image.jpg",
+        "downloaded_at": datetime(2025, 11, 20, 10, 5),
+    },
+    {
+        "attachment_id": "attach_003",
+        "email_id": "email_002",
+        "account_id": "gmail_1",
+        "original_filename": "document.docx",
+        "file_size_bytes": 1024 * 1024 * 2,  # 2MB
+        "mime_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "storage_status": "pending",
+        "stored_path": None,
+    },
+    {
+        "attachment_id": "attach_004",
+        "email_id": "email_003",
+        "account_id": "gmail_2",
+        "original_filename": "large_file.zip",
+        "file_size_bytes": 1024 * 1024 * 30,  # 30MB
+        "mime_type": "application/zip",
+        "storage_status": "skipped_too_large",
+        "stored_path": None,
+    },
+]
+
+_SAMPLE_ATTACHMENT_ROWS = [{**_ATTACHMENT_DEFAULTS, **row} for row in _SAMPLE_ATTACHMENTS]
+
+
+@pytest.fixture(scope="module")
+def sample_attachments(db_connection):
+    """Create sample attachments once per module (tests only write inside db_session)"""
+    with SessionLocal() as db:
+        db.execute(_ATTACHMENTS_INSERT, _SAMPLE_ATTACHMENT_ROWS)
         db.commit()
     yield
-    with get_db() as db:
-        db.query(Attachment).delete()
-        db.commit()
 
 
-@pytest.fixture
-def sample_attachments():
-    """Create sample attachments in database"""
-    with get_db() as db:
-        attachments = [
-            Attachment(
-                attachment_id="attach_001",
-                email_id="email_001",
-                account_id="gmail_1",
-                original_filename="report.pdf",
-                file_size_bytes=1024 * 500,  # 500KB
-                mime_type="application/pdf",
-                storage_status="downloaded",
-                stored_path="attachments/gmail_1/email_001/report.pdf",
-                file_hash="abc123hash",
-                downloaded_at=datetime(2025, 11, 20, 10, 0),
-            ),
-            Attachment(
-                attachment_id="attach_002",
-                email_id="email_001",
-                account_id="gmail_1",
-                original_filename="image.jpg",
-                file_size_bytes=1024 * 200,  # 200KB
-                mime_type="image/jpeg",
-                storage_status="downloaded",
-                stored_path="attachments/gmail_1/email_001/image.jpg",
-                downloaded_at=datetime(2025, 11, 20, 10, 5),
-            ),
-            Attachment(
-                attachment_id="attach_003",
-                email_id="email_002",
-                account_id="gmail_1",
-                original_filename="document.docx",
-                file_size_bytes=1024 * 1024 * 2,  # 2MB
-                mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                storage_status="pending",
-                stored_path=None,
-            ),
-            Attachment(
-                attachment_id="attach_004",
-                email_id="email_003",
-                account_id="gmail_2",
-                original_filename="large_file.zip",
-                file_size_bytes=1024 * 1024 * 30,  # 30MB
-                mime_type="application/zip",
-                storage_status="skipped_too_large",
-                stored_path=None,
-            ),
-        ]
-        for attachment in attachments:
-            db.add(attachment)
-        db.commit()
-    yield
-    with get_db() as db:
-        db.query(Attachment).delete()
-        db.commit()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def attach_001_payload(client, sample_attachments):
+    """Detail response of attach_001, fetched once per module"""
+    return (await client.get(f"{ATTACHMENTS_URL}/attach_001")).json()
 
 
 # ============================================================================
 # Test: List Attachments
 # ============================================================================
 
-def test_list_attachments_for_email(client, clean_database, sample_attachments):
+async def test_list_attachments_for_email(client, sample_attachments):
     """Test listing attachments for specific email"""
-    response = client.get("/api/v1/attachments?email_id=email_001")
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": "email_001"})
 
     assert response.status_code == 200
     data = response.json()
@@ -115,9 +146,9 @@ def test_list_attachments_for_email(client, clean_database, sample_attachments):
     assert "image.jpg" in filenames
 
 
-def test_list_attachments_for_account(client, clean_database, sample_attachments):
+async def test_list_attachments_for_account(client, sample_attachments):
     """Test listing attachments for specific account"""
-    response = client.get("/api/v1/attachments?email_id=email_001&account_id=gmail_1")
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": "email_001", "account_id": "gmail_1"})
 
     assert response.status_code == 200
     data = response.json()
@@ -127,9 +158,9 @@ def test_list_attachments_for_account(client, clean_database, sample_attachments
     assert all(item["account_id"] == "gmail_1" for item in data["items"])
 
 
-def test_list_attachments_pagination(client, clean_database, sample_attachments):
+async def test_list_attachments_pagination(client, sample_attachments):
     """Test pagination parameters"""
-    response = client.get("/api/v1/attachments?email_id=email_001&limit=1&offset=0")
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": "email_001", "limit": 1, "offset": 0})
 
     assert response.status_code == 200
     data = response.json()
@@ -138,9 +169,9 @@ def test_list_attachments_pagination(client, clean_database, sample_attachments)
     assert len(data["items"]) == 1
 
 
-def test_list_attachments_empty_result(client, clean_database, sample_attachments):
+async def test_list_attachments_empty_result(client, sample_attachments):
     """Test listing for nonexistent email"""
-    response = client.get("/api/v1/attachments?email_id=nonexistent_email")
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": "nonexistent_email"})
 
     assert response.status_code == 200
     data = response.json()
@@ -149,16 +180,13 @@ def test_list_attachments_empty_result(client, clean_database, sample_attachment
     assert len(data["items"]) == 0
 
 
-def test_list_attachments_limit_validation(client, clean_database):
-    """Test limit parameter validation (max 200)"""
-    response = client.get("/api/v1/attachments?email_id=email_001&limit=250")
-
-    assert response.status_code == 422
-
-
-def test_list_attachments_offset_validation(client, clean_database):
-    """Test offset parameter validation (min 0)"""
-    response = client.get("/api/v1/attachments?email_id=email_001&offset=-5")
+@pytest.mark.parametrize("params", [
+    {"email_id": "email_001", "limit": 250},  # max 200
+    {"email_id": "email_001", "offset": -5},  # min 0
+], ids=["limit", "offset"])
+async def test_list_attachments_pagination_validation(client, params):
+    """Test limit/offset parameter validation (rejected before any DB access)"""
+    response = await client.get(ATTACHMENTS_URL, params=params)
 
     assert response.status_code == 422
 
@@ -167,12 +195,9 @@ def test_list_attachments_offset_validation(client, clean_database):
 # Test: Get Attachment Detail
 # ============================================================================
 
-def test_get_attachment_success(client, clean_database, sample_attachments):
+async def test_get_attachment_success(attach_001_payload):
     """Test getting single attachment by ID"""
-    response = client.get("/api/v1/attachments/attach_001")
-
-    assert response.status_code == 200
-    data = response.json()
+    data = attach_001_payload
 
     assert data["attachment_id"] == "attach_001"
     assert data["original_filename"] == "report.pdf"
@@ -182,20 +207,17 @@ def test_get_attachment_success(client, clean_database, sample_attachments):
     assert data["file_hash"] == "abc123hash"
 
 
-def test_get_attachment_not_found(client, clean_database):
+async def test_get_attachment_not_found(client, db_session):
     """Test getting nonexistent attachment"""
-    response = client.get("/api/v1/attachments/nonexistent_attachment")
+    response = await client.get(f"{ATTACHMENTS_URL}/nonexistent_attachment")
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_get_attachment_includes_metadata(client, clean_database, sample_attachments):
+async def test_get_attachment_includes_metadata(attach_001_payload):
     """Test that attachment detail includes all metadata fields"""
-    response = client.get("/api/v1/attachments/attach_001")
-
-    assert response.status_code == 200
-    data = response.json()
+    data = attach_001_payload
 
     required_fields = [
         "id", "attachment_id", "email_id", "account_id",
@@ -207,9 +229,9 @@ def test_get_attachment_includes_metadata(client, clean_database, sample_attachm
         assert field in data, f"Missing field: {field}"
 
 
-def test_get_attachment_pending_status(client, clean_database, sample_attachments):
+async def test_get_attachment_pending_status(client, sample_attachments):
     """Test getting attachment with pending status"""
-    response = client.get("/api/v1/attachments/attach_003")
+    response = await client.get(f"{ATTACHMENTS_URL}/attach_003")
 
     assert response.status_code == 200
     data = response.json()
@@ -219,9 +241,9 @@ def test_get_attachment_pending_status(client, clean_database, sample_attachment
     assert data["downloaded_at"] is None
 
 
-def test_get_attachment_skipped_status(client, clean_database, sample_attachments):
+async def test_get_attachment_skipped_status(client, sample_attachments):
     """Test getting attachment that was skipped (too large)"""
-    response = client.get("/api/v1/attachments/attach_004")
+    response = await client.get(f"{ATTACHMENTS_URL}/attach_004")
 
     assert response.status_code == 200
     data = response.json()
@@ -234,53 +256,45 @@ def test_get_attachment_skipped_status(client, clean_database, sample_attachment
 # Test: Download Attachment
 # ============================================================================
 
-def test_download_attachment_success(client, clean_database, sample_attachments):
+async def test_download_attachment_success(client, db_session, sample_attachments, tmp_path):
     """Test downloading attachment file"""
-    # Create a temporary file to simulate stored attachment
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.pdf') as f:
-        f.write("PDF content here")
-        temp_path = Path(f.name)
-
-    try:
-        # Update attachment with temp file path
-        with get_db() as db:
-            attachment = db.query(Attachment).filter_by(attachment_id="attach_001").first()
-            attachment.stored_path = str(temp_path)
-            db.commit()
+    # Create a file to simulate stored attachment (tmp_path is cleaned up by pytest)
+    temp_path = tmp_path / "report.pdf"
+    temp_path.write_text("PDF content here")
 
-        # Attempt download (will fail since AttachmentService implementation is needed)
-        response = client.get("/api/v1/attachments/attach_001/download")
+    # Update attachment with temp file path
+    attachment = db_session.query(Attachment).filter_by(attachment_id="attach_001").first()
+    attachment.stored_path = str(temp_path)
+    db_session.commit()
 
-        # This test will fail because get_attachment_file_path() needs implementation
-        # For now, we'll just check that the endpoint exists and returns an error
-        assert response.status_code in [200, 404, 500]
+    # Attempt download (will fail since AttachmentService implementation is needed)
+    response = await client.get(f"{ATTACHMENTS_URL}/attach_001/download")
 
-    finally:
-        # Cleanup temp file
-        if temp_path.exists():
-            temp_path.unlink()
+    # This test will fail because get_attachment_file_path() needs implementation
+    # For now, we'll just check that the endpoint exists and returns an error
+    assert response.status_code in [200, 404, 500]
 
 
-def test_download_attachment_not_found(client, clean_database):
+async def test_download_attachment_not_found(client, db_session):
     """Test downloading nonexistent attachment"""
-    response = client.get("/api/v1/attachments/nonexistent_attachment/download")
+    response = await client.get(f"{ATTACHMENTS_URL}/nonexistent_attachment/download")
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_download_attachment_not_downloaded_yet(client, clean_database, sample_attachments):
+async def test_download_attachment_not_downloaded_yet(client, sample_attachments):
     """Test downloading attachment that hasn't been downloaded yet"""
-    response = client.get("/api/v1/attachments/attach_003/download")
+    response = await client.get(f"{ATTACHMENTS_URL}/attach_003/download")
 
     # Should fail because storage_status is 'pending', not 'downloaded'
     assert response.status_code == 400
     assert "not available for download" in response.json()["detail"].lower()
 
 
-def test_download_attachment_skipped(client, clean_database, sample_attachments):
+async def test_download_attachment_skipped(client, sample_attachments):
     """Test downloading attachment that was skipped"""
-    response = client.get("/api/v1/attachments/attach_004/download")
+    response = await client.get(f"{ATTACHMENTS_URL}/attach_004/download")
 
     # Should fail because storage_status is 'skipped_too_large'
     assert response.status_code == 400
@@ -291,10 +305,9 @@ def test_download_attachment_skipped(client, clean_database, sample_attachments)
 # Test: Response Models
 # ============================================================================
 
-def test_attachment_response_model_structure(client, clean_database, sample_attachments):
+async def test_attachment_response_model_structure(attach_001_payload):
     """Test that AttachmentMetadata model has correct structure"""
-    response = client.get("/api/v1/attachments/attach_001")
-    data = response.json()
+    data = attach_001_payload
 
     required_fields = [
         "id", "attachment_id", "email_id", "account_id",
@@ -306,9 +319,9 @@ def test_attachment_response_model_structure(client, clean_database, sample_atta
         assert field in data, f"Required field '{field}' missing from response"
 
 
-def test_attachment_list_response_structure(client, clean_database, sample_attachments):
+async def test_attachment_list_response_structure(client, sample_attachments):
     """Test that AttachmentListResponse has correct structure"""
-    response = client.get("/api/v1/attachments?email_id=email_001")
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": "email_001"})
     data = response.json()
 
     assert "items" in data
@@ -323,39 +336,39 @@ def test_attachment_list_response_structure(client, clean_database, sample_attac
 # Test: File Types and Sizes
 # ============================================================================
 
-def test_attachment_mime_types(client, clean_database, sample_attachments):
-    """Test that different MIME types are handled correctly"""
-    # Get PDF
-    pdf_response = client.get("/api/v1/attachments/attach_001")
-    assert pdf_response.json()["mime_type"] == "application/pdf"
+async def _attachments_by_id(client, email_id):
+    """List attachments of one email, keyed by attachment_id"""
+    response = await client.get(ATTACHMENTS_URL, params={"email_id": email_id})
+    return {item["attachment_id"]: item for item in response.json()["items"]}
+
 
-    # Get image
-    img_response = client.get("/api/v1/attachments/attach_002")
-    assert img_response.json()["mime_type"] == "image/jpeg"
+async def test_attachment_mime_types(client, sample_attachments):
+    """Test that different MIME types are handled correctly"""
+    # PDF + image (email_001), DOCX (email_002)
+    items = {**await _attachments_by_id(client, "email_001"), **await _attachments_by_id(client, "email_002")}
 
-    # Get DOCX
-    docx_response = client.get("/api/v1/attachments/attach_003")
-    assert docx_response.json()["mime_type"] == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    assert items["attach_001"]["mime_type"] == "application/pdf"
+    assert items["attach_002"]["mime_type"] == "image/jpeg"
+    assert items["attach_003"]["mime_type"] == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 
 
-def test_attachment_file_sizes(client, clean_database, sample_attachments):
+async def test_attachment_file_sizes(client, sample_attachments):
     """Test that file sizes are returned correctly"""
-    # Small file (500KB)
-    response = client.get("/api/v1/attachments/attach_001")
-    assert response.json()["file_size_bytes"] == 1024 * 500
+    # Small files (email_001), large file (email_003)
+    items = {**await _attachments_by_id(client, "email_001"), **await _attachments_by_id(client, "email_003")}
 
-    # Large file (30MB)
-    response = client.get("/api/v1/attachments/attach_004")
-    assert response.json()["file_size_bytes"] == 1024 * 1024 * 30
+    assert items["attach_001"]["file_size_bytes"] == 1024 * 500
+    assert items["attach_002"]["file_size_bytes"] == 1024 * 200
+    assert items["attach_004"]["file_size_bytes"] == 1024 * 1024 * 30
 
 
 # ============================================================================
 # Test: Error Handling
 # ============================================================================
 
-def test_invalid_attachment_id_format(client, clean_database):
+async def test_invalid_attachment_id_format(client, db_session):
     """Test handling of invalid attachment ID format"""
-    response = client.get("/api/v1/attachments/invalid-format-!@#")
+    response = await client.get(f"{ATTACHMENTS_URL}/invalid-format-!@#")
 
     assert response.status_code == 404
 
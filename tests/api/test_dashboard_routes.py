@@ -5,196 +5,181 @@ Tests dashboard statistics, overview data, and activity feed endpoints.
 
 import pytest
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
+from sqlalchemy import insert
 
-from agent_platform.api.main import app
-from agent_platform.db.models import Task, Decision, Question, ProcessedEmail
-from agent_platform.db.database import get_db
-from agent_platform.events import log_event, EventType
+from agent_platform.db.database import SessionLocal
+from agent_platform.db.models import Task, Decision, Question, ProcessedEmail, Event
+from agent_platform.events import EventType
 
 
-# ============================================================================
-# Test Client Setup
-# ============================================================================
-
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
+OVERVIEW_URL = "/api/v1/dashboard/overview"
+TODAY_URL = "/api/v1/dashboard/today"
+ACTIVITY_URL = "/api/v1/dashboard/activity"
 
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(Task).delete()
-        db.query(Decision).delete()
-        db.query(Question).delete()
-        db.query(ProcessedEmail).delete()
-        db.commit()
-    yield
-    with get_db() as db:
-        db.query(Task).delete()
-        db.query(Decision).delete()
-        db.query(Question).delete()
-        db.query(ProcessedEmail).delete()
-        db.commit()
+# Sample data timestamps, fixed once per test run so the shared dataset and
+# the "today" counters agree across tests
+TODAY = datetime.utcnow()
+YESTERDAY = TODAY - timedelta(days=1)
 
 
-@pytest.fixture
-def sample_dashboard_data():
-    """Create sample data for dashboard"""
-    today = datetime.utcnow()
-    yesterday = today - timedelta(days=1)
-
-    with get_db() as db:
-        # Tasks
-        tasks = [
-            Task(
-                task_id="task_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                description="Urgent: Complete report",
-                priority="high",
-                status="pending",
-                deadline=today + timedelta(days=1),
-                created_at=today,
-            ),
-            Task(
-                task_id="task_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                description="Review document",
-                status="in_progress",
-                created_at=today,
-            ),
-            Task(
-                task_id="task_003",
-                account_id="gmail_1",
-                email_id="email_003",
-                description="Completed task",
-                status="completed",
-                completed_at=today,
-                created_at=yesterday,
-            ),
-            Task(
-                task_id="task_004",
-                account_id="gmail_1",
-                email_id="email_004",
-                description="Overdue task",
-                status="pending",
-                deadline=yesterday,
-                created_at=yesterday,
-            ),
-        ]
-
-        # Decisions
-        decisions = [
-            Decision(
-                decision_id="decision_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                question="Approve budget?",
-                options=["Yes", "No"],
-                status="pending",
-                created_at=today,
-            ),
-            Decision(
-                decision_id="decision_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                question="Choose vendor?",
-                options=["A", "B"],
-                status="decided",
-                chosen_option="A",
-                decided_at=today,
-                created_at=today,
-            ),
-        ]
-
-        # Questions
-        questions = [
-            Question(
-                question_id="question_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                question="What is the deadline?",
-                status="pending",
-                created_at=today,
-            ),
-            Question(
-                question_id="question_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                question="How many participants?",
-                status="answered",
-                answer="10 people",
-                answered_at=today,
-                created_at=today,
-            ),
-        ]
-
-        # Processed emails
-        emails = [
-            ProcessedEmail(
-                email_id="email_001",
-                account_id="gmail_1",
-                subject="Important meeting",
-                sender="boss@company.com",
-                category="wichtig",
-                confidence=0.95,
-                processed_at=today,
-            ),
-            ProcessedEmail(
-                email_id="email_002",
-                account_id="gmail_1",
-                subject="Medium priority email",
-                sender="colleague@company.com",
-                category="wichtig",
-                confidence=0.75,
-                processed_at=today,
-            ),
-            ProcessedEmail(
-                email_id="email_003",
-                account_id="gmail_1",
-                subject="Newsletter",
-                sender="newsletter@example.com",
-                category="newsletter",
-                confidence=0.92,
-                processed_at=today,
-            ),
-            ProcessedEmail(
-                email_id="email_004",
-                account_id="gmail_1",
-                subject="Low confidence email",
-                sender="unknown@example.com",
-                category="unwichtig",
-                confidence=0.55,
-                processed_at=today,
-            ),
-        ]
+# ============================================================================
+# Fixtures
+# ============================================================================
 
-        for item in tasks + decisions + questions + emails:
-            db.add(item)
+@pytest.fixture(scope="module")
+def sample_dashboard_data(db_connection):
+    """Create sample data for dashboard once per module (read-only tests)"""
+    # Tasks
+    tasks = [
+        {
+            "task_id": "task_001",
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "description": "Urgent: Complete report",
+            "priority": "high",
+            "status": "pending",
+            "deadline": TODAY + timedelta(days=1),
+            "created_at": TODAY,
+        },
+        {
+            "task_id": "task_002",
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "description": "Review document",
+            "status": "in_progress",
+            "created_at": TODAY,
+        },
+        {
+            "task_id": "task_003",
+            "account_id": "gmail_1",
+            "email_id": "email_003",
+            "description": "Completed task",
+            "status": "completed",
+            "completed_at": TODAY,
+            "created_at": YESTERDAY,
+        },
+        {
+            "task_id": "task_004",
+            "account_id": "gmail_1",
+            "email_id": "email_004",
+            "description": "Overdue task",
+            "status": "pending",
+            "deadline": YESTERDAY,
+            "created_at": YESTERDAY,
+        },
+    ]
+
+    # Decisions
+    decisions = [
+        {
+            "decision_id": "decision_001",
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "question": "Approve budget?",
+            "options": ["Yes", "No"],
+            "status": "pending",
+            "created_at": TODAY,
+        },
+        {
+            "decision_id": "decision_002",
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "question": "Choose vendor?",
+            "options": ["A", "B"],
+            "status": "decided",
+            "chosen_option": "A",
+            "decided_at": TODAY,
+            "created_at": TODAY,
+        },
+    ]
+
+    # Questions
+    questions = [
+        {
+            "question_id": "question_001",
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "question": "What is the deadline?",
+            "status": "pending",
+            "created_at": TODAY,
+        },
+        {
+            "question_id": "question_002",
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "question": "How many participants?",
+            "status": "answered",
+            "answer": "10 people",
+            "answered_at": TODAY,
+            "created_at": TODAY,
+        },
+    ]
+
+    # Processed emails
+    emails = [
+        {
+            "email_id": "email_001",
+            "account_id": "gmail_1",
+            "subject": "Important meeting",
+            "sender": "boss@company.com",
+            "category": "wichtig",
+            "confidence": 0.95,
+            "processed_at": TODAY,
+        },
+        {
+            "email_id": "email_002",
+            "account_id": "gmail_1",
+            "subject": "Medium priority email",
+            "sender": "colleague@company.com",
+            "category": "wichtig",
+            "confidence": 0.75,
+            "processed_at": TODAY,
+        },
+        {
+            "email_id": "email_003",
+            "account_id": "gmail_1",
+            "subject": "Newsletter",
+            "sender": "newsletter@example.com",
+            "category": "newsletter",
+            "confidence": 0.92,
+            "processed_at": TODAY,
+        },
+        {
+            "email_id": "email_004",
+            "account_id": "gmail_1",
+            "subject": "Low confidence email",
+            "sender": "unknown@example.com",
+            "category": "unwichtig",
+            "confidence": 0.55,
+            "processed_at": TODAY,
+        },
+    ]
+
+    # One executemany INSERT per table, no ORM unit-of-work. The commit only
+    # releases a SAVEPOINT; the rows live until the module transaction ends.
+    with SessionLocal() as db:
+        db.execute(insert(Task), tasks)
+        db.execute(insert(Decision), decisions)
+        db.execute(insert(Question), questions)
+        db.execute(insert(ProcessedEmail), emails)
         db.commit()
 
     yield
 
-    with get_db() as db:
-        db.query(Task).delete()
-        db.query(Decision).delete()
-        db.query(Question).delete()
-        db.query(ProcessedEmail).delete()
-        db.commit()
+
+@pytest.fixture(scope="module")
+def dashboard_overview(client, sample_dashboard_data):
+    """Overview response for the sample data, fetched once per module"""
+    return client.get(OVERVIEW_URL).json()
 
 
 # ============================================================================
 # Test: Dashboard Overview
 # ============================================================================
 
-def test_get_dashboard_overview_success(client, clean_database, sample_dashboard_data):
+def test_get_dashboard_overview_success(client, sample_dashboard_data):
     """Test getting dashboard overview with all statistics"""
-    response = client.get("/api/v1/dashboard/overview")
+    response = client.get(OVERVIEW_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -208,10 +193,9 @@ def test_get_dashboard_overview_success(client, clean_database, sample_dashboard
     assert "needs_human_count" in data
 
 
-def test_dashboard_overview_tasks_stats(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_tasks_stats(dashboard_overview):
     """Test that tasks statistics are correct"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     tasks = data["tasks"]
     assert "pending" in tasks
@@ -226,10 +210,9 @@ def test_dashboard_overview_tasks_stats(client, clean_database, sample_dashboard
     assert tasks["overdue"] >= 1  # task_004
 
 
-def test_dashboard_overview_decisions_stats(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_decisions_stats(dashboard_overview):
     """Test that decisions statistics are correct"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     decisions = data["decisions"]
     assert "pending" in decisions
@@ -239,10 +222,9 @@ def test_dashboard_overview_decisions_stats(client, clean_database, sample_dashb
     assert decisions["decided_today"] >= 1  # decision_002
 
 
-def test_dashboard_overview_questions_stats(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_questions_stats(dashboard_overview):
     """Test that questions statistics are correct"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     questions = data["questions"]
     assert "pending" in questions
@@ -252,10 +234,9 @@ def test_dashboard_overview_questions_stats(client, clean_database, sample_dashb
     assert questions["answered_today"] >= 1  # question_002
 
 
-def test_dashboard_overview_emails_stats(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_emails_stats(dashboard_overview):
     """Test that emails statistics are correct"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     emails = data["emails"]
     assert "processed_today" in emails
@@ -268,10 +249,9 @@ def test_dashboard_overview_emails_stats(client, clean_database, sample_dashboar
     assert isinstance(emails["by_category"], dict)
 
 
-def test_dashboard_overview_emails_category_breakdown(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_emails_category_breakdown(dashboard_overview):
     """Test email category breakdown"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     by_category = data["emails"]["by_category"]
 
@@ -279,10 +259,9 @@ def test_dashboard_overview_emails_category_breakdown(client, clean_database, sa
     assert "wichtig" in by_category or "newsletter" in by_category
 
 
-def test_dashboard_overview_emails_confidence_breakdown(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_emails_confidence_breakdown(dashboard_overview):
     """Test email confidence breakdown"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     emails = data["emails"]
 
@@ -297,10 +276,9 @@ def test_dashboard_overview_emails_confidence_breakdown(client, clean_database,
     assert emails["low_confidence"] >= 1  # 0.55
 
 
-def test_dashboard_overview_needs_human_count(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_needs_human_count(dashboard_overview):
     """Test needs human count (medium + low confidence)"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     needs_human = data["needs_human_count"]
 
@@ -308,10 +286,9 @@ def test_dashboard_overview_needs_human_count(client, clean_database, sample_das
     assert needs_human >= 2
 
 
-def test_dashboard_overview_accounts_list(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_accounts_list(dashboard_overview):
     """Test accounts list in overview"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     accounts = data["accounts"]
     assert isinstance(accounts, list)
@@ -324,9 +301,9 @@ def test_dashboard_overview_accounts_list(client, clean_database, sample_dashboa
         assert "active" in account
 
 
-def test_dashboard_overview_empty_database(client, clean_database):
+def test_dashboard_overview_empty_database(client, empty_database):
     """Test dashboard overview with empty database"""
-    response = client.get("/api/v1/dashboard/overview")
+    response = client.get(OVERVIEW_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -342,9 +319,9 @@ def test_dashboard_overview_empty_database(client, clean_database):
 # Test: Today's Summary
 # ============================================================================
 
-def test_get_today_summary_success(client, clean_database, sample_dashboard_data):
+def test_get_today_summary_success(client, sample_dashboard_data):
     """Test getting today's summary"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -358,9 +335,9 @@ def test_get_today_summary_success(client, clean_database, sample_dashboard_data
     assert "top_senders" in data
 
 
-def test_today_summary_date_format(client, clean_database, sample_dashboard_data):
+def test_today_summary_date_format(client, sample_dashboard_data):
     """Test that date is in correct format"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     date_str = data["date"]
@@ -369,9 +346,9 @@ def test_today_summary_date_format(client, clean_database, sample_dashboard_data
     datetime.strptime(date_str, "%Y-%m-%d")  # Will raise if format wrong
 
 
-def test_today_summary_counters(client, clean_database, sample_dashboard_data):
+def test_today_summary_counters(client, sample_dashboard_data):
     """Test that summary counters are correct"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     # Based on sample data:
@@ -387,9 +364,9 @@ def test_today_summary_counters(client, clean_database, sample_dashboard_data):
     assert data["questions_answered"] >= 1  # question_002 answered today
 
 
-def test_today_summary_top_senders(client, clean_database, sample_dashboard_data):
+def test_today_summary_top_senders(client, sample_dashboard_data):
     """Test top senders list"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     top_senders = data["top_senders"]
@@ -403,9 +380,9 @@ def test_today_summary_top_senders(client, clean_database, sample_dashboard_data
         assert sender["count"] > 0
 
 
-def test_today_summary_top_senders_ordering(client, clean_database, sample_dashboard_data):
+def test_today_summary_top_senders_ordering(client, sample_dashboard_data):
     """Test that top senders are ordered by count (descending)"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     top_senders = data["top_senders"]
@@ -415,9 +392,9 @@ def test_today_summary_top_senders_ordering(client, clean_database, sample_dashb
         assert top_senders[0]["count"] >= top_senders[1]["count"]
 
 
-def test_today_summary_top_senders_limit(client, clean_database, sample_dashboard_data):
+def test_today_summary_top_senders_limit(client, sample_dashboard_data):
     """Test that top senders is limited to 5"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     top_senders = data["top_senders"]
@@ -426,9 +403,9 @@ def test_today_summary_top_senders_limit(client, clean_database, sample_dashboar
     assert len(top_senders) <= 5
 
 
-def test_today_summary_empty_database(client, clean_database):
+def test_today_summary_empty_database(client, empty_database):
     """Test today's summary with empty database"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -446,9 +423,9 @@ def test_today_summary_empty_database(client, clean_database):
 # Test: Activity Feed
 # ============================================================================
 
-def test_get_activity_feed_success(client, clean_database):
+def test_get_activity_feed_success(client, db_session):
     """Test getting activity feed"""
-    response = client.get("/api/v1/dashboard/activity")
+    response = client.get(ACTIVITY_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -459,9 +436,9 @@ def test_get_activity_feed_success(client, clean_database):
     assert "offset" in data
 
 
-def test_activity_feed_pagination(client, clean_database):
+def test_activity_feed_pagination(client, db_session):
     """Test activity feed pagination parameters"""
-    response = client.get("/api/v1/dashboard/activity?limit=5&offset=0")
+    response = client.get(ACTIVITY_URL, params={"limit": 5, "offset": 0})
 
     assert response.status_code == 200
     data = response.json()
@@ -471,17 +448,18 @@ def test_activity_feed_pagination(client, clean_database):
     assert len(data["items"]) <= 5
 
 
-def test_activity_feed_item_structure(client, clean_database):
+def test_activity_feed_item_structure(client, db_session):
     """Test activity feed item structure"""
-    # Log some events first
-    log_event(
-        event_type=EventType.EMAIL_CLASSIFIED,
+    # Store an event row directly (the feed only reads the events table)
+    db_session.add(Event(
+        event_type=EventType.EMAIL_CLASSIFIED.value,
         account_id="gmail_1",
         email_id="test_email",
-        payload={"category": "wichtig", "confidence": 0.95}
-    )
+        payload={"category": "wichtig", "confidence": 0.95},
+    ))
+    db_session.commit()
 
-    response = client.get("/api/v1/dashboard/activity")
+    response = client.get(ACTIVITY_URL)
     data = response.json()
 
     if len(data["items"]) > 0:
@@ -496,23 +474,20 @@ def test_activity_feed_item_structure(client, clean_database):
             assert field in item, f"Missing field: {field}"
 
 
-def test_activity_feed_limit_validation(client, clean_database):
-    """Test that limit parameter is validated (max 100)"""
-    response = client.get("/api/v1/dashboard/activity?limit=150")
+@pytest.mark.parametrize("params", [
+    {"limit": 150},  # max 100
+    {"offset": -5},  # min 0
+], ids=["limit", "offset"])
+def test_activity_feed_pagination_validation(client, params):
+    """Test that limit/offset parameters are validated"""
+    response = client.get(ACTIVITY_URL, params=params)
 
     assert response.status_code == 422  # Validation error
 
 
-def test_activity_feed_offset_validation(client, clean_database):
-    """Test that offset parameter is validated (min 0)"""
-    response = client.get("/api/v1/dashboard/activity?offset=-5")
-
-    assert response.status_code == 422
-
-
-def test_activity_feed_default_parameters(client, clean_database):
+def test_activity_feed_default_parameters(client, db_session):
     """Test activity feed with default parameters"""
-    response = client.get("/api/v1/dashboard/activity")
+    response = client.get(ACTIVITY_URL)
 
     assert response.status_code == 200
     data = response.json()
@@ -526,10 +501,9 @@ def test_activity_feed_default_parameters(client, clean_database):
 # Test: Response Models
 # ============================================================================
 
-def test_dashboard_overview_response_structure(client, clean_database, sample_dashboard_data):
+def test_dashboard_overview_response_structure(dashboard_overview):
     """Test that DashboardOverview response has complete structure"""
-    response = client.get("/api/v1/dashboard/overview")
-    data = response.json()
+    data = dashboard_overview
 
     # Check nested structures
     assert isinstance(data["tasks"], dict)
@@ -540,9 +514,9 @@ def test_dashboard_overview_response_structure(client, clean_database, sample_da
     assert isinstance(data["needs_human_count"], int)
 
 
-def test_today_summary_response_structure(client, clean_database, sample_dashboard_data):
+def test_today_summary_response_structure(client, sample_dashboard_data):
     """Test that TodaySummary response has complete structure"""
-    response = client.get("/api/v1/dashboard/today")
+    response = client.get(TODAY_URL)
     data = response.json()
 
     # All fields should be present
@@ -555,9 +529,9 @@ def test_today_summary_response_structure(client, clean_database, sample_dashboa
     assert isinstance(data["top_senders"], list)
 
 
-def test_activity_feed_response_structure(client, clean_database):
+def test_activity_feed_response_structure(client, db_session):
     """Test that ActivityFeedResponse has complete structure"""
-    response = client.get("/api/v1/dashboard/activity")
+    response = client.get(ACTIVITY_URL)
     data = response.json()
 
     assert isinstance(data["items"], list)
@@ -5,100 +5,83 @@ Tests CRUD operations for Decision memory-objects via FastAPI endpoints.
 
 import pytest
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
+from sqlalchemy import insert
 
-from agent_platform.api.main import app
+from agent_platform.db.database import SessionLocal, get_db
 from agent_platform.db.models import Decision
-from agent_platform.db.database import get_db
 
 
 # ============================================================================
-# Test Client Setup
+# Fixtures
 # ============================================================================
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(Decision).delete()
+@pytest.fixture(scope="module")
+def seeded_decisions(db_connection):
+    """Create sample decisions once per module"""
+    decisions = [
+        {
+            "decision_id": "decision_001",
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "question": "Should we approve the budget increase?",
+            "context": "Q4 budget review meeting",
+            "options": ["Approve", "Reject", "Request more info"],
+            "recommendation": "Approve",
+            "urgency": "high",
+            "status": "pending",
+            "requires_my_input": True,
+            "email_subject": "Budget Approval Needed",
+            "email_sender": "cfo@company.com",
+        },
+        {
+            "decision_id": "decision_002",
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "question": "Which vendor should we choose?",
+            "context": "IT infrastructure upgrade",
+            "options": ["Vendor A", "Vendor B", "Vendor C"],
+            "recommendation": "Vendor A",
+            "urgency": "medium",
+            "status": "pending",
+            "requires_my_input": True,
+            "email_subject": "Vendor Selection",
+            "email_sender": "it@company.com",
+        },
+        {
+            "decision_id": "decision_003",
+            "account_id": "gmail_2",
+            "email_id": "email_003",
+            "question": "Approve time off request?",
+            "context": "Employee vacation request",
+            "options": ["Approve", "Deny"],
+            "recommendation": "Approve",
+            "urgency": "low",
+            "status": "decided",
+            "requires_my_input": False,
+            "chosen_option": "Approve",
+            "decided_at": datetime.utcnow(),
+            "decision_notes": "Approved as requested",
+            "email_subject": "Time Off Request",
+            "email_sender": "hr@company.com",
+        },
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(Decision), decisions)
         db.commit()
     yield
-    with get_db() as db:
-        db.query(Decision).delete()
-        db.commit()
 
 
 @pytest.fixture
-def sample_decisions():
-    """Create sample decisions in database"""
-    with get_db() as db:
-        decisions = [
-            Decision(
-                decision_id="decision_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                question="Should we approve the budget increase?",
-                context="Q4 budget review meeting",
-                options=["Approve", "Reject", "Request more info"],
-                recommendation="Approve",
-                urgency="high",
-                status="pending",
-                requires_my_input=True,
-                email_subject="Budget Approval Needed",
-                email_sender="cfo@company.com",
-            ),
-            Decision(
-                decision_id="decision_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                question="Which vendor should we choose?",
-                context="IT infrastructure upgrade",
-                options=["Vendor A", "Vendor B", "Vendor C"],
-                recommendation="Vendor A",
-                urgency="medium",
-                status="pending",
-                requires_my_input=True,
-                email_subject="Vendor Selection",
-                email_sender="it@company.com",
-            ),
-            Decision(
-                decision_id="decision_003",
-                account_id="gmail_2",
-                email_id="email_003",
-                question="Approve time off request?",
-                context="Employee vacation request",
-                options=["Approve", "Deny"],
-                recommendation="Approve",
-                urgency="low",
-                status="decided",
-                requires_my_input=False,
-                chosen_option="Approve",
-                decided_at=datetime.utcnow(),
-                decision_notes="Approved as requested",
-                email_subject="Time Off Request",
-                email_sender="hr@company.com",
-            ),
-        ]
-        for decision in decisions:
-            db.add(decision)
-        db.commit()
+def sample_decisions(seeded_decisions, db_session):
+    """Sample decisions; changes made by the test are rolled back"""
     yield
-    with get_db() as db:
-        db.query(Decision).delete()
-        db.commit()
 
 
 # ============================================================================
 # Test: List Decisions
 # ============================================================================
 
-def test_list_decisions_default(client, clean_database, sample_decisions):
+def test_list_decisions_default(client, sample_decisions):
     """Test listing decisions with default parameters"""
     response = client.get("/api/v1/decisions")
 
@@ -106,108 +89,125 @@ def test_list_decisions_default(client, clean_database, sample_decisions):
     data = response.json()
 
     assert "items" in data
-    assert "total" in data
     assert "limit" in data
-    assert "offset" in data
+    assert "next_cursor" in data
 
-    assert data["total"] == 3
     assert len(data["items"]) == 3
     assert data["limit"] == 20
-    assert data["offset"] == 0
+    assert data["next_cursor"] is None
+    assert data["total"] is None  # only counted on request
 
 
-def test_list_decisions_pagination(client, clean_database, sample_decisions):
-    """Test pagination parameters"""
-    response = client.get("/api/v1/decisions?limit=2&offset=1")
+def test_list_decisions_pagination(client, sample_decisions):
+    """Test cursor pagination walks all decisions without overlap"""
+    response = client.get("/api/v1/decisions?limit=2")
 
     assert response.status_code == 200
-    data = response.json()
+    first_page = response.json()
 
-    assert data["total"] == 3
-    assert len(data["items"]) == 2
-    assert data["limit"] == 2
-    assert data["offset"] == 1
+    assert len(first_page["items"]) == 2
+    assert first_page["limit"] == 2
+    assert first_page["next_cursor"] is not None
 
-
-def test_list_decisions_filter_by_account(client, clean_database, sample_decisions):
-    """Test filtering by account_id"""
-    response = client.get("/api/v1/decisions?account_id=gmail_1")
+    response = client.get("/api/v1/decisions", params={"limit": 2, "cursor": first_page["next_cursor"]})
 
     assert response.status_code == 200
-    data = response.json()
+    second_page = response.json()
 
-    assert data["total"] == 2
-    assert len(data["items"]) == 2
-    assert all(d["email_sender"] in ["cfo@company.com", "it@company.com"] for d in data["items"])
+    assert len(second_page["items"]) == 1
+    assert second_page["next_cursor"] is None
 
+    decision_ids = [d["decision_id"] for d in first_page["items"] + second_page["items"]]
+    assert sorted(decision_ids) == ["decision_001", "decision_002", "decision_003"]
 
-def test_list_decisions_filter_by_status(client, clean_database, sample_decisions):
-    """Test filtering by status"""
-    response = client.get("/api/v1/decisions?status=pending")
 
-    assert response.status_code == 200
-    data = response.json()
+def test_list_decisions_pagination_null_created_at(client, sample_decisions, db_session):
+    """Test decisions without created_at come last and page across the boundary"""
+    # Core insert on the table: the ORM bulk insert would apply the column default
+    db_session.execute(insert(Decision.__table__), [
+        {"decision_id": f"decision_null_{n}", "account_id": "gmail_1", "email_id": "email_null",
+         "question": "Legacy decision?", "urgency": "low", "status": "pending",
+         "created_at": None}
+        for n in (1, 2)
+    ])
+    db_session.commit()
 
-    assert data["total"] == 2
-    assert len(data["items"]) == 2
-    assert all(d["status"] == "pending" for d in data["items"])
+    # Page 1 ends on the first NULL-timestamp row, page 2 holds the second
+    first_page = client.get("/api/v1/decisions", params={"limit": 4}).json()
+    assert first_page["items"][-1]["decision_id"] == "decision_null_2"
+    assert first_page["next_cursor"] is not None
 
+    response = client.get("/api/v1/decisions", params={"limit": 4, "cursor": first_page["next_cursor"]})
+
+    assert response.status_code == 200
+    second_page = response.json()
+    assert [d["decision_id"] for d in second_page["items"]] == ["decision_null_1"]
+    assert second_page["next_cursor"] is None
 
-def test_list_decisions_filter_by_urgency(client, clean_database, sample_decisions):
-    """Test filtering by urgency"""
-    response = client.get("/api/v1/decisions?urgency=high")
+
+def test_list_decisions_include_total(client, sample_decisions):
+    """Test include_total counts all matching decisions, not just the page"""
+    response = client.get("/api/v1/decisions", params={"status": "pending", "limit": 1, "include_total": True})
 
     assert response.status_code == 200
     data = response.json()
 
-    assert data["total"] == 1
     assert len(data["items"]) == 1
-    assert data["items"][0]["urgency"] == "high"
-    assert data["items"][0]["question"] == "Should we approve the budget increase?"
-
-
-def test_list_decisions_multiple_filters(client, clean_database, sample_decisions):
-    """Test combining multiple filters"""
-    response = client.get("/api/v1/decisions?account_id=gmail_1&status=pending&urgency=high")
+    assert data["total"] == 2
+    assert data["next_cursor"] is not None
+
+
+@pytest.mark.parametrize("params, expected_count, check", [
+    ({"account_id": "gmail_1"}, 2,
+     lambda d: d["email_sender"] in ["cfo@company.com", "it@company.com"]),
+    ({"status": "pending"}, 2,
+     lambda d: d["status"] == "pending"),
+    ({"urgency": "high"}, 1,
+     lambda d: d["urgency"] == "high" and d["question"] == "Should we approve the budget increase?"),
+    ({"account_id": "gmail_1", "status": "pending", "urgency": "high"}, 1,
+     lambda d: d["decision_id"] == "decision_001"),
+], ids=["account", "status", "urgency", "multiple"])
+def test_list_decisions_filters(client, sample_decisions, params, expected_count, check):
+    """Test filtering by account_id, status, urgency and their combination"""
+    response = client.get("/api/v1/decisions", params=params)
 
     assert response.status_code == 200
     data = response.json()
 
-    assert data["total"] == 1
-    assert len(data["items"]) == 1
-    assert data["items"][0]["decision_id"] == "decision_001"
+    assert len(data["items"]) == expected_count
+    assert all(check(d) for d in data["items"])
 
 
-def test_list_decisions_empty_result(client, clean_database, sample_decisions):
+def test_list_decisions_empty_result(client, sample_decisions):
     """Test query that returns no results"""
     response = client.get("/api/v1/decisions?account_id=nonexistent_account")
 
     assert response.status_code == 200
     data = response.json()
 
-    assert data["total"] == 0
     assert len(data["items"]) == 0
 
 
-def test_list_decisions_limit_validation(client, clean_database):
+def test_list_decisions_limit_validation(client, db_session):
     """Test limit parameter validation (max 100)"""
     response = client.get("/api/v1/decisions?limit=150")
 
     assert response.status_code == 422
 
 
-def test_list_decisions_offset_validation(client, clean_database):
-    """Test offset parameter validation (min 0)"""
-    response = client.get("/api/v1/decisions?offset=-5")
+def test_list_decisions_invalid_cursor(client, db_session):
+    """Test malformed cursor is rejected"""
+    response = client.get("/api/v1/decisions?cursor=not-a-cursor")
 
-    assert response.status_code == 422
+    assert response.status_code == 400
+    assert "cursor" in response.json()["detail"].lower()
 
 
 # ============================================================================
 # Test: Get Decision Detail
 # ============================================================================
 
-def test_get_decision_detail_success(client, clean_database, sample_decisions):
+def test_get_decision_detail_success(client, sample_decisions):
     """Test getting single decision by ID"""
     response = client.get("/api/v1/decisions/decision_001")
 
@@ -223,7 +223,7 @@ def test_get_decision_detail_success(client, clean_database, sample_decisions):
     assert len(data["options"]) == 3
 
 
-def test_get_decision_detail_not_found(client, clean_database):
+def test_get_decision_detail_not_found(client, db_session):
     """Test getting nonexistent decision"""
     response = client.get("/api/v1/decisions/nonexistent_decision")
 
@@ -231,7 +231,7 @@ def test_get_decision_detail_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_get_decision_detail_includes_metadata(client, clean_database, sample_decisions):
+def test_get_decision_detail_includes_metadata(client, sample_decisions):
     """Test that decision detail includes all metadata fields"""
     response = client.get("/api/v1/decisions/decision_001")
 
@@ -255,7 +255,7 @@ def test_get_decision_detail_includes_metadata(client, clean_database, sample_de
     assert "email_sender" in data
 
 
-def test_get_decision_options_list(client, clean_database, sample_decisions):
+def test_get_decision_options_list(client, sample_decisions):
     """Test that options are returned as list"""
     response = client.get("/api/v1/decisions/decision_001")
 
@@ -272,7 +272,7 @@ def test_get_decision_options_list(client, clean_database, sample_decisions):
 # Test: Make Decision
 # ============================================================================
 
-def test_make_decision_success(client, clean_database, sample_decisions):
+def test_make_decision_success(client, sample_decisions):
     """Test making a decision"""
     response = client.post(
         "/api/v1/decisions/decision_001/decide",
@@ -291,7 +291,7 @@ def test_make_decision_success(client, clean_database, sample_decisions):
     assert data["chosen_option"] == "Approve"
 
 
-def test_make_decision_without_notes(client, clean_database, sample_decisions):
+def test_make_decision_without_notes(client, sample_decisions):
     """Test making decision without optional notes"""
     response = client.post(
         "/api/v1/decisions/decision_002/decide",
@@ -305,7 +305,7 @@ def test_make_decision_without_notes(client, clean_database, sample_decisions):
     assert data["chosen_option"] == "Vendor A"
 
 
-def test_make_decision_not_found(client, clean_database):
+def test_make_decision_not_found(client, db_session):
     """Test making decision for nonexistent decision"""
     response = client.post(
         "/api/v1/decisions/nonexistent_decision/decide",
@@ -316,7 +316,7 @@ def test_make_decision_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_make_decision_updates_status(client, clean_database, sample_decisions):
+def test_make_decision_updates_status(client, sample_decisions):
     """Test that making decision updates status to 'decided'"""
     # Make decision
     client.post(
@@ -333,7 +333,7 @@ def test_make_decision_updates_status(client, clean_database, sample_decisions):
     assert data["decided_at"] is not None
 
 
-def test_make_decision_already_decided(client, clean_database, sample_decisions):
+def test_make_decision_already_decided(client, sample_decisions):
     """Test making decision on already decided decision (idempotent)"""
     # decision_003 is already decided
     response = client.post(
@@ -349,7 +349,7 @@ def test_make_decision_already_decided(client, clean_database, sample_decisions)
 # Test: Response Models
 # ============================================================================
 
-def test_decision_response_model_structure(client, clean_database, sample_decisions):
+def test_decision_response_model_structure(client, sample_decisions):
     """Test that DecisionResponse model has correct structure"""
     response = client.get("/api/v1/decisions/decision_001")
     data = response.json()
@@ -363,34 +363,31 @@ def test_decision_response_model_structure(client, clean_database, sample_decisi
         assert field in data, f"Required field '{field}' missing from response"
 
 
-def test_decisions_list_response_structure(client, clean_database, sample_decisions):
+def test_decisions_list_response_structure(client, sample_decisions):
     """Test that DecisionsListResponse has correct structure"""
     response = client.get("/api/v1/decisions")
     data = response.json()
 
     assert "items" in data
-    assert "total" in data
     assert "limit" in data
-    assert "offset" in data
+    assert "next_cursor" in data
 
     assert isinstance(data["items"], list)
-    assert isinstance(data["total"], int)
     assert isinstance(data["limit"], int)
-    assert isinstance(data["offset"], int)
 
 
 # ============================================================================
 # Test: Error Handling
 # ============================================================================
 
-def test_invalid_decision_id_format(client, clean_database):
+def test_invalid_decision_id_format(client, db_session):
     """Test handling of invalid decision ID format"""
     response = client.get("/api/v1/decisions/invalid-format-!@#")
 
     assert response.status_code == 404
 
 
-def test_make_decision_missing_option(client, clean_database, sample_decisions):
+def test_make_decision_missing_option(client, sample_decisions):
     """Test making decision without required chosen_option"""
     response = client.post(
         "/api/v1/decisions/decision_001/decide",
@@ -400,7 +397,7 @@ def test_make_decision_missing_option(client, clean_database, sample_decisions):
     assert response.status_code == 422  # Validation error
 
 
-def test_make_decision_invalid_json(client, clean_database, sample_decisions):
+def test_make_decision_invalid_json(client, sample_decisions):
     """Test making decision with invalid JSON"""
     response = client.post(
         "/api/v1/decisions/decision_001/decide",
@@ -415,8 +412,16 @@ def test_make_decision_invalid_json(client, clean_database, sample_decisions):
 # Test: Database Integration
 # ============================================================================
 
-def test_decision_persists_across_requests(client, clean_database, sample_decisions):
-    """Test that decision persists across multiple requests"""
+def _stored_decision(decision_id):
+    """Load a decision straight from the database (no HTTP round trip)"""
+    with get_db() as db:
+        decision = db.query(Decision).filter_by(decision_id=decision_id).one()
+        db.expunge(decision)
+    return decision
+
+
+def test_decision_persists_across_requests(client, sample_decisions):
+    """Test that decision persists beyond the request that made it"""
     # Make decision
     make_response = client.post(
         "/api/v1/decisions/decision_001/decide",
@@ -425,17 +430,15 @@ def test_decision_persists_across_requests(client, clean_database, sample_decisi
     assert make_response.status_code == 200
 
     # Verify persistence
-    get_response = client.get("/api/v1/decisions/decision_001")
-    assert get_response.status_code == 200
-    assert get_response.json()["chosen_option"] == "Approve"
-    assert get_response.json()["status"] == "decided"
+    decision = _stored_decision("decision_001")
+    assert decision.chosen_option == "Approve"
+    assert decision.status == "decided"
 
 
-def test_decided_at_timestamp_set(client, clean_database, sample_decisions):
+def test_decided_at_timestamp_set(client, sample_decisions):
     """Test that making decision sets decided_at timestamp"""
     # Decision initially has no decided_at
-    initial_response = client.get("/api/v1/decisions/decision_001")
-    assert initial_response.json()["decided_at"] is None
+    assert _stored_decision("decision_001").decided_at is None
 
     # Make decision
     client.post(
@@ -444,16 +447,16 @@ def test_decided_at_timestamp_set(client, clean_database, sample_decisions):
     )
 
     # Verify decided_at is set
-    final_response = client.get("/api/v1/decisions/decision_001")
-    assert final_response.json()["decided_at"] is not None
-    assert final_response.json()["status"] == "decided"
+    decision = _stored_decision("decision_001")
+    assert decision.decided_at is not None
+    assert decision.status == "decided"
 
 
 # ============================================================================
 # Test: Business Logic
 # ============================================================================
 
-def test_pending_decisions_excludes_decided(client, clean_database, sample_decisions):
+def test_pending_decisions_excludes_decided(client, sample_decisions):
     """Test that filtering by status=pending excludes decided decisions"""
     response = client.get("/api/v1/decisions?status=pending")
 
@@ -461,14 +464,14 @@ def test_pending_decisions_excludes_decided(client, clean_database, sample_decis
     data = response.json()
 
     # Should only return decision_001 and decision_002
-    assert data["total"] == 2
+    assert len(data["items"]) == 2
     decision_ids = [d["decision_id"] for d in data["items"]]
     assert "decision_001" in decision_ids
     assert "decision_002" in decision_ids
     assert "decision_003" not in decision_ids  # Decided, should be excluded
 
 
-def test_high_urgency_decisions_first(client, clean_database, sample_decisions):
+def test_high_urgency_decisions_first(client, sample_decisions):
     """Test that decisions are ordered by created_at desc"""
     response = client.get("/api/v1/decisions")
 
@@ -491,7 +494,7 @@ Endpoints Tested:
 - POST /api/v1/decisions/{decision_id}/decide (make decision)
 
 Test Categories:
-- List operations (9 tests)
+- List operations (11 tests)
 - Detail retrieval (4 tests)
 - Make decision operations (5 tests)
 - Response models (2 tests)
@@ -499,7 +502,7 @@ Test Categories:
 - Database integration (2 tests)
 - Business logic (2 tests)
 
-Total Tests: 27 tests
+Total Tests: 29 tests
 
 Coverage: Comprehensive coverage of all CRUD operations for Decisions API
 """
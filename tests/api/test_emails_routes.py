@@ -0,0 +1,101 @@
+"""
+Tests for Email API Routes
+Tests email listing, detail retrieval and field projection.
+"""
+
+import pytest
+from datetime import datetime
+
+from agent_platform.db.models import ProcessedEmail
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def sample_emails(db_session):
+    """Create sample emails (rolled back after the test)"""
+    emails = [
+        ProcessedEmail(
+            email_id="inbox_email_001",
+            account_id="gmail_1",
+            subject="Q4 Report Review Required",
+            sender="boss@company.com",
+            category="wichtig",
+            confidence=0.92,
+            body_text="Please review the Q4 report.",
+            received_at=datetime(2025, 11, 21, 10, 30),
+        ),
+        ProcessedEmail(
+            email_id="inbox_email_002",
+            account_id="gmail_2",
+            subject="Weekly Newsletter",
+            sender="news@example.com",
+            category="newsletter",
+            confidence=0.85,
+            received_at=datetime(2025, 11, 20, 9, 0),
+        ),
+    ]
+    db_session.add_all(emails)
+    db_session.commit()
+    yield
+
+
+# ============================================================================
+# Test: List Emails
+# ============================================================================
+
+def test_list_emails_full_items(client, sample_emails):
+    """Test listing emails returns full list items by default"""
+    response = client.get("/api/v1/emails?limit=5")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["emails"][0]["email_id"] == "inbox_email_001"
+    assert "processed_at" in data["emails"][0]
+
+
+def test_list_emails_fields_projection(client, sample_emails):
+    """Test fields parameter limits email items to requested keys"""
+    response = client.get("/api/v1/emails?limit=5&fields=subject,sender")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["limit"] == 5
+    for email in data["emails"]:
+        assert set(email.keys()) == {"subject", "sender"}
+
+
+def test_list_emails_unknown_field(client, sample_emails):
+    """Test unknown projection field returns 400"""
+    response = client.get("/api/v1/emails?fields=subject,not_a_field")
+
+    assert response.status_code == 400
+    assert "not_a_field" in response.json()["detail"]
+
+
+# ============================================================================
+# Test: Get Email Detail
+# ============================================================================
+
+def test_get_email_fields_projection(client, sample_emails):
+    """Test fields parameter on email detail endpoint"""
+    response = client.get("/api/v1/emails/inbox_email_001?fields=subject,body_text,tasks")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data == {
+        "subject": "Q4 Report Review Required",
+        "body_text": "Please review the Q4 report.",
+        "tasks": [],
+    }
+
+
+def test_get_email_not_found(client, sample_emails):
+    """Test 404 for unknown email"""
+    response = client.get("/api/v1/emails/nonexistent_email")
+
+    assert response.status_code == 404
@@ -4,138 +4,167 @@ Tests scan lifecycle, progress tracking, and statistics endpoints.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
+from typing import Dict, List, Optional
+from httpx import ASGITransport, AsyncClient
 
-from agent_platform.api.main import app
-from agent_platform.history_scan.models import ScanConfig, ScanStatus
+from agent_platform.api.routes import history_scan as history_scan_routes
+from agent_platform.history_scan.models import ScanConfig, ScanProgress, ScanStatus
 
 
-# ============================================================================
-# Test Client Setup
-# ============================================================================
-
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def sample_scan_config():
-    """Sample scan configuration"""
-    return {
-        "account_id": "gmail_1",
-        "batch_size": 50,
-        "max_results": 1000,
-        "query": "after:2024/01/01",
-        "skip_already_processed": True,
-        "process_attachments": True,
-        "process_threads": True,
-    }
+SCAN_URL = "/api/v1/history-scan"
+START_URL = f"{SCAN_URL}/start"
 
+# All history-scan routes are async; run the module's tests and the shared
+# client on one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-# ============================================================================
-# Test: Start Scan
-# ============================================================================
+# Keys a ScanProgress response must contain
+SCAN_COUNTER_FIELDS = frozenset({
+    "total_found", "processed", "skipped", "failed",
+    "classified_high", "classified_medium", "classified_low",
+    "tasks_extracted", "decisions_extracted", "questions_extracted",
+    "attachments_downloaded", "threads_summarized",
+})
+SCAN_PROGRESS_FIELDS = frozenset({
+    "scan_id", "account_id", "status",
+    "total_found", "processed", "skipped", "failed",
+    "started_at", "last_updated_at",
+})
 
-def test_start_scan_success(client, sample_scan_config):
-    """Test starting a new history scan"""
-    response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
-
-    assert response.status_code == 200
-    data = response.json()
 
-    assert "scan_id" in data
-    assert data["account_id"] == "gmail_1"
-    assert data["status"] == "in_progress"
-    assert data["total_found"] == 0
-    assert data["processed"] == 0
-    assert "started_at" in data
+SAMPLE_SCAN_CONFIG = {
+    "account_id": "gmail_1",
+    "batch_size": 50,
+    "max_results": 1000,
+    "query": "after:2024/01/01",
+    "skip_already_processed": True,
+    "process_attachments": True,
+    "process_threads": True,
+}
 
 
-def test_start_scan_minimal_config(client):
-    """Test starting scan with minimal required fields"""
-    config = {
-        "account_id": "gmail_2",
-    }
+def _scan_url(scan_id, action=""):
+    """URL of one scan, or of an action on it (pause/resume/cancel/stats)"""
+    return f"{SCAN_URL}/{scan_id}/{action}".rstrip("/")
 
-    response = client.post("/api/v1/history-scan/start", json=config)
 
-    assert response.status_code == 200
-    data = response.json()
+# ============================================================================
+# Test Client Setup
+# ============================================================================
 
-    assert data["account_id"] == "gmail_2"
-    assert data["status"] == "in_progress"
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """
+    Async client calling the ASGI app in-process (built once per module).
 
+    No portal thread per request; the app lifespan (init_db) is skipped as
+    the faked scan service never touches the database.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
-def test_start_scan_custom_batch_size(client):
-    """Test starting scan with custom batch size"""
-    config = {
-        "account_id": "gmail_1",
-        "batch_size": 100,
-    }
 
-    response = client.post("/api/v1/history-scan/start", json=config)
+class FakeScanService:
+    """
+    In-memory stand-in for HistoryScanService.
 
-    assert response.status_code == 200
-    data = response.json()
+    Mirrors the status transitions the routes rely on without building a
+    ClassificationOrchestrator or logging events to platform.db. The real
+    service is covered in tests/history_scan/test_history_scan_service.py.
+    """
 
-    assert data["status"] == "in_progress"
+    def __init__(self):
+        self._active_scans: Dict[str, ScanProgress] = {}
 
+    def get_scan_progress(self, scan_id: str) -> Optional[ScanProgress]:
+        return self._active_scans.get(scan_id)
 
-def test_start_scan_with_query_filter(client):
-    """Test starting scan with Gmail query filter"""
-    config = {
-        "account_id": "gmail_1",
-        "query": "from:boss@company.com after:2024/01/01",
-        "max_results": 500,
-    }
+    def list_active_scans(self) -> List[ScanProgress]:
+        return list(self._active_scans.values())
 
-    response = client.post("/api/v1/history-scan/start", json=config)
+    async def pause_scan(self, scan_id: str) -> bool:
+        progress = self._active_scans.get(scan_id)
+        if not progress or progress.status != ScanStatus.IN_PROGRESS:
+            return False
+        progress.status = ScanStatus.PAUSED
+        return True
 
-    assert response.status_code == 200
-    data = response.json()
+    async def cancel_scan(self, scan_id: str) -> bool:
+        progress = self._active_scans.get(scan_id)
+        if not progress:
+            return False
+        progress.status = ScanStatus.FAILED
+        progress.error_message = "Scan cancelled by user"
+        return True
 
-    assert data["status"] == "in_progress"
 
+@pytest.fixture(scope="module", autouse=True)
+def scan_service(app):
+    """Serve the history-scan routes from a FakeScanService for this module"""
+    service = FakeScanService()
+    app.dependency_overrides[history_scan_routes.get_scan_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(history_scan_routes.get_scan_service, None)
 
-def test_start_scan_invalid_batch_size(client):
-    """Test starting scan with invalid batch size (too large)"""
-    config = {
-        "account_id": "gmail_1",
-        "batch_size": 1000,  # Max is 500
-    }
 
-    response = client.post("/api/v1/history-scan/start", json=config)
+@pytest.fixture(autouse=True)
+def clean_scans(scan_service):
+    """Start every test without active scans (the fake outlives the client)"""
+    scan_service._active_scans.clear()
+    yield
+    scan_service._active_scans.clear()
 
-    assert response.status_code == 422  # Validation error
 
+@pytest.fixture
+def sample_scan_config():
+    """Sample scan configuration"""
+    return dict(SAMPLE_SCAN_CONFIG)
 
-def test_start_scan_missing_account_id(client):
-    """Test starting scan without required account_id"""
-    config = {
-        "batch_size": 50,
-    }
 
-    response = client.post("/api/v1/history-scan/start", json=config)
+# ============================================================================
+# Test: Start Scan
+# ============================================================================
 
-    assert response.status_code == 422
+@pytest.mark.parametrize("config, expected_status, expected", [
+    (SAMPLE_SCAN_CONFIG, 200,
+     {"account_id": "gmail_1", "status": "in_progress", "total_found": 0, "processed": 0}),
+    ({"account_id": "gmail_2"}, 200,
+     {"account_id": "gmail_2", "status": "in_progress"}),
+    ({"account_id": "gmail_1", "batch_size": 100}, 200,
+     {"status": "in_progress"}),
+    ({"account_id": "gmail_1", "query": "from:boss@company.com after:2024/01/01", "max_results": 500}, 200,
+     {"status": "in_progress"}),
+    ({"account_id": "gmail_1", "batch_size": 1000}, 422, None),  # Max batch_size is 500
+    ({"batch_size": 50}, 422, None),  # account_id is required
+], ids=["full_config", "minimal_config", "custom_batch_size", "query_filter",
+        "invalid_batch_size", "missing_account_id"])
+async def test_start_scan(client, config, expected_status, expected):
+    """Test starting a history scan with valid and invalid configurations"""
+    response = await client.post(START_URL, json=config)
+
+    assert response.status_code == expected_status
+    if expected is not None:
+        data = response.json()
+        assert "scan_id" in data
+        assert "started_at" in data
+        assert {key: data[key] for key in expected} == expected
 
 
 # ============================================================================
 # Test: Get Scan Progress
 # ============================================================================
 
-def test_get_scan_progress_success(client, sample_scan_config):
+async def test_get_scan_progress_success(client, sample_scan_config):
     """Test getting progress of an active scan"""
     # Start a scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     assert start_response.status_code == 200
     scan_id = start_response.json()["scan_id"]
 
     # Get progress
-    response = client.get(f"/api/v1/history-scan/{scan_id}")
+    response = await client.get(_scan_url(scan_id))
 
     assert response.status_code == 200
     data = response.json()
@@ -147,98 +176,90 @@ def test_get_scan_progress_success(client, sample_scan_config):
     assert "processed" in data
 
 
-def test_get_scan_progress_not_found(client):
+async def test_get_scan_progress_not_found(client):
     """Test getting progress for nonexistent scan"""
-    response = client.get("/api/v1/history-scan/nonexistent_scan_id")
+    response = await client.get(_scan_url("nonexistent_scan_id"))
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_get_scan_progress_includes_counters(client, sample_scan_config):
+async def test_get_scan_progress_includes_counters(client, sample_scan_config):
     """Test that progress includes all counter fields"""
     # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     scan_id = start_response.json()["scan_id"]
 
     # Get progress
-    response = client.get(f"/api/v1/history-scan/{scan_id}")
+    response = await client.get(_scan_url(scan_id))
 
     assert response.status_code == 200
     data = response.json()
 
-    # Check counter fields
-    counter_fields = [
-        "total_found", "processed", "skipped", "failed",
-        "classified_high", "classified_medium", "classified_low",
-        "tasks_extracted", "decisions_extracted", "questions_extracted",
-        "attachments_downloaded", "threads_summarized"
-    ]
-
-    for field in counter_fields:
-        assert field in data, f"Missing counter field: {field}"
+    missing = SCAN_COUNTER_FIELDS - data.keys()
+    assert not missing, f"Missing counter fields: {sorted(missing)}"
 
 
 # ============================================================================
 # Test: List Active Scans
 # ============================================================================
 
-def test_list_active_scans_empty(client):
+async def test_list_active_scans_empty(client):
     """Test listing scans when none are active"""
-    # Note: Service is stateful, may have scans from previous tests
-    response = client.get("/api/v1/history-scan/")
+    response = await client.get(f"{SCAN_URL}/")
 
     assert response.status_code == 200
     data = response.json()
 
-    assert isinstance(data, list)
+    assert data == []
 
 
-def test_list_active_scans_multiple(client, sample_scan_config):
+async def test_list_active_scans_multiple(client, sample_scan_config):
     """Test listing multiple active scans"""
     # Start 2 scans
     config1 = {**sample_scan_config, "account_id": "gmail_1"}
     config2 = {**sample_scan_config, "account_id": "gmail_2"}
 
-    response1 = client.post("/api/v1/history-scan/start", json=config1)
-    response2 = client.post("/api/v1/history-scan/start", json=config2)
+    response1 = await client.post(START_URL, json=config1)
+    response2 = await client.post(START_URL, json=config2)
 
     assert response1.status_code == 200
     assert response2.status_code == 200
 
     # List all scans
-    response = client.get("/api/v1/history-scan/")
+    response = await client.get(f"{SCAN_URL}/")
 
     assert response.status_code == 200
     data = response.json()
 
     assert isinstance(data, list)
-    assert len(data) >= 2  # At least our 2 scans
+    assert len(data) == 2
 
 
 # ============================================================================
-# Test: Pause Scan
+# Test: Scan Lifecycle
 # ============================================================================
 
-def test_pause_scan_success(client, sample_scan_config):
-    """Test pausing an active scan"""
+async def test_scan_lifecycle(client, sample_scan_config):
+    """Test pausing, resuming and cancelling one scan"""
     # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     scan_id = start_response.json()["scan_id"]
 
-    # Pause scan
-    response = client.post(f"/api/v1/history-scan/{scan_id}/pause")
+    for action, expected_status in [("pause", "paused"), ("resume", "resumed"), ("cancel", "cancelled")]:
+        response = await client.post(_scan_url(scan_id, action))
 
-    assert response.status_code == 200
-    data = response.json()
+        assert response.status_code == 200, action
+        assert response.json() == {"status": expected_status, "scan_id": scan_id}
 
-    assert data["status"] == "paused"
-    assert data["scan_id"] == scan_id
 
+# ============================================================================
+# Test: Pause Scan
+# ============================================================================
 
-def test_pause_scan_not_found(client):
+async def test_pause_scan_not_found(client):
     """Test pausing nonexistent scan"""
-    response = client.post("/api/v1/history-scan/nonexistent_scan/pause")
+    response = await client.post(_scan_url("nonexistent_scan", "pause"))
 
     assert response.status_code == 400
     assert "cannot pause" in response.json()["detail"].lower()
@@ -248,33 +269,14 @@ def test_pause_scan_not_found(client):
 # Test: Resume Scan
 # ============================================================================
 
-def test_resume_scan_success(client, sample_scan_config):
-    """Test resuming a paused scan"""
-    # Start and pause scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
-    scan_id = start_response.json()["scan_id"]
-
-    pause_response = client.post(f"/api/v1/history-scan/{scan_id}/pause")
-    assert pause_response.status_code == 200
-
-    # Resume scan
-    response = client.post(f"/api/v1/history-scan/{scan_id}/resume")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["status"] == "resumed"
-    assert data["scan_id"] == scan_id
-
-
-def test_resume_scan_not_paused(client, sample_scan_config):
+async def test_resume_scan_not_paused(client, sample_scan_config):
     """Test resuming scan that is not paused"""
     # Start scan (still in progress)
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     scan_id = start_response.json()["scan_id"]
 
     # Try to resume (should fail because not paused)
-    response = client.post(f"/api/v1/history-scan/{scan_id}/resume")
+    response = await client.post(_scan_url(scan_id, "resume"))
 
     assert response.status_code == 400
     assert "cannot resume" in response.json()["detail"].lower()
@@ -284,25 +286,9 @@ def test_resume_scan_not_paused(client, sample_scan_config):
 # Test: Cancel Scan
 # ============================================================================
 
-def test_cancel_scan_success(client, sample_scan_config):
-    """Test cancelling an active scan"""
-    # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
-    scan_id = start_response.json()["scan_id"]
-
-    # Cancel scan
-    response = client.post(f"/api/v1/history-scan/{scan_id}/cancel")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["status"] == "cancelled"
-    assert data["scan_id"] == scan_id
-
-
-def test_cancel_scan_not_found(client):
+async def test_cancel_scan_not_found(client):
     """Test cancelling nonexistent scan"""
-    response = client.post("/api/v1/history-scan/nonexistent_scan/cancel")
+    response = await client.post(_scan_url("nonexistent_scan", "cancel"))
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
@@ -312,14 +298,14 @@ def test_cancel_scan_not_found(client):
 # Test: Get Scan Stats
 # ============================================================================
 
-def test_get_scan_stats_success(client, sample_scan_config):
+async def test_get_scan_stats_success(client, sample_scan_config):
     """Test getting detailed statistics for a scan"""
     # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     scan_id = start_response.json()["scan_id"]
 
     # Get stats
-    response = client.get(f"/api/v1/history-scan/{scan_id}/stats")
+    response = await client.get(_scan_url(scan_id, "stats"))
 
     assert response.status_code == 200
     data = response.json()
@@ -333,59 +319,27 @@ def test_get_scan_stats_success(client, sample_scan_config):
     assert "timing" in data
 
 
-def test_get_scan_stats_progress_breakdown(client, sample_scan_config):
-    """Test that stats include progress breakdown"""
-    # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
-    scan_id = start_response.json()["scan_id"]
-
-    # Get stats
-    response = client.get(f"/api/v1/history-scan/{scan_id}/stats")
-    data = response.json()
-
-    progress = data["progress"]
-    assert "total_found" in progress
-    assert "processed" in progress
-    assert "skipped" in progress
-    assert "failed" in progress
-    assert "percent" in progress
-
-
-def test_get_scan_stats_classification_breakdown(client, sample_scan_config):
-    """Test that stats include classification breakdown"""
+@pytest.mark.parametrize("section, keys", [
+    ("progress", {"total_found", "processed", "skipped", "failed", "percent"}),
+    ("classification", {"high", "medium", "low"}),
+    ("extraction", {"tasks", "decisions", "questions"}),
+])
+async def test_get_scan_stats_breakdown(client, sample_scan_config, section, keys):
+    """Test that stats include the progress, classification and extraction breakdowns"""
     # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    start_response = await client.post(START_URL, json=sample_scan_config)
     scan_id = start_response.json()["scan_id"]
 
     # Get stats
-    response = client.get(f"/api/v1/history-scan/{scan_id}/stats")
+    response = await client.get(_scan_url(scan_id, "stats"))
     data = response.json()
 
-    classification = data["classification"]
-    assert "high" in classification
-    assert "medium" in classification
-    assert "low" in classification
+    assert keys <= data[section].keys()
 
 
-def test_get_scan_stats_extraction_breakdown(client, sample_scan_config):
-    """Test that stats include extraction breakdown"""
-    # Start scan
-    start_response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
-    scan_id = start_response.json()["scan_id"]
-
-    # Get stats
-    response = client.get(f"/api/v1/history-scan/{scan_id}/stats")
-    data = response.json()
-
-    extraction = data["extraction"]
-    assert "tasks" in extraction
-    assert "decisions" in extraction
-    assert "questions" in extraction
-
-
-def test_get_scan_stats_not_found(client):
+async def test_get_scan_stats_not_found(client):
     """Test getting stats for nonexistent scan"""
-    response = client.get("/api/v1/history-scan/nonexistent_scan/stats")
+    response = await client.get(_scan_url("nonexistent_scan", "stats"))
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
@@ -395,21 +349,15 @@ def test_get_scan_stats_not_found(client):
 # Test: Response Models
 # ============================================================================
 
-def test_scan_progress_response_structure(client, sample_scan_config):
+async def test_scan_progress_response_structure(client, sample_scan_config):
     """Test that ScanProgress response has correct structure"""
-    response = client.post("/api/v1/history-scan/start", json=sample_scan_config)
+    response = await client.post(START_URL, json=sample_scan_config)
 
     assert response.status_code == 200
     data = response.json()
 
-    required_fields = [
-        "scan_id", "account_id", "status",
-        "total_found", "processed", "skipped", "failed",
-        "started_at", "last_updated_at"
-    ]
-
-    for field in required_fields:
-        assert field in data, f"Required field '{field}' missing from response"
+    missing = SCAN_PROGRESS_FIELDS - data.keys()
+    assert not missing, f"Required fields missing from response: {sorted(missing)}"
 
 
 # ============================================================================
@@ -4,196 +4,139 @@ Tests CRUD operations for Question memory-objects via FastAPI endpoints.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
 
-from agent_platform.api.main import app
+from agent_platform.db.database import SessionLocal
 from agent_platform.db.models import Question
-from agent_platform.db.database import get_db
 
 
-# ============================================================================
-# Test Client Setup
-# ============================================================================
+# All question routes are sync, but the async client still saves the
+# TestClient portal hop on every request; run the module's tests and the
+# shared client on one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
 
+# ============================================================================
+# Fixtures
+# ============================================================================
 
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(Question).delete()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """Async client calling the ASGI app in-process (built once per module)"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def seeded_questions(db_connection):
+    """
+    Create sample questions once per module (used as-is by read-only tests).
+
+    The detail route reads through the memory service singleton, so its
+    tests use sample_questions / db_session, which reset it.
+    """
+    questions = [
+        {
+            "question_id": "question_001",
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "question": "What is the deadline for the project?",
+            "context": "Project planning discussion",
+            "question_type": "clarification",
+            "requires_response": True,
+            "urgency": "high",
+            "status": "pending",
+            "email_subject": "Project Timeline",
+            "email_sender": "pm@company.com",
+        },
+        {
+            "question_id": "question_002",
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "question": "Can you review the attached document?",
+            "context": "Document review request",
+            "question_type": "action",
+            "requires_response": True,
+            "urgency": "medium",
+            "status": "pending",
+            "email_subject": "Document Review",
+            "email_sender": "colleague@company.com",
+        },
+        {
+            "question_id": "question_003",
+            "account_id": "gmail_2",
+            "email_id": "email_003",
+            "question": "What do you think about the proposal?",
+            "context": "Opinion request",
+            "question_type": "opinion",
+            "requires_response": False,
+            "urgency": "low",
+            "status": "answered",
+            "answer": "I think it looks good",
+            "answered_at": datetime.utcnow(),
+            "email_subject": "Proposal Feedback",
+            "email_sender": "partner@company.com",
+        },
+    ]
+    with SessionLocal() as db:
+        db.execute(insert(Question), questions)
         db.commit()
     yield
-    with get_db() as db:
-        db.query(Question).delete()
-        db.commit()
 
 
 @pytest.fixture
-def sample_questions():
-    """Create sample questions in database"""
-    with get_db() as db:
-        questions = [
-            Question(
-                question_id="question_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                question="What is the deadline for the project?",
-                context="Project planning discussion",
-                question_type="clarification",
-                requires_response=True,
-                urgency="high",
-                status="pending",
-                email_subject="Project Timeline",
-                email_sender="pm@company.com",
-            ),
-            Question(
-                question_id="question_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                question="Can you review the attached document?",
-                context="Document review request",
-                question_type="action",
-                requires_response=True,
-                urgency="medium",
-                status="pending",
-                email_subject="Document Review",
-                email_sender="colleague@company.com",
-            ),
-            Question(
-                question_id="question_003",
-                account_id="gmail_2",
-                email_id="email_003",
-                question="What do you think about the proposal?",
-                context="Opinion request",
-                question_type="opinion",
-                requires_response=False,
-                urgency="low",
-                status="answered",
-                answer="I think it looks good",
-                answered_at=datetime.utcnow(),
-                email_subject="Proposal Feedback",
-                email_sender="partner@company.com",
-            ),
-        ]
-        for question in questions:
-            db.add(question)
-        db.commit()
+def sample_questions(seeded_questions, db_session):
+    """Sample questions for tests that write; their changes are rolled back"""
     yield
-    with get_db() as db:
-        db.query(Question).delete()
-        db.commit()
 
 
 # ============================================================================
 # Test: List Questions
 # ============================================================================
 
-def test_list_questions_default(client, clean_database, sample_questions):
-    """Test listing questions with default parameters"""
-    response = client.get("/api/v1/questions")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert "items" in data
-    assert "total" in data
-    assert data["total"] == 3
-    assert len(data["items"]) == 3
-
-
-def test_list_questions_pagination(client, clean_database, sample_questions):
-    """Test pagination parameters"""
-    response = client.get("/api/v1/questions?limit=2&offset=1")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["total"] == 3
-    assert len(data["items"]) == 2
-    assert data["limit"] == 2
-
-
-def test_list_questions_filter_by_account(client, clean_database, sample_questions):
-    """Test filtering by account_id"""
-    response = client.get("/api/v1/questions?account_id=gmail_1")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["total"] == 2
-    assert all(q["email_sender"] in ["pm@company.com", "colleague@company.com"] for q in data["items"])
-
-
-def test_list_questions_filter_by_status(client, clean_database, sample_questions):
-    """Test filtering by status"""
-    response = client.get("/api/v1/questions?status=pending")
+@pytest.mark.parametrize("params,expected_status,expected_total,expected_count,check", [
+    ({}, 200, 3, 3, None),
+    ({"limit": 2, "offset": 1}, 200, 3, 2, None),
+    ({"account_id": "gmail_1"}, 200, 2, 2,
+     lambda q: q["email_sender"] in ["pm@company.com", "colleague@company.com"]),
+    ({"status": "pending"}, 200, 2, 2, lambda q: q["status"] == "pending"),
+    ({"requires_response": "true"}, 200, 2, 2, lambda q: q["requires_response"] is True),
+    ({"account_id": "gmail_1", "status": "pending", "requires_response": "true"}, 200, 2, 2, None),
+    ({"account_id": "nonexistent_account"}, 200, 0, 0, None),
+    ({"limit": 150}, 422, None, None, None),  # max 100
+    ({"offset": -5}, 422, None, None, None),  # min 0
+], ids=[
+    "default", "pagination", "account", "status", "requires_response",
+    "multiple", "empty_result", "limit_validation", "offset_validation",
+])
+async def test_list_questions(client, seeded_questions, params, expected_status,
+                              expected_total, expected_count, check):
+    """Test listing questions with pagination, filters and parameter validation"""
+    response = await client.get("/api/v1/questions", params=params)
+
+    assert response.status_code == expected_status
+    if expected_status != 200:
+        return
 
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["total"] == 2
-    assert all(q["status"] == "pending" for q in data["items"])
-
-
-def test_list_questions_filter_by_requires_response(client, clean_database, sample_questions):
-    """Test filtering by requires_response flag"""
-    response = client.get("/api/v1/questions?requires_response=true")
-
-    assert response.status_code == 200
     data = response.json()
-
-    assert data["total"] == 2
-    assert all(q["requires_response"] is True for q in data["items"])
-
-
-def test_list_questions_multiple_filters(client, clean_database, sample_questions):
-    """Test combining multiple filters"""
-    response = client.get("/api/v1/questions?account_id=gmail_1&status=pending&requires_response=true")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["total"] == 2
-
-
-def test_list_questions_empty_result(client, clean_database, sample_questions):
-    """Test query that returns no results"""
-    response = client.get("/api/v1/questions?account_id=nonexistent_account")
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert data["total"] == 0
-    assert len(data["items"]) == 0
-
-
-def test_list_questions_limit_validation(client, clean_database):
-    """Test limit parameter validation (max 100)"""
-    response = client.get("/api/v1/questions?limit=150")
-
-    assert response.status_code == 422
-
-
-def test_list_questions_offset_validation(client, clean_database):
-    """Test offset parameter validation (min 0)"""
-    response = client.get("/api/v1/questions?offset=-5")
-
-    assert response.status_code == 422
+    assert data["total"] == expected_total
+    assert len(data["items"]) == expected_count
+    if "limit" in params:
+        assert data["limit"] == params["limit"]
+    if check is not None:
+        assert all(check(q) for q in data["items"])
 
 
 # ============================================================================
 # Test: Get Question Detail
 # ============================================================================
 
-def test_get_question_detail_success(client, clean_database, sample_questions):
+async def test_get_question_detail_success(client, sample_questions):
     """Test getting single question by ID"""
-    response = client.get("/api/v1/questions/question_001")
+    response = await client.get("/api/v1/questions/question_001")
 
     assert response.status_code == 200
     data = response.json()
@@ -206,17 +149,17 @@ def test_get_question_detail_success(client, clean_database, sample_questions):
     assert data["email_sender"] == "pm@company.com"
 
 
-def test_get_question_detail_not_found(client, clean_database):
+async def test_get_question_detail_not_found(client, db_session):
     """Test getting nonexistent question"""
-    response = client.get("/api/v1/questions/nonexistent_question")
+    response = await client.get("/api/v1/questions/nonexistent_question")
 
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_get_question_detail_includes_metadata(client, clean_database, sample_questions):
+async def test_get_question_detail_includes_metadata(client, sample_questions):
     """Test that question detail includes all metadata fields"""
-    response = client.get("/api/v1/questions/question_001")
+    response = await client.get("/api/v1/questions/question_001")
 
     assert response.status_code == 200
     data = response.json()
@@ -240,9 +183,9 @@ def test_get_question_detail_includes_metadata(client, clean_database, sample_qu
 # Test: Answer Question
 # ============================================================================
 
-def test_answer_question_success(client, clean_database, sample_questions):
+async def test_answer_question_success(client, sample_questions):
     """Test answering a question"""
-    response = client.post(
+    response = await client.post(
         "/api/v1/questions/question_001/answer",
         json={"answer": "The deadline is next Friday"}
     )
@@ -255,9 +198,9 @@ def test_answer_question_success(client, clean_database, sample_questions):
     assert data["question_id"] == "question_001"
 
 
-def test_answer_question_not_found(client, clean_database):
+async def test_answer_question_not_found(client, db_session):
     """Test answering nonexistent question"""
-    response = client.post(
+    response = await client.post(
         "/api/v1/questions/nonexistent_question/answer",
         json={"answer": "Some answer"}
     )
@@ -266,16 +209,16 @@ def test_answer_question_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_answer_question_updates_status(client, clean_database, sample_questions):
+async def test_answer_question_updates_status(client, sample_questions):
     """Test that answering question updates status to 'answered'"""
     # Answer question
-    client.post(
+    await client.post(
         "/api/v1/questions/question_001/answer",
         json={"answer": "Next Friday"}
     )
 
     # Verify status updated
-    response = client.get("/api/v1/questions/question_001")
+    response = await client.get("/api/v1/questions/question_001")
     data = response.json()
 
     assert data["status"] == "answered"
@@ -283,10 +226,10 @@ def test_answer_question_updates_status(client, clean_database, sample_questions
     assert data["answered_at"] is not None
 
 
-def test_answer_already_answered_question(client, clean_database, sample_questions):
+async def test_answer_already_answered_question(client, sample_questions):
     """Test answering already answered question (idempotent)"""
     # question_003 is already answered
-    response = client.post(
+    response = await client.post(
         "/api/v1/questions/question_003/answer",
         json={"answer": "Updated answer"}
     )
@@ -299,9 +242,9 @@ def test_answer_already_answered_question(client, clean_database, sample_questio
 # Test: Response Models
 # ============================================================================
 
-def test_question_response_model_structure(client, clean_database, sample_questions):
+async def test_question_response_model_structure(client, sample_questions):
     """Test that QuestionResponse model has correct structure"""
-    response = client.get("/api/v1/questions/question_001")
+    response = await client.get("/api/v1/questions/question_001")
     data = response.json()
 
     required_fields = [
@@ -313,9 +256,9 @@ def test_question_response_model_structure(client, clean_database, sample_questi
         assert field in data, f"Required field '{field}' missing from response"
 
 
-def test_questions_list_response_structure(client, clean_database, sample_questions):
+async def test_questions_list_response_structure(client, seeded_questions):
     """Test that QuestionsListResponse has correct structure"""
-    response = client.get("/api/v1/questions")
+    response = await client.get("/api/v1/questions")
     data = response.json()
 
     assert "items" in data
@@ -331,16 +274,16 @@ def test_questions_list_response_structure(client, clean_database, sample_questi
 # Test: Error Handling
 # ============================================================================
 
-def test_invalid_question_id_format(client, clean_database):
+async def test_invalid_question_id_format(client, db_session):
     """Test handling of invalid question ID format"""
-    response = client.get("/api/v1/questions/invalid-format-!@#")
+    response = await client.get("/api/v1/questions/invalid-format-!@#")
 
     assert response.status_code == 404
 
 
-def test_answer_question_missing_answer(client, clean_database, sample_questions):
+async def test_answer_question_missing_answer(client, seeded_questions):
     """Test answering without required answer field"""
-    response = client.post(
+    response = await client.post(
         "/api/v1/questions/question_001/answer",
         json={}  # Missing answer
     )
@@ -348,11 +291,11 @@ def test_answer_question_missing_answer(client, clean_database, sample_questions
     assert response.status_code == 422  # Validation error
 
 
-def test_answer_question_invalid_json(client, clean_database, sample_questions):
+async def test_answer_question_invalid_json(client, seeded_questions):
     """Test answering with invalid JSON"""
-    response = client.post(
+    response = await client.post(
         "/api/v1/questions/question_001/answer",
-        data="invalid json",
+        content="invalid json",
         headers={"Content-Type": "application/json"}
     )
 
@@ -363,36 +306,36 @@ def test_answer_question_invalid_json(client, clean_database, sample_questions):
 # Test: Database Integration
 # ============================================================================
 
-def test_question_persists_across_requests(client, clean_database, sample_questions):
+async def test_question_persists_across_requests(client, sample_questions):
     """Test that question persists across multiple requests"""
     # Answer question
-    answer_response = client.post(
+    answer_response = await client.post(
         "/api/v1/questions/question_001/answer",
         json={"answer": "Next Friday"}
     )
     assert answer_response.status_code == 200
 
     # Verify persistence
-    get_response = client.get("/api/v1/questions/question_001")
+    get_response = await client.get("/api/v1/questions/question_001")
     assert get_response.status_code == 200
     assert get_response.json()["answer"] == "Next Friday"
     assert get_response.json()["status"] == "answered"
 
 
-def test_answered_at_timestamp_set(client, clean_database, sample_questions):
+async def test_answered_at_timestamp_set(client, sample_questions):
     """Test that answering sets answered_at timestamp"""
     # Question initially has no answered_at
-    initial_response = client.get("/api/v1/questions/question_001")
+    initial_response = await client.get("/api/v1/questions/question_001")
     assert initial_response.json()["answered_at"] is None
 
     # Answer question
-    client.post(
+    await client.post(
         "/api/v1/questions/question_001/answer",
         json={"answer": "Next Friday"}
     )
 
     # Verify answered_at is set
-    final_response = client.get("/api/v1/questions/question_001")
+    final_response = await client.get("/api/v1/questions/question_001")
     assert final_response.json()["answered_at"] is not None
     assert final_response.json()["status"] == "answered"
 
@@ -401,9 +344,9 @@ def test_answered_at_timestamp_set(client, clean_database, sample_questions):
 # Test: Business Logic
 # ============================================================================
 
-def test_pending_questions_excludes_answered(client, clean_database, sample_questions):
+async def test_pending_questions_excludes_answered(client, seeded_questions):
     """Test that filtering by status=pending excludes answered questions"""
-    response = client.get("/api/v1/questions?status=pending")
+    response = await client.get("/api/v1/questions?status=pending")
 
     assert response.status_code == 200
     data = response.json()
@@ -428,7 +371,7 @@ Endpoints Tested:
 - POST /api/v1/questions/{question_id}/answer (answer question)
 
 Test Categories:
-- List operations (9 tests)
+- List operations (9 parametrized cases)
 - Detail retrieval (3 tests)
 - Answer operations (4 tests)
 - Response models (2 tests)
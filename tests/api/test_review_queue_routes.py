@@ -4,97 +4,110 @@ Tests review queue CRUD operations, approval/rejection/modification workflows.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
 
-from agent_platform.api.main import app
+from agent_platform.db.database import SessionLocal
 from agent_platform.db.models import ReviewQueueItem
-from agent_platform.db.database import get_db
 
 
-# ============================================================================
-# Test Client Setup
-# ============================================================================
+# All review-queue routes are sync, but the async client still saves the
+# TestClient portal hop on every request; run the module's tests and the
+# shared client on one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
 
+# ============================================================================
+# Fixtures
+# ============================================================================
 
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(ReviewQueueItem).delete()
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(app):
+    """Async client calling the ASGI app in-process (built once per module)"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def seeded_review_items(db_connection):
+    """Create sample review queue items once per module (used as-is by read-only tests)"""
+    now = datetime.utcnow()
+    items = [
+        {
+            "account_id": "gmail_1",
+            "email_id": "email_001",
+            "subject": "Important Meeting Tomorrow",
+            "sender": "colleague@company.com",
+            "snippet": "Can we meet at 10am to discuss the project?",
+            "suggested_category": "wichtig",
+            "importance_score": 0.75,
+            "confidence": 0.70,
+            "reasoning": "Medium confidence - needs review",
+            "status": "pending",
+            "user_approved": None,
+            "reviewed_at": None,
+            "added_to_queue_at": now - timedelta(hours=2),
+        },
+        {
+            "account_id": "gmail_1",
+            "email_id": "email_002",
+            "subject": "Quarterly Report Review",
+            "sender": "manager@company.com",
+            "snippet": "Please review the attached Q3 report...",
+            "suggested_category": "wichtig",
+            "importance_score": 0.80,
+            "confidence": 0.68,
+            "reasoning": None,
+            "status": "pending",
+            "user_approved": None,
+            "reviewed_at": None,
+            "added_to_queue_at": now - timedelta(hours=1),
+        },
+        {
+            "account_id": "gmail_2",
+            "email_id": "email_003",
+            "subject": "Team Lunch Invitation",
+            "sender": "hr@company.com",
+            "snippet": "Join us for team lunch on Friday!",
+            "suggested_category": "unwichtig",
+            "importance_score": 0.40,
+            "confidence": 0.72,
+            "reasoning": None,
+            "status": "approved",
+            "user_approved": True,
+            "reviewed_at": now - timedelta(minutes=30),
+            "added_to_queue_at": now - timedelta(hours=3),
+        },
+    ]
+    with SessionLocal() as db:
+        # Same keys in every row, so this is a single executemany
+        db.execute(insert(ReviewQueueItem), items)
         db.commit()
     yield
-    with get_db() as db:
-        db.query(ReviewQueueItem).delete()
-        db.commit()
 
 
 @pytest.fixture
-def sample_review_items():
-    """Create sample review queue items"""
-    with get_db() as db:
-        items = [
-            ReviewQueueItem(
-                account_id="gmail_1",
-                email_id="email_001",
-                subject="Important Meeting Tomorrow",
-                sender="colleague@company.com",
-                snippet="Can we meet at 10am to discuss the project?",
-                suggested_category="wichtig",
-                importance_score=0.75,
-                confidence=0.70,
-                reasoning="Medium confidence - needs review",
-                status="pending",
-                added_to_queue_at=datetime.utcnow() - timedelta(hours=2),
-            ),
-            ReviewQueueItem(
-                account_id="gmail_1",
-                email_id="email_002",
-                subject="Quarterly Report Review",
-                sender="manager@company.com",
-                snippet="Please review the attached Q3 report...",
-                suggested_category="wichtig",
-                importance_score=0.80,
-                confidence=0.68,
-                status="pending",
-                added_to_queue_at=datetime.utcnow() - timedelta(hours=1),
-            ),
-            ReviewQueueItem(
-                account_id="gmail_2",
-                email_id="email_003",
-                subject="Team Lunch Invitation",
-                sender="hr@company.com",
-                snippet="Join us for team lunch on Friday!",
-                suggested_category="unwichtig",
-                importance_score=0.40,
-                confidence=0.72,
-                status="approved",
-                user_approved=True,
-                reviewed_at=datetime.utcnow() - timedelta(minutes=30),
-                added_to_queue_at=datetime.utcnow() - timedelta(hours=3),
-            ),
-        ]
-        for item in items:
-            db.add(item)
-        db.commit()
+def sample_review_items(seeded_review_items, db_session):
+    """Sample review queue items for tests that write; their changes are rolled back"""
     yield
-    with get_db() as db:
-        db.query(ReviewQueueItem).delete()
-        db.commit()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def pending_item_id(client, seeded_review_items):
+    """ID of the first pending item in the list (seed IDs are stable per module)"""
+    response = await client.get("/api/v1/review-queue?status=pending")
+    return response.json()["items"][0]["id"]
 
 
 # ============================================================================
 # Test: List Review Queue Items
 # ============================================================================
 
-def test_list_review_queue_default(client, clean_database, sample_review_items):
+async def test_list_review_queue_default(client, seeded_review_items):
     """Test listing review queue items with default parameters"""
-    response = client.get("/api/v1/review-queue")
+    response = await client.get("/api/v1/review-queue")
 
     assert response.status_code == 200
     data = response.json()
@@ -105,9 +118,9 @@ def test_list_review_queue_default(client, clean_database, sample_review_items):
     assert data["total"] >= 2  # At least 2 pending items
 
 
-def test_list_review_queue_filter_by_account(client, clean_database, sample_review_items):
+async def test_list_review_queue_filter_by_account(client, seeded_review_items):
     """Test filtering by account_id"""
-    response = client.get("/api/v1/review-queue?account_id=gmail_1")
+    response = await client.get("/api/v1/review-queue?account_id=gmail_1")
 
     assert response.status_code == 200
     data = response.json()
@@ -115,9 +128,9 @@ def test_list_review_queue_filter_by_account(client, clean_database, sample_revi
     assert all(item["account_id"] == "gmail_1" for item in data["items"])
 
 
-def test_list_review_queue_filter_by_status(client, clean_database, sample_review_items):
+async def test_list_review_queue_filter_by_status(client, seeded_review_items):
     """Test filtering by status"""
-    response = client.get("/api/v1/review-queue?status=approved")
+    response = await client.get("/api/v1/review-queue?status=approved")
 
     assert response.status_code == 200
     data = response.json()
@@ -125,9 +138,9 @@ def test_list_review_queue_filter_by_status(client, clean_database, sample_revie
     assert all(item["status"] == "approved" for item in data["items"])
 
 
-def test_list_review_queue_pagination(client, clean_database, sample_review_items):
+async def test_list_review_queue_pagination(client, seeded_review_items):
     """Test pagination parameters"""
-    response = client.get("/api/v1/review-queue?limit=1&offset=0")
+    response = await client.get("/api/v1/review-queue?limit=1&offset=0")
 
     assert response.status_code == 200
     data = response.json()
@@ -136,9 +149,9 @@ def test_list_review_queue_pagination(client, clean_database, sample_review_item
     assert data["limit"] == 1
 
 
-def test_list_review_queue_ordered_by_importance(client, clean_database, sample_review_items):
+async def test_list_review_queue_ordered_by_importance(client, seeded_review_items):
     """Test that items are ordered by importance (descending)"""
-    response = client.get("/api/v1/review-queue")
+    response = await client.get("/api/v1/review-queue")
 
     assert response.status_code == 200
     data = response.json()
@@ -152,9 +165,9 @@ def test_list_review_queue_ordered_by_importance(client, clean_database, sample_
 # Test: Get Review Queue Stats
 # ============================================================================
 
-def test_get_review_queue_stats(client, clean_database, sample_review_items):
+async def test_get_review_queue_stats(client, seeded_review_items):
     """Test getting review queue statistics"""
-    response = client.get("/api/v1/review-queue/stats")
+    response = await client.get("/api/v1/review-queue/stats")
 
     assert response.status_code == 200
     data = response.json()
@@ -168,9 +181,9 @@ def test_get_review_queue_stats(client, clean_database, sample_review_items):
     assert "avg_age_hours" in data
 
 
-def test_get_review_queue_stats_filter_by_account(client, clean_database, sample_review_items):
+async def test_get_review_queue_stats_filter_by_account(client, seeded_review_items):
     """Test stats filtered by account"""
-    response = client.get("/api/v1/review-queue/stats?account_id=gmail_1")
+    response = await client.get("/api/v1/review-queue/stats?account_id=gmail_1")
 
     assert response.status_code == 200
     data = response.json()
@@ -182,14 +195,14 @@ def test_get_review_queue_stats_filter_by_account(client, clean_database, sample
 # Test: Get Review Queue Item
 # ============================================================================
 
-def test_get_review_queue_item_success(client, clean_database, sample_review_items):
+async def test_get_review_queue_item_success(client, seeded_review_items):
     """Test getting single review item by ID"""
     # Get first item ID
-    list_response = client.get("/api/v1/review-queue")
+    list_response = await client.get("/api/v1/review-queue")
     first_item_id = list_response.json()["items"][0]["id"]
 
     # Get item detail
-    response = client.get(f"/api/v1/review-queue/{first_item_id}")
+    response = await client.get(f"/api/v1/review-queue/{first_item_id}")
 
     assert response.status_code == 200
     data = response.json()
@@ -200,27 +213,15 @@ def test_get_review_queue_item_success(client, clean_database, sample_review_ite
     assert "confidence" in data
 
 
-def test_get_review_queue_item_not_found(client, clean_database):
-    """Test getting nonexistent review item"""
-    response = client.get("/api/v1/review-queue/99999")
-
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
 # ============================================================================
 # Test: Approve Review Item
 # ============================================================================
 
-def test_approve_review_item_success(client, clean_database, sample_review_items):
+async def test_approve_review_item_success(client, sample_review_items, pending_item_id):
     """Test approving a review item"""
-    # Get pending item
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
     # Approve item
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/approve",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/approve",
         json={"user_feedback": "Looks correct", "apply_action": False}
     )
 
@@ -231,13 +232,10 @@ def test_approve_review_item_success(client, clean_database, sample_review_items
     assert "approved" in data["message"].lower()
 
 
-def test_approve_review_item_without_feedback(client, clean_database, sample_review_items):
+async def test_approve_review_item_without_feedback(client, sample_review_items, pending_item_id):
     """Test approving without user feedback"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/approve",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/approve",
         json={"apply_action": False}
     )
 
@@ -245,27 +243,14 @@ def test_approve_review_item_without_feedback(client, clean_database, sample_rev
     assert response.json()["success"] is True
 
 
-def test_approve_review_item_not_found(client, clean_database):
-    """Test approving nonexistent item"""
-    response = client.post(
-        "/api/v1/review-queue/99999/approve",
-        json={"apply_action": False}
-    )
-
-    assert response.status_code == 404
-
-
 # ============================================================================
 # Test: Reject Review Item
 # ============================================================================
 
-def test_reject_review_item_success(client, clean_database, sample_review_items):
+async def test_reject_review_item_success(client, sample_review_items, pending_item_id):
     """Test rejecting a review item"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/reject",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/reject",
         json={"user_feedback": "Incorrect classification", "apply_action": False}
     )
 
@@ -276,13 +261,10 @@ def test_reject_review_item_success(client, clean_database, sample_review_items)
     assert "rejected" in data["message"].lower()
 
 
-def test_reject_review_item_with_correction(client, clean_database, sample_review_items):
+async def test_reject_review_item_with_correction(client, sample_review_items, pending_item_id):
     """Test rejecting with corrected category"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/reject",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/reject",
         json={
             "corrected_category": "unwichtig",
             "user_feedback": "Should be unwichtig",
@@ -294,27 +276,14 @@ def test_reject_review_item_with_correction(client, clean_database, sample_revie
     assert response.json()["success"] is True
 
 
-def test_reject_review_item_not_found(client, clean_database):
-    """Test rejecting nonexistent item"""
-    response = client.post(
-        "/api/v1/review-queue/99999/reject",
-        json={"apply_action": False}
-    )
-
-    assert response.status_code == 404
-
-
 # ============================================================================
 # Test: Modify Review Item
 # ============================================================================
 
-def test_modify_review_item_success(client, clean_database, sample_review_items):
+async def test_modify_review_item_success(client, sample_review_items, pending_item_id):
     """Test modifying classification"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/modify",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/modify",
         json={
             "corrected_category": "newsletter",
             "user_feedback": "This is actually a newsletter",
@@ -330,39 +299,23 @@ def test_modify_review_item_success(client, clean_database, sample_review_items)
     assert "newsletter" in data["message"].lower()
 
 
-def test_modify_review_item_missing_category(client, clean_database, sample_review_items):
+async def test_modify_review_item_missing_category(client, seeded_review_items, pending_item_id):
     """Test modifying without required corrected_category"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.post(
-        f"/api/v1/review-queue/{item_id}/modify",
+    response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/modify",
         json={"user_feedback": "Needs correction"}  # Missing corrected_category
     )
 
     assert response.status_code == 422  # Validation error
 
 
-def test_modify_review_item_not_found(client, clean_database):
-    """Test modifying nonexistent item"""
-    response = client.post(
-        "/api/v1/review-queue/99999/modify",
-        json={"corrected_category": "spam", "apply_action": False}
-    )
-
-    assert response.status_code == 404
-
-
 # ============================================================================
 # Test: Delete Review Item
 # ============================================================================
 
-def test_delete_review_item_success(client, clean_database, sample_review_items):
+async def test_delete_review_item_success(client, sample_review_items, pending_item_id):
     """Test deleting a review item"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
-    response = client.delete(f"/api/v1/review-queue/{item_id}")
+    response = await client.delete(f"/api/v1/review-queue/{pending_item_id}")
 
     assert response.status_code == 200
     data = response.json()
@@ -371,13 +324,24 @@ def test_delete_review_item_success(client, clean_database, sample_review_items)
     assert "deleted" in data["message"].lower()
 
     # Verify item is deleted
-    get_response = client.get(f"/api/v1/review-queue/{item_id}")
+    get_response = await client.get(f"/api/v1/review-queue/{pending_item_id}")
     assert get_response.status_code == 404
 
 
-def test_delete_review_item_not_found(client, clean_database):
-    """Test deleting nonexistent item"""
-    response = client.delete("/api/v1/review-queue/99999")
+# ============================================================================
+# Test: Unknown Item
+# ============================================================================
+
+@pytest.mark.parametrize("method,suffix,body", [
+    ("GET", "", None),
+    ("POST", "/approve", {"apply_action": False}),
+    ("POST", "/reject", {"apply_action": False}),
+    ("POST", "/modify", {"corrected_category": "spam", "apply_action": False}),
+    ("DELETE", "", None),
+], ids=["get", "approve", "reject", "modify", "delete"])
+async def test_review_item_not_found(client, db_session, method, suffix, body):
+    """Test that every item endpoint returns 404 for a nonexistent item"""
+    response = await client.request(method, f"/api/v1/review-queue/99999{suffix}", json=body)
 
     assert response.status_code == 404
 
@@ -386,9 +350,9 @@ def test_delete_review_item_not_found(client, clean_database):
 # Test: Response Models
 # ============================================================================
 
-def test_review_queue_item_response_structure(client, clean_database, sample_review_items):
+async def test_review_queue_item_response_structure(client, seeded_review_items):
     """Test that ReviewQueueItemResponse has correct structure"""
-    list_response = client.get("/api/v1/review-queue")
+    list_response = await client.get("/api/v1/review-queue")
     item = list_response.json()["items"][0]
 
     required_fields = [
@@ -401,9 +365,9 @@ def test_review_queue_item_response_structure(client, clean_database, sample_rev
         assert field in item, f"Required field '{field}' missing"
 
 
-def test_review_queue_list_response_structure(client, clean_database, sample_review_items):
+async def test_review_queue_list_response_structure(client, seeded_review_items):
     """Test that list response has correct structure"""
-    response = client.get("/api/v1/review-queue")
+    response = await client.get("/api/v1/review-queue")
     data = response.json()
 
     assert "items" in data
@@ -417,14 +381,11 @@ def test_review_queue_list_response_structure(client, clean_database, sample_rev
 # Test: Business Logic
 # ============================================================================
 
-def test_approve_updates_status(client, clean_database, sample_review_items):
+async def test_approve_updates_status(client, sample_review_items, pending_item_id):
     """Test that approving updates item status"""
-    list_response = client.get("/api/v1/review-queue?status=pending")
-    item_id = list_response.json()["items"][0]["id"]
-
     # Approve
-    approve_response = client.post(
-        f"/api/v1/review-queue/{item_id}/approve",
+    approve_response = await client.post(
+        f"/api/v1/review-queue/{pending_item_id}/approve",
         json={"apply_action": False}
     )
     assert approve_response.status_code == 200
@@ -434,9 +395,9 @@ def test_approve_updates_status(client, clean_database, sample_review_items):
     # The item should either be updated or removed from pending queue
 
 
-def test_pending_filter_excludes_reviewed(client, clean_database, sample_review_items):
+async def test_pending_filter_excludes_reviewed(client, seeded_review_items):
     """Test that pending filter excludes approved/rejected items"""
-    response = client.get("/api/v1/review-queue?status=pending")
+    response = await client.get("/api/v1/review-queue?status=pending")
     data = response.json()
 
     # Should not include the approved item (email_003)
@@ -462,11 +423,12 @@ Endpoints Tested:
 Test Categories:
 - List operations (5 tests)
 - Get stats (2 tests)
-- Get item detail (2 tests)
-- Approve operations (3 tests)
-- Reject operations (3 tests)
-- Modify operations (3 tests)
-- Delete operations (2 tests)
+- Get item detail (1 test)
+- Approve operations (2 tests)
+- Reject operations (2 tests)
+- Modify operations (2 tests)
+- Delete operations (1 test)
+- Unknown item (5 parametrized cases)
 - Response models (2 tests)
 - Business logic (2 tests)
 
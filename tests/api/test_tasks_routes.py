@@ -5,94 +5,65 @@ Tests CRUD operations for Task memory-objects via FastAPI endpoints.
 
 import pytest
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
-from agent_platform.api.main import app
 from agent_platform.db.models import Task
-from agent_platform.db.database import get_db
 
 
 # ============================================================================
-# Test Client Setup
+# Fixtures
 # ============================================================================
 
 @pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        # Clean tasks
-        db.query(Task).delete()
-        db.commit()
-    yield
-    # Cleanup after test
-    with get_db() as db:
-        db.query(Task).delete()
-        db.commit()
-
-
-@pytest.fixture
-def sample_tasks():
-    """Create sample tasks in database"""
-    with get_db() as db:
-        tasks = [
-            Task(
-                task_id="task_001",
-                account_id="gmail_1",
-                email_id="email_001",
-                description="Complete project report",
-                priority="high",
-                status="pending",
-                requires_action_from_me=True,
-                deadline=datetime.utcnow() + timedelta(days=2),
-                email_subject="Project Report Due",
-                email_sender="boss@company.com",
-            ),
-            Task(
-                task_id="task_002",
-                account_id="gmail_1",
-                email_id="email_002",
-                description="Review pull request",
-                priority="medium",
-                status="pending",
-                requires_action_from_me=True,
-                email_subject="PR Review Needed",
-                email_sender="dev@company.com",
-            ),
-            Task(
-                task_id="task_003",
-                account_id="gmail_2",
-                email_id="email_003",
-                description="Schedule team meeting",
-                priority="low",
-                status="completed",
-                requires_action_from_me=False,
-                completed_at=datetime.utcnow(),
-                email_subject="Team Meeting",
-                email_sender="hr@company.com",
-            ),
-        ]
-        for task in tasks:
-            db.add(task)
-        db.commit()
+def sample_tasks(db_session):
+    """Create sample tasks (rolled back after the test)"""
+    tasks = [
+        Task(
+            task_id="task_001",
+            account_id="gmail_1",
+            email_id="email_001",
+            description="Complete project report",
+            priority="high",
+            status="pending",
+            requires_action_from_me=True,
+            deadline=datetime.utcnow() + timedelta(days=2),
+            email_subject="Project Report Due",
+            email_sender="boss@company.com",
+        ),
+        Task(
+            task_id="task_002",
+            account_id="gmail_1",
+            email_id="email_002",
+            description="Review pull request",
+            priority="medium",
+            status="pending",
+            requires_action_from_me=True,
+            email_subject="PR Review Needed",
+            email_sender="dev@company.com",
+        ),
+        Task(
+            task_id="task_003",
+            account_id="gmail_2",
+            email_id="email_003",
+            description="Schedule team meeting",
+            priority="low",
+            status="completed",
+            requires_action_from_me=False,
+            completed_at=datetime.utcnow(),
+            email_subject="Team Meeting",
+            email_sender="hr@company.com",
+        ),
+    ]
+    db_session.add_all(tasks)
+    db_session.commit()
     yield
-    # Cleanup
-    with get_db() as db:
-        db.query(Task).delete()
-        db.commit()
 
 
 # ============================================================================
 # Test: List Tasks
 # ============================================================================
 
-def test_list_tasks_default(client, clean_database, sample_tasks):
+def test_list_tasks_default(client, sample_tasks):
     """Test listing tasks with default parameters"""
     response = client.get("/api/v1/tasks")
 
@@ -110,7 +81,7 @@ def test_list_tasks_default(client, clean_database, sample_tasks):
     assert data["offset"] == 0
 
 
-def test_list_tasks_pagination(client, clean_database, sample_tasks):
+def test_list_tasks_pagination(client, sample_tasks):
     """Test pagination parameters"""
     response = client.get("/api/v1/tasks?limit=2&offset=1")
 
@@ -123,7 +94,7 @@ def test_list_tasks_pagination(client, clean_database, sample_tasks):
     assert data["offset"] == 1
 
 
-def test_list_tasks_filter_by_account(client, clean_database, sample_tasks):
+def test_list_tasks_filter_by_account(client, sample_tasks):
     """Test filtering by account_id"""
     response = client.get("/api/v1/tasks?account_id=gmail_1")
 
@@ -135,7 +106,7 @@ def test_list_tasks_filter_by_account(client, clean_database, sample_tasks):
     assert all(task["email_sender"] in ["boss@company.com", "dev@company.com"] for task in data["items"])
 
 
-def test_list_tasks_filter_by_status(client, clean_database, sample_tasks):
+def test_list_tasks_filter_by_status(client, sample_tasks):
     """Test filtering by status"""
     response = client.get("/api/v1/tasks?status=pending")
 
@@ -147,7 +118,7 @@ def test_list_tasks_filter_by_status(client, clean_database, sample_tasks):
     assert all(task["status"] == "pending" for task in data["items"])
 
 
-def test_list_tasks_filter_by_priority(client, clean_database, sample_tasks):
+def test_list_tasks_filter_by_priority(client, sample_tasks):
     """Test filtering by priority"""
     response = client.get("/api/v1/tasks?priority=high")
 
@@ -160,7 +131,7 @@ def test_list_tasks_filter_by_priority(client, clean_database, sample_tasks):
     assert data["items"][0]["description"] == "Complete project report"
 
 
-def test_list_tasks_multiple_filters(client, clean_database, sample_tasks):
+def test_list_tasks_multiple_filters(client, sample_tasks):
     """Test combining multiple filters"""
     response = client.get("/api/v1/tasks?account_id=gmail_1&status=pending&priority=high")
 
@@ -172,7 +143,7 @@ def test_list_tasks_multiple_filters(client, clean_database, sample_tasks):
     assert data["items"][0]["task_id"] == "task_001"
 
 
-def test_list_tasks_empty_result(client, clean_database, sample_tasks):
+def test_list_tasks_empty_result(client, sample_tasks):
     """Test query that returns no results"""
     response = client.get("/api/v1/tasks?account_id=nonexistent_account")
 
@@ -183,7 +154,7 @@ def test_list_tasks_empty_result(client, clean_database, sample_tasks):
     assert len(data["items"]) == 0
 
 
-def test_list_tasks_limit_validation(client, clean_database):
+def test_list_tasks_limit_validation(client, db_session):
     """Test limit parameter validation (max 100)"""
     response = client.get("/api/v1/tasks?limit=150")
 
@@ -191,7 +162,7 @@ def test_list_tasks_limit_validation(client, clean_database):
     assert response.status_code == 422
 
 
-def test_list_tasks_offset_validation(client, clean_database):
+def test_list_tasks_offset_validation(client, db_session):
     """Test offset parameter validation (min 0)"""
     response = client.get("/api/v1/tasks?offset=-5")
 
@@ -203,7 +174,7 @@ def test_list_tasks_offset_validation(client, clean_database):
 # Test: Get Task Detail
 # ============================================================================
 
-def test_get_task_detail_success(client, clean_database, sample_tasks):
+def test_get_task_detail_success(client, sample_tasks):
     """Test getting single task by ID"""
     response = client.get("/api/v1/tasks/task_001")
 
@@ -217,7 +188,7 @@ def test_get_task_detail_success(client, clean_database, sample_tasks):
     assert data["email_sender"] == "boss@company.com"
 
 
-def test_get_task_detail_not_found(client, clean_database):
+def test_get_task_detail_not_found(client, db_session):
     """Test getting nonexistent task"""
     response = client.get("/api/v1/tasks/nonexistent_task")
 
@@ -225,7 +196,7 @@ def test_get_task_detail_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_get_task_detail_includes_metadata(client, clean_database, sample_tasks):
+def test_get_task_detail_includes_metadata(client, sample_tasks):
     """Test that task detail includes all metadata fields"""
     response = client.get("/api/v1/tasks/task_001")
 
@@ -255,7 +226,7 @@ def test_get_task_detail_includes_metadata(client, clean_database, sample_tasks)
 # Test: Update Task
 # ============================================================================
 
-def test_update_task_status(client, clean_database, sample_tasks):
+def test_update_task_status(client, sample_tasks):
     """Test updating task status"""
     response = client.patch(
         "/api/v1/tasks/task_001",
@@ -269,7 +240,7 @@ def test_update_task_status(client, clean_database, sample_tasks):
     assert data["status"] == "in_progress"
 
 
-def test_update_task_priority(client, clean_database, sample_tasks):
+def test_update_task_priority(client, sample_tasks):
     """Test updating task priority"""
     response = client.patch(
         "/api/v1/tasks/task_002",
@@ -283,7 +254,7 @@ def test_update_task_priority(client, clean_database, sample_tasks):
     assert data["priority"] == "urgent"
 
 
-def test_update_task_multiple_fields(client, clean_database, sample_tasks):
+def test_update_task_multiple_fields(client, sample_tasks):
     """Test updating multiple fields at once"""
     response = client.patch(
         "/api/v1/tasks/task_001",
@@ -301,7 +272,7 @@ def test_update_task_multiple_fields(client, clean_database, sample_tasks):
     assert data["priority"] == "urgent"
 
 
-def test_update_task_not_found(client, clean_database):
+def test_update_task_not_found(client, db_session):
     """Test updating nonexistent task"""
     response = client.patch(
         "/api/v1/tasks/nonexistent_task",
@@ -312,7 +283,7 @@ def test_update_task_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_update_task_empty_body(client, clean_database, sample_tasks):
+def test_update_task_empty_body(client, sample_tasks):
     """Test update with empty request body"""
     response = client.patch(
         "/api/v1/tasks/task_001",
@@ -329,7 +300,7 @@ def test_update_task_empty_body(client, clean_database, sample_tasks):
 # Test: Complete Task
 # ============================================================================
 
-def test_complete_task_success(client, clean_database, sample_tasks):
+def test_complete_task_success(client, sample_tasks):
     """Test completing a task"""
     response = client.post("/api/v1/tasks/task_001/complete")
 
@@ -340,7 +311,7 @@ def test_complete_task_success(client, clean_database, sample_tasks):
     assert "completed" in data["message"].lower()
 
 
-def test_complete_task_with_notes(client, clean_database, sample_tasks):
+def test_complete_task_with_notes(client, sample_tasks):
     """Test completing task with completion notes"""
     response = client.post(
         "/api/v1/tasks/task_001/complete",
@@ -359,7 +330,7 @@ def test_complete_task_with_notes(client, clean_database, sample_tasks):
     assert task_data["completed_at"] is not None
 
 
-def test_complete_task_not_found(client, clean_database):
+def test_complete_task_not_found(client, db_session):
     """Test completing nonexistent task"""
     response = client.post("/api/v1/tasks/nonexistent_task/complete")
 
@@ -367,7 +338,7 @@ def test_complete_task_not_found(client, clean_database):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_complete_already_completed_task(client, clean_database, sample_tasks):
+def test_complete_already_completed_task(client, sample_tasks):
     """Test completing an already completed task"""
     # task_003 is already completed
     response = client.post("/api/v1/tasks/task_003/complete")
@@ -380,7 +351,7 @@ def test_complete_already_completed_task(client, clean_database, sample_tasks):
 # Test: Response Models
 # ============================================================================
 
-def test_task_response_model_structure(client, clean_database, sample_tasks):
+def test_task_response_model_structure(client, sample_tasks):
     """Test that TaskResponse model has correct structure"""
     response = client.get("/api/v1/tasks/task_001")
     data = response.json()
@@ -394,7 +365,7 @@ def test_task_response_model_structure(client, clean_database, sample_tasks):
         assert field in data, f"Required field '{field}' missing from response"
 
 
-def test_tasks_list_response_structure(client, clean_database, sample_tasks):
+def test_tasks_list_response_structure(client, sample_tasks):
     """Test that TasksListResponse has correct structure"""
     response = client.get("/api/v1/tasks")
     data = response.json()
@@ -414,7 +385,7 @@ def test_tasks_list_response_structure(client, clean_database, sample_tasks):
 # Test: Error Handling
 # ============================================================================
 
-def test_invalid_task_id_format(client, clean_database):
+def test_invalid_task_id_format(client, db_session):
     """Test handling of invalid task ID format"""
     # API should handle any string, even if not found
     response = client.get("/api/v1/tasks/invalid-format-!@#")
@@ -422,7 +393,7 @@ def test_invalid_task_id_format(client, clean_database):
     assert response.status_code == 404
 
 
-def test_invalid_status_value(client, clean_database, sample_tasks):
+def test_invalid_status_value(client, sample_tasks):
     """Test updating with invalid status value"""
     response = client.patch(
         "/api/v1/tasks/task_001",
@@ -434,7 +405,7 @@ def test_invalid_status_value(client, clean_database, sample_tasks):
     assert response.status_code in [200, 400, 422]
 
 
-def test_invalid_priority_value(client, clean_database, sample_tasks):
+def test_invalid_priority_value(client, sample_tasks):
     """Test updating with invalid priority value"""
     response = client.patch(
         "/api/v1/tasks/task_001",
@@ -449,7 +420,7 @@ def test_invalid_priority_value(client, clean_database, sample_tasks):
 # Test: Database Integration
 # ============================================================================
 
-def test_task_persists_across_requests(client, clean_database, sample_tasks):
+def test_task_persists_across_requests(client, sample_tasks):
     """Test that task updates persist across multiple requests"""
     # Update task
     update_response = client.patch(
@@ -464,7 +435,7 @@ def test_task_persists_across_requests(client, clean_database, sample_tasks):
     assert get_response.json()["status"] == "in_progress"
 
 
-def test_completed_task_timestamp_set(client, clean_database, sample_tasks):
+def test_completed_task_timestamp_set(client, sample_tasks):
     """Test that completing a task sets completed_at timestamp"""
     # Task initially has no completed_at
     initial_response = client.get("/api/v1/tasks/task_001")
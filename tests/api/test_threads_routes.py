@@ -5,90 +5,64 @@ Tests thread management and summarization endpoints.
 
 import pytest
 from datetime import datetime
-from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, MagicMock
 
-from agent_platform.api.main import app
 from agent_platform.db.models import ProcessedEmail
-from agent_platform.db.database import get_db
 from agent_platform.threads.models import ThreadSummary
 
 
 # ============================================================================
-# Test Client Setup
+# Fixtures
 # ============================================================================
 
 @pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def clean_database():
-    """Clean database before each test"""
-    with get_db() as db:
-        db.query(ProcessedEmail).delete()
-        db.commit()
-    yield
-    with get_db() as db:
-        db.query(ProcessedEmail).delete()
-        db.commit()
-
-
-@pytest.fixture
-def sample_thread_emails():
-    """Create sample thread emails in database"""
-    with get_db() as db:
-        emails = [
-            ProcessedEmail(
-                email_id="email_001",
-                account_id="gmail_1",
-                thread_id="thread_abc123",
-                subject="Project Discussion",
-                sender="alice@company.com",
-                category="wichtig",
-                received_at=datetime(2025, 11, 20, 10, 0),
-                thread_position=1,
-                is_thread_start=True,
-            ),
-            ProcessedEmail(
-                email_id="email_002",
-                account_id="gmail_1",
-                thread_id="thread_abc123",
-                subject="Re: Project Discussion",
-                sender="bob@company.com",
-                category="wichtig",
-                received_at=datetime(2025, 11, 20, 11, 0),
-                thread_position=2,
-                is_thread_start=False,
-            ),
-            ProcessedEmail(
-                email_id="email_003",
-                account_id="gmail_1",
-                thread_id="thread_abc123",
-                subject="Re: Project Discussion",
-                sender="alice@company.com",
-                category="wichtig",
-                received_at=datetime(2025, 11, 20, 12, 0),
-                thread_position=3,
-                is_thread_start=False,
-            ),
-        ]
-        for email in emails:
-            db.add(email)
-        db.commit()
+def sample_thread_emails(db_session):
+    """Create sample thread emails (rolled back after the test)"""
+    emails = [
+        ProcessedEmail(
+            email_id="email_001",
+            account_id="gmail_1",
+            thread_id="thread_abc123",
+            subject="Project Discussion",
+            sender="alice@company.com",
+            category="wichtig",
+            received_at=datetime(2025, 11, 20, 10, 0),
+            thread_position=1,
+            is_thread_start=True,
+        ),
+        ProcessedEmail(
+            email_id="email_002",
+            account_id="gmail_1",
+            thread_id="thread_abc123",
+            subject="Re: Project Discussion",
+            sender="bob@company.com",
+            category="wichtig",
+            received_at=datetime(2025, 11, 20, 11, 0),
+            thread_position=2,
+            is_thread_start=False,
+        ),
+        ProcessedEmail(
+            email_id="email_003",
+            account_id="gmail_1",
+            thread_id="thread_abc123",
+            subject="Re: Project Discussion",
+            sender="alice@company.com",
+            category="wichtig",
+            received_at=datetime(2025, 11, 20, 12, 0),
+            thread_position=3,
+            is_thread_start=False,
+        ),
+    ]
+    db_session.add_all(emails)
+    db_session.commit()
     yield
-    with get_db() as db:
-        db.query(ProcessedEmail).delete()
-        db.commit()
 
 
 # ============================================================================
 # Test: Get Thread Emails
 # ============================================================================
 
-def test_get_thread_emails_success(client, clean_database, sample_thread_emails):
+def test_get_thread_emails_success(client, sample_thread_emails):
     """Test getting emails in a thread"""
     response = client.get("/api/v1/threads/thread_abc123/emails")
 
@@ -108,7 +82,7 @@ def test_get_thread_emails_success(client, clean_database, sample_thread_emails)
     assert first_email["is_thread_start"] is True
 
 
-def test_get_thread_emails_not_found(client, clean_database):
+def test_get_thread_emails_not_found(client, db_session):
     """Test getting emails for nonexistent thread"""
     response = client.get("/api/v1/threads/nonexistent_thread/emails")
 
@@ -116,7 +90,7 @@ def test_get_thread_emails_not_found(client, clean_database):
     assert "no emails found" in response.json()["detail"].lower()
 
 
-def test_get_thread_emails_with_account_filter(client, clean_database, sample_thread_emails):
+def test_get_thread_emails_with_account_filter(client, sample_thread_emails):
     """Test that thread emails endpoint works (account_id is informational)"""
     # Note: The account_id parameter exists but thread_id is the primary identifier
     # Since all test emails are in gmail_1, this should return them all
@@ -130,7 +104,7 @@ def test_get_thread_emails_with_account_filter(client, clean_database, sample_th
     assert all(email["thread_position"] > 0 for email in data["emails"])
 
 
-def test_get_thread_emails_chronological_order(client, clean_database, sample_thread_emails):
+def test_get_thread_emails_chronological_order(client, sample_thread_emails):
     """Test that emails are returned in chronological order"""
     response = client.get("/api/v1/threads/thread_abc123/emails")
 
@@ -142,7 +116,7 @@ def test_get_thread_emails_chronological_order(client, clean_database, sample_th
     assert positions == [1, 2, 3]
 
 
-def test_get_thread_emails_includes_metadata(client, clean_database, sample_thread_emails):
+def test_get_thread_emails_includes_metadata(client, sample_thread_emails):
     """Test that email metadata is included"""
     response = client.get("/api/v1/threads/thread_abc123/emails")
 
@@ -164,7 +138,7 @@ def test_get_thread_emails_includes_metadata(client, clean_database, sample_thre
 # ============================================================================
 
 @patch("agent_platform.threads.thread_service.ThreadService.summarize_thread")
-def test_get_thread_summary_success(mock_summarize, client, clean_database, sample_thread_emails):
+def test_get_thread_summary_success(mock_summarize, client, sample_thread_emails):
     """Test getting thread summary"""
     from agent_platform.threads.models import ThreadEmail
 
@@ -204,7 +178,7 @@ def test_get_thread_summary_success(mock_summarize, client, clean_database, samp
 
 
 @patch("agent_platform.threads.thread_service.ThreadService.summarize_thread")
-def test_get_thread_summary_not_found(mock_summarize, client, clean_database):
+def test_get_thread_summary_not_found(mock_summarize, client, db_session):
     """Test getting summary for nonexistent thread"""
     mock_summarize.side_effect = ValueError("Thread not found")
 
@@ -214,7 +188,7 @@ def test_get_thread_summary_not_found(mock_summarize, client, clean_database):
 
 
 @patch("agent_platform.threads.thread_service.ThreadService.summarize_thread")
-def test_get_thread_summary_force_regenerate(mock_summarize, client, clean_database, sample_thread_emails):
+def test_get_thread_summary_force_regenerate(mock_summarize, client, sample_thread_emails):
     """Test forcing regeneration of thread summary"""
     from agent_platform.threads.models import ThreadEmail
 
@@ -253,7 +227,7 @@ def test_get_thread_summary_force_regenerate(mock_summarize, client, clean_datab
 
 
 @patch("agent_platform.threads.thread_service.ThreadService.summarize_thread")
-def test_get_thread_summary_server_error(mock_summarize, client, clean_database):
+def test_get_thread_summary_server_error(mock_summarize, client, db_session):
     """Test handling of server errors during summarization"""
     mock_summarize.side_effect = Exception("LLM service unavailable")
 
@@ -266,7 +240,7 @@ def test_get_thread_summary_server_error(mock_summarize, client, clean_database)
 # Test: Query Parameters
 # ============================================================================
 
-def test_get_thread_summary_missing_account_id(client, clean_database):
+def test_get_thread_summary_missing_account_id(client, db_session):
     """Test that account_id is required for summary endpoint"""
     response = client.get("/api/v1/threads/thread_abc123/summary")
 
@@ -274,7 +248,7 @@ def test_get_thread_summary_missing_account_id(client, clean_database):
     assert response.status_code == 422
 
 
-def test_get_thread_emails_account_id_optional(client, clean_database, sample_thread_emails):
+def test_get_thread_emails_account_id_optional(client, sample_thread_emails):
     """Test that account_id is optional for emails endpoint"""
     response = client.get("/api/v1/threads/thread_abc123/emails")
 
@@ -7,9 +7,7 @@ import pytest
 import base64
 import json
 from datetime import datetime, timedelta
-from fastapi.testclient import TestClient
 
-from agent_platform.api.main import app
 from agent_platform.webhooks.models import (
     SubscriptionConfig,
     SubscriptionInfo,
@@ -18,15 +16,9 @@ from agent_platform.webhooks.models import (
 
 
 # ============================================================================
-# Test Client Setup
+# Fixtures
 # ============================================================================
 
-@pytest.fixture
-def client():
-    """FastAPI test client"""
-    return TestClient(app)
-
-
 @pytest.fixture
 def sample_subscription_config():
     """Sample subscription configuration"""
@@ -0,0 +1,158 @@
+"""
+Unit tests for Provider Apply Queue.
+
+Tests background batching of provider classification application.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from agent_platform.providers.queue import ApplyQueue, get_apply_queue
+
+
+def make_item(email_id, primary='wichtig_todo'):
+    """Create queue item with a mock email record."""
+    return {
+        'email_record': Mock(email_id=email_id),
+        'primary_category': primary,
+        'secondary_categories': [],
+        'importance_score': 0.8,
+        'confidence': 0.9,
+    }
+
+
+def make_handler():
+    """Create mock handler echoing one result per item."""
+    handler = Mock()
+    handler.apply_classification_batch = AsyncMock(
+        side_effect=lambda items, account_id: [
+            {'success': True, 'email_id': item['email_record'].email_id, 'account_id': account_id}
+            for item in items
+        ]
+    )
+    return handler
+
+
+class TestApplyQueue:
+    """Test queued provider application."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_before_apply(self):
+        """Test enqueue returns a pending future and applies in background."""
+        queue = ApplyQueue()
+        handler = make_handler()
+
+        future = await queue.enqueue(handler, 'gmail_1', make_item('msg_1'))
+        assert not future.done()
+
+        result = await future
+        assert result == {'success': True, 'email_id': 'msg_1', 'account_id': 'gmail_1'}
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_burst_is_batched_per_handler_and_account(self):
+        """Test queued items are grouped into one batch call per handler/account."""
+        queue = ApplyQueue()
+        gmail = make_handler()
+        ionos = make_handler()
+
+        futures = [
+            await queue.enqueue(gmail, 'gmail_1', make_item('msg_1')),
+            await queue.enqueue(ionos, 'ionos_1', make_item('uid_1')),
+            await queue.enqueue(gmail, 'gmail_1', make_item('msg_2')),
+        ]
+        await queue.close()
+
+        assert gmail.apply_classification_batch.await_count == 1
+        assert ionos.apply_classification_batch.await_count == 1
+        assert [f.result()['email_id'] for f in futures] == ['msg_1', 'uid_1', 'msg_2']
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_resolves_futures(self):
+        """Test a raising handler resolves futures with an error result."""
+        queue = ApplyQueue()
+        handler = Mock()
+        handler.apply_classification_batch = AsyncMock(side_effect=RuntimeError('API down'))
+
+        future = await queue.enqueue(handler, 'gmail_1', make_item('msg_1'))
+        result = await future
+
+        assert result == {'success': False, 'error': 'API down'}
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_results_are_independent(self):
+        """Test each future of a failed batch gets its own error dict."""
+        queue = ApplyQueue()
+        handler = Mock()
+        handler.apply_classification_batch = AsyncMock(side_effect=RuntimeError('API down'))
+
+        futures = [
+            await queue.enqueue(handler, 'gmail_1', make_item('msg_1')),
+            await queue.enqueue(handler, 'gmail_1', make_item('msg_2')),
+        ]
+        await queue.close()
+
+        first, second = futures[0].result(), futures[1].result()
+        first['handled'] = True
+        assert first is not second
+        assert second == {'success': False, 'error': 'API down'}
+
+    @pytest.mark.asyncio
+    async def test_short_result_list_fails_missing_futures(self):
+        """Test futures without a handler result are failed instead of hanging."""
+        queue = ApplyQueue()
+        handler = Mock()
+        handler.apply_classification_batch = AsyncMock(return_value=[{'success': True}])
+
+        futures = [
+            await queue.enqueue(handler, 'gmail_1', make_item('msg_1')),
+            await queue.enqueue(handler, 'gmail_1', make_item('msg_2')),
+        ]
+        results = await asyncio.wait_for(asyncio.gather(*futures), timeout=1)
+        await queue.close()
+
+        assert results[0] == {'success': True}
+        assert results[1]['success'] is False
+        assert 'missing result' in results[1]['error'].lower()
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_batch_resolves_futures(self):
+        """Test cancelling the worker during a batch call resolves its futures."""
+        queue = ApplyQueue()
+        started = asyncio.Event()
+
+        async def slow_batch(items, account_id):
+            started.set()
+            await asyncio.sleep(10)
+
+        handler = Mock()
+        handler.apply_classification_batch = slow_batch
+
+        future = await queue.enqueue(handler, 'gmail_1', make_item('msg_1'))
+        await started.wait()
+        queue._worker.cancel()
+
+        result = await asyncio.wait_for(future, timeout=1)
+        assert result['success'] is False
+
+
+def test_shared_queue_per_event_loop():
+    """Test get_apply_queue() works across separate asyncio.run() calls."""
+    handler = make_handler()
+
+    async def apply_once():
+        queue = get_apply_queue()
+        assert get_apply_queue() is queue
+        future = await queue.enqueue(handler, 'gmail_1', make_item('msg_1'))
+        result = await future
+        await queue.close()
+        return queue, result
+
+    first_queue, first = asyncio.run(apply_once())
+    second_queue, second = asyncio.run(apply_once())
+
+    assert first_queue is not second_queue
+    assert first['success'] is True
+    assert second['success'] is True
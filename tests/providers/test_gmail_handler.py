@@ -6,7 +6,7 @@ Tests Gmail-specific multi-label operations.
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-from agent_platform.providers.gmail_handler import GmailHandler, CATEGORY_TO_LABEL_MAP
+from agent_platform.providers.gmail_handler import GmailHandler, CATEGORY_TO_LABEL_MAP, GMAIL_BATCH_LIMIT
 
 
 @pytest.fixture
@@ -246,3 +246,148 @@ class TestLabelCreation:
             # Should NOT create label, just reuse
             mock_labels.create.assert_not_called()
             assert 'existing_123' in label_ids
+
+
+class TestBatchApplication:
+    """Test batched Gmail label application."""
+
+    @staticmethod
+    def _make_service():
+        """Gmail service mock whose batch requests record added calls."""
+        service = Mock()
+        batches = []
+
+        def new_batch_http_request(callback):
+            batch = Mock()
+            batch.calls = []
+            batch.add.side_effect = lambda request, request_id: batch.calls.append(request_id)
+            batch.execute.side_effect = lambda: [callback(rid, {}, None) for rid in batch.calls]
+            batches.append(batch)
+            return batch
+
+        service.new_batch_http_request.side_effect = new_batch_http_request
+        service.users.return_value.labels.return_value.list.return_value.execute.return_value = {
+            'labels': [{'id': f'id_{name}', 'name': name} for name in CATEGORY_TO_LABEL_MAP.values()]
+        }
+        return service, batches
+
+    @staticmethod
+    def _make_item(email_id, primary_category, importance_score):
+        email = Mock()
+        email.email_id = email_id
+        return {
+            'email_record': email,
+            'primary_category': primary_category,
+            'secondary_categories': [],
+            'importance_score': importance_score,
+            'confidence': 0.9,
+        }
+
+    @pytest.mark.asyncio
+    async def test_one_modify_per_email_in_single_batch(self):
+        """Test that label + archive changes go into one batched modify per email."""
+        service, batches = self._make_service()
+        handler = GmailHandler(gmail_service=service)
+
+        results = await handler.apply_classification_batch(
+            items=[
+                self._make_item('msg_1', 'wichtig_todo', 0.9),
+                self._make_item('msg_2', 'newsletter', 0.2),
+            ],
+            account_id='gmail_1'
+        )
+
+        assert len(batches) == 1
+        assert batches[0].calls == ['0', '1']
+        modify = service.users.return_value.messages.return_value.modify
+        modify.assert_any_call(userId='me', id='msg_1', body={'addLabelIds': ['id_Important/ToDo']})
+        modify.assert_any_call(
+            userId='me', id='msg_2',
+            body={'addLabelIds': ['id_Newsletter'], 'removeLabelIds': ['INBOX']}
+        )
+        assert [r['success'] for r in results] == [True, True]
+        assert [r['archived'] for r in results] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_batches_chunked_at_limit(self):
+        """Test that more than GMAIL_BATCH_LIMIT emails are split into several batches."""
+        service, batches = self._make_service()
+        handler = GmailHandler(gmail_service=service)
+
+        items = [self._make_item(f'msg_{i}', 'termine', 0.8) for i in range(GMAIL_BATCH_LIMIT + 1)]
+        results = await handler.apply_classification_batch(items=items, account_id='gmail_1')
+
+        assert [len(b.calls) for b in batches] == [GMAIL_BATCH_LIMIT, 1]
+        assert all(r['success'] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_modify_reported_per_email(self):
+        """Test that a failed call only marks its own email as failed."""
+        service, batches = self._make_service()
+        handler = GmailHandler(gmail_service=service)
+
+        def failing_batch(callback):
+            batch = Mock()
+            batch.calls = []
+            batch.add.side_effect = lambda request, request_id: batch.calls.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(rid, None, Exception('not found') if rid == '1' else None)
+                for rid in batch.calls
+            ]
+            return batch
+
+        service.new_batch_http_request.side_effect = failing_batch
+
+        results = await handler.apply_classification_batch(
+            items=[
+                self._make_item('msg_1', 'termine', 0.8),
+                self._make_item('msg_missing', 'termine', 0.8),
+            ],
+            account_id='gmail_1'
+        )
+
+        assert results[0]['success'] is True
+        assert results[1]['success'] is False
+        assert results[1]['error'] == 'not found'
+
+
+class TestLabelListCache:
+    """Test that the Gmail label list is fetched once per handler."""
+
+    @pytest.mark.asyncio
+    async def test_labels_listed_once(self):
+        """Test that repeated lookups reuse the first labels().list() result."""
+        service = Mock()
+        mock_labels = service.users.return_value.labels.return_value
+        mock_labels.list.return_value.execute.return_value = {
+            'labels': [{'id': 'id_todo', 'name': 'Important/ToDo'}]
+        }
+        handler = GmailHandler(gmail_service=service)
+
+        for _ in range(3):
+            label_ids, created = await handler._get_or_create_labels(
+                account_id='gmail_1',
+                label_names=['Important/ToDo']
+            )
+            assert label_ids == ['id_todo']
+            assert created == []
+
+        assert mock_labels.list.call_count == 1
+        mock_labels.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_created_label_added_to_cache(self):
+        """Test that a created label is reused without another create or list."""
+        service = Mock()
+        mock_labels = service.users.return_value.labels.return_value
+        mock_labels.list.return_value.execute.return_value = {'labels': []}
+        mock_labels.create.return_value.execute.return_value = {'id': 'new_label_123'}
+        handler = GmailHandler(gmail_service=service)
+
+        first = await handler._get_or_create_labels(account_id='gmail_1', label_names=['NewLabel'])
+        second = await handler._get_or_create_labels(account_id='gmail_1', label_names=['NewLabel'])
+
+        assert first == (['new_label_123'], ['NewLabel'])
+        assert second == (['new_label_123'], [])
+        assert mock_labels.list.call_count == 1
+        assert mock_labels.create.call_count == 1
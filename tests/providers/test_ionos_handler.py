@@ -6,7 +6,7 @@ Tests IONOS-specific single-folder IMAP operations.
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-from agent_platform.providers.ionos_handler import IonosHandler, CATEGORY_TO_FOLDER_MAP
+from agent_platform.providers.ionos_handler import IonosHandler, CATEGORY_TO_FOLDER_MAP, build_uid_sets
 
 
 @pytest.fixture
@@ -264,3 +264,196 @@ class TestProviderComparison:
             # Both should succeed
             assert result_high['success'] is True
             assert result_low['success'] is True
+
+
+class TestBatchMove:
+    """Test batched IMAP moves with UID sequence sets."""
+
+    def test_uid_sets_collapse_ranges(self):
+        """Test that consecutive UIDs become ranges."""
+        uids = ['1003', '1001', '1002', '1100', '1200', '1201']
+        assert build_uid_sets(uids) == ['1001:1003,1100,1200:1201']
+
+    def test_uid_sets_capped(self):
+        """Test that each sequence set covers at most max_uids UIDs."""
+        uids = [str(uid) for uid in range(1, 6)]
+        assert build_uid_sets(uids, max_uids=2) == ['1:2', '3:4', '5']
+
+    @staticmethod
+    def _make_item(uid, primary_category):
+        email = Mock()
+        email.email_id = uid
+        return {
+            'email_record': email,
+            'primary_category': primary_category,
+            'secondary_categories': [],
+            'importance_score': 0.8,
+            'confidence': 0.9,
+        }
+
+    @pytest.mark.asyncio
+    async def test_one_move_per_folder(self):
+        """Test that emails are grouped by folder into one UID MOVE each."""
+        imap = Mock()
+        imap.list.return_value = ('OK', [
+            b'(\\HasNoChildren) "/" "Work/Projects"',
+            b'(\\HasNoChildren) "/" "Newsletter"',
+        ])
+        imap.capability.return_value = ('OK', [b'IMAP4rev1 MOVE UIDPLUS'])
+        imap.uid.return_value = ('OK', [None])
+        handler = IonosHandler(imap_connection=imap)
+
+        results = await handler.apply_classification_batch(
+            items=[
+                self._make_item('10', 'job_projekte'),
+                self._make_item('20', 'newsletter'),
+                self._make_item('11', 'job_projekte'),
+            ],
+            account_id='ionos_1'
+        )
+
+        imap.list.assert_called_once()
+        imap.create.assert_not_called()
+        assert sorted(c.args for c in imap.uid.call_args_list) == [
+            ('MOVE', '10:11', 'Work/Projects'),
+            ('MOVE', '20', 'Newsletter'),
+        ]
+        assert [r['folder_applied'] for r in results] == ['Work/Projects', 'Newsletter', 'Work/Projects']
+        assert all(r['moved'] and r['success'] for r in results)
+        imap.capability.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_response_fails_only_its_uid_set(self, monkeypatch):
+        """Test that a NO response fails the emails of that sequence set only."""
+        monkeypatch.setattr('agent_platform.providers.ionos_handler.IMAP_MOVE_BATCH_LIMIT', 1)
+        imap = Mock()
+        imap.list.return_value = ('OK', [b'(\\HasNoChildren) "/" "Newsletter"'])
+        imap.capability.return_value = ('OK', [b'IMAP4rev1 MOVE'])
+        imap.uid.side_effect = [('OK', [None]), ('NO', [b'No matching messages'])]
+        handler = IonosHandler(imap_connection=imap)
+
+        results = await handler.apply_classification_batch(
+            items=[self._make_item('20', 'newsletter'), self._make_item('21', 'newsletter')],
+            account_id='ionos_1'
+        )
+
+        assert results[0]['success'] is True
+        assert results[0]['moved'] is True
+        assert results[1]['success'] is False
+        assert results[1]['moved'] is False
+        assert 'NO' in results[1]['error']
+
+    @pytest.mark.asyncio
+    async def test_fallback_without_move_capability(self):
+        """Test COPY/STORE/UID EXPUNGE is used when the server lacks MOVE."""
+        imap = Mock()
+        imap.list.return_value = ('OK', [b'(\\HasNoChildren) "/" "Newsletter"'])
+        imap.capability.return_value = ('OK', [b'IMAP4rev1 UIDPLUS'])
+        imap.uid.return_value = ('OK', [None])
+        handler = IonosHandler(imap_connection=imap)
+
+        results = await handler.apply_classification_batch(
+            items=[self._make_item('20', 'newsletter'), self._make_item('21', 'newsletter')],
+            account_id='ionos_1'
+        )
+
+        assert [c.args for c in imap.uid.call_args_list] == [
+            ('COPY', '20:21', 'Newsletter'),
+            ('STORE', '20:21', '+FLAGS', '(\\Deleted)'),
+            ('EXPUNGE', '20:21'),
+        ]
+        imap.expunge.assert_not_called()
+        assert all(r['moved'] and r['success'] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_fallback_without_uidplus_expunges_mailbox(self):
+        """Test plain EXPUNGE is used when the server has neither MOVE nor UIDPLUS."""
+        imap = Mock()
+        imap.list.return_value = ('OK', [b'(\\HasNoChildren) "/" "Newsletter"'])
+        imap.capability.return_value = ('OK', [b'IMAP4rev1'])
+        imap.uid.return_value = ('OK', [None])
+        imap.expunge.return_value = ('OK', [b'20'])
+        handler = IonosHandler(imap_connection=imap)
+
+        results = await handler.apply_classification_batch(
+            items=[self._make_item('20', 'newsletter')],
+            account_id='ionos_1'
+        )
+
+        assert [c.args[0] for c in imap.uid.call_args_list] == ['COPY', 'STORE']
+        imap.expunge.assert_called_once_with()
+        assert results[0]['success'] is True
+
+    @pytest.mark.asyncio
+    async def test_fallback_copy_failure_keeps_original(self):
+        """Test a failed COPY reports failure and does not delete the original."""
+        imap = Mock()
+        imap.list.return_value = ('OK', [b'(\\HasNoChildren) "/" "Newsletter"'])
+        imap.capability.return_value = ('OK', [b'IMAP4rev1 UIDPLUS'])
+        imap.uid.return_value = ('NO', [b'[TRYCREATE] No such mailbox'])
+        handler = IonosHandler(imap_connection=imap)
+
+        results = await handler.apply_classification_batch(
+            items=[self._make_item('20', 'newsletter')],
+            account_id='ionos_1'
+        )
+
+        imap.uid.assert_called_once_with('COPY', '20', 'Newsletter')
+        imap.expunge.assert_not_called()
+        assert results[0]['success'] is False
+        assert results[0]['moved'] is False
+        assert results[0]['error'].startswith('UID COPY returned NO')
+
+
+class TestConnectionReuse:
+    """Test the shared IMAP connection."""
+
+    ACCOUNT_CONFIG = {
+        'email': 'user@ionos.de',
+        'password': 'secret',
+        'imap_server': 'imap.ionos.de',
+        'imap_port': 993,
+    }
+
+    @pytest.mark.asyncio
+    async def test_login_once_across_calls(self):
+        """Test that one login serves several operations."""
+        with patch('agent_platform.providers.ionos_handler.imaplib.IMAP4_SSL') as mock_ssl:
+            conn = mock_ssl.return_value
+            conn.capability.return_value = ('OK', [b'IMAP4rev1 MOVE'])
+            conn.uid.return_value = ('OK', [None])
+            handler = IonosHandler(account_config=self.ACCOUNT_CONFIG)
+
+            assert await handler._move_batch_to_folder(['1'], 'Newsletter') == {'1': None}
+            assert await handler._move_batch_to_folder(['2'], 'Personal') == {'2': None}
+
+            mock_ssl.assert_called_once_with('imap.ionos.de', 993)
+            conn.login.assert_called_once_with('user@ionos.de', 'secret')
+
+    @pytest.mark.asyncio
+    async def test_reconnect_after_dropped_connection(self):
+        """Test that an idle connection failing NOOP is replaced."""
+        import imaplib
+
+        stale = Mock()
+        stale.noop.side_effect = imaplib.IMAP4.abort('BYE')
+
+        with patch('agent_platform.providers.ionos_handler.imaplib.IMAP4_SSL') as mock_ssl, \
+             patch('agent_platform.providers.ionos_handler.time.monotonic', side_effect=[0, 1000, 1000]):
+            handler = IonosHandler(imap_connection=stale, account_config=self.ACCOUNT_CONFIG)
+
+            conn = await handler._get_conn()
+
+            assert conn is mock_ssl.return_value
+            conn.select.assert_called_once_with('INBOX')
+
+    @pytest.mark.asyncio
+    async def test_close_logs_out(self):
+        """Test that close() logs out and drops the connection."""
+        conn = Mock()
+        handler = IonosHandler(imap_connection=conn)
+
+        await handler.close()
+
+        conn.logout.assert_called_once()
+        assert handler.imap_connection is None
@@ -5,6 +5,7 @@ Tests whitelist/blacklist management and preference application.
 """
 
 import pytest
+from datetime import timedelta
 from agent_platform.senders.profile_service import SenderProfileService
 from agent_platform.db.database import get_db
 from agent_platform.db.models import SenderPreference
@@ -294,3 +295,133 @@ class TestProfileRetrieval:
         # Filter only test domain
         test_blacklisted = [p for p in blacklisted if '@test-domain.com' in p.sender_email]
         assert len(test_blacklisted) >= 2
+
+    @pytest.mark.asyncio
+    async def test_list_by_trust(self, profile_service, cleanup_test_data):
+        """Test listing several trust levels with one call."""
+        await profile_service.whitelist_sender('trusted1@test-domain.com', 'test_account')
+        await profile_service.blacklist_sender('blocked1@test-domain.com', 'test_account')
+
+        by_trust = await profile_service.list_by_trust('test_account', ('trusted', 'blocked', 'suspicious'))
+
+        assert set(by_trust.keys()) == {'trusted', 'blocked', 'suspicious'}
+        assert 'trusted1@test-domain.com' in [p.sender_email for p in by_trust['trusted']]
+        assert 'blocked1@test-domain.com' in [p.sender_email for p in by_trust['blocked']]
+
+    @pytest.mark.asyncio
+    async def test_lists_match_stats_when_flags_disagree_with_trust_level(self, profile_service, cleanup_test_data):
+        """Test rows written outside the service count the same in lists and stats."""
+        with get_db() as db:
+            db.add(SenderPreference(
+                account_id='flags_account', sender_email='flagged@test-domain.com',
+                sender_domain='test-domain.com', is_whitelisted=True, trust_level='neutral',
+            ))
+            db.add(SenderPreference(
+                account_id='flags_account', sender_email='levelled@test-domain.com',
+                sender_domain='test-domain.com', is_whitelisted=False, trust_level='trusted',
+            ))
+            db.commit()
+
+        whitelisted = await profile_service.list_whitelisted('flags_account')
+        stats = await profile_service.get_profile_stats('flags_account')
+
+        assert [p.sender_email for p in whitelisted] == ['flagged@test-domain.com']
+        assert stats['whitelisted'] == len(whitelisted)
+
+    @pytest.mark.asyncio
+    async def test_profile_stats(self, profile_service, cleanup_test_data):
+        """Test profile stats counts and refresh after a mutation."""
+        before = await profile_service.get_profile_stats('stats_account')
+
+        await profile_service.whitelist_sender('w@test-domain.com', 'stats_account')
+        await profile_service.blacklist_sender('b@test-domain.com', 'stats_account')
+        await profile_service.set_trust_level('s@test-domain.com', 'stats_account', 'suspicious')
+
+        stats = await profile_service.get_profile_stats('stats_account')
+        assert stats['total_profiles'] == before['total_profiles'] + 3
+        assert stats['whitelisted'] == before['whitelisted'] + 1
+        assert stats['blacklisted'] == before['blacklisted'] + 1
+        assert stats['neutral'] == before['neutral'] + 1
+
+
+class TestProfileCache:
+    """Test in-memory profile lookup cache."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_sender_is_negatively_cached(self, profile_service, cleanup_test_data):
+        """Test that a missing profile is cached as None."""
+        profile = await profile_service.get_sender_profile('nobody@test-domain.com', 'test_account')
+
+        assert profile is None
+        assert ('nobody@test-domain.com', 'test_account') in profile_service._pref_cache
+
+    @pytest.mark.asyncio
+    async def test_cached_miss_expires(self, profile_service, cleanup_test_data, monkeypatch):
+        """Test a row written outside the service is seen once the cached miss expires."""
+        assert await profile_service.get_sender_profile('tracked@test-domain.com', 'test_account') is None
+
+        # Written directly, as the feedback tracker does
+        with get_db() as db:
+            db.add(SenderPreference(
+                account_id='test_account', sender_email='tracked@test-domain.com',
+                sender_domain='test-domain.com', trust_level='trusted', is_whitelisted=True,
+            ))
+            db.commit()
+
+        assert await profile_service.get_sender_profile('tracked@test-domain.com', 'test_account') is None
+
+        monkeypatch.setattr(profile_service, '_pref_ttl', timedelta(0))
+        profile = await profile_service.get_sender_profile('tracked@test-domain.com', 'test_account')
+        assert profile is not None
+        assert profile.is_whitelisted is True
+
+    @pytest.mark.asyncio
+    async def test_mutator_updates_cached_profile(self, profile_service, cleanup_test_data):
+        """Test that whitelisting after a cached miss is visible immediately."""
+        await profile_service.get_sender_profile('later@test-domain.com', 'test_account')
+        await profile_service.whitelist_sender('later@test-domain.com', 'test_account')
+
+        profile = await profile_service.get_sender_profile('later@test-domain.com', 'test_account')
+        assert profile is not None
+        assert profile.is_whitelisted is True
+
+        await profile_service.mute_categories('later@test-domain.com', ['werbung'], 'test_account')
+        profile = await profile_service.get_sender_profile('later@test-domain.com', 'test_account')
+        assert profile.muted_categories == ['werbung']
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, cleanup_test_data):
+        """Test least recently used entries are evicted."""
+        service = SenderProfileService(cache_size=2)
+
+        await service.get_sender_profile('a@test-domain.com', 'test_account')
+        await service.get_sender_profile('b@test-domain.com', 'test_account')
+        await service.get_sender_profile('a@test-domain.com', 'test_account')
+        await service.get_sender_profile('c@test-domain.com', 'test_account')
+
+        assert list(service._pref_cache) == [
+            ('a@test-domain.com', 'test_account'),
+            ('c@test-domain.com', 'test_account'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_apply_preferences_memoized_until_profile_changes(self, profile_service, cleanup_test_data):
+        """Test memoized results are reused and retired by mutators."""
+        classification_result = {
+            'primary_category': 'werbung',
+            'confidence': 0.80,
+            'importance_score': 0.50,
+            'secondary_categories': ['newsletter'],
+            'reasoning': 'Promo email'
+        }
+        await profile_service.whitelist_sender('memo@test-domain.com', 'test_account')
+
+        first = await profile_service.apply_preferences('memo@test-domain.com', 'test_account', classification_result)
+        second = await profile_service.apply_preferences('memo@test-domain.com', 'test_account', classification_result)
+        assert first == second
+        assert first is not second
+        assert len(profile_service._apply_cache) == 1
+
+        await profile_service.mute_categories('memo@test-domain.com', ['werbung'], 'test_account')
+        muted = await profile_service.apply_preferences('memo@test-domain.com', 'test_account', classification_result)
+        assert muted['importance_score'] == 0.10
@@ -108,7 +108,7 @@ export default function EmailAgentPage() {
                     <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-600">
                       <div className="flex items-center gap-2">
                         <Clock className="w-4 h-4" />
-                        {new Date(run.created_at).toLocaleTimeString('de-DE')}
+                        {run.created_at ? new Date(run.created_at).toLocaleTimeString('de-DE') : '-'}
                       </div>
                     </td>
                     <td className="px-6 py-4 text-sm text-gray-900">
@@ -10,7 +10,7 @@ interface EmailMetadataProps {
   importanceScore: number | null;
   needsHuman: boolean;
   status: string;
-  createdAt: string;
+  createdAt: string | null;
 }
 
 export function EmailMetadata({
@@ -50,7 +50,7 @@ export const useEmailAgentStatus = () => {
 
 export const useEmailAgentRuns = (filters?: {
   limit?: number;
-  offset?: number;
+  cursor?: string;
   needs_human?: boolean;
 }) => {
   return useQuery({
@@ -178,7 +178,6 @@ export const useNeedsHumanItems = (limit: number = 10) => {
         params: {
           needs_human: true,
           limit,
-          offset: 0,
         },
       });
       return data;
@@ -195,7 +194,6 @@ export const useRecentResults = (limit: number = 10) => {
         params: {
           needs_human: false,
           limit,
-          offset: 0,
         },
       });
 
@@ -205,7 +203,7 @@ export const useRecentResults = (limit: number = 10) => {
         type: 'email' as const,
         title: item.email_subject || '(No Subject)',
         subtitle: item.email_sender || 'Unknown',
-        timestamp: item.created_at,
+        timestamp: item.created_at ?? item.email_received_at ?? '',
         confidence: item.confidence || undefined,
         category: item.category || undefined,
         status: item.status,
@@ -15,7 +15,7 @@ export interface RunListItem {
   confidence: number | null;
   needs_human: boolean;
   status: string;
-  created_at: string;
+  created_at: string | null;
 }
 
 export interface RunDetail {
@@ -33,7 +33,7 @@ export interface RunDetail {
   tasks: Task[];
   decisions: Decision[];
   questions: Question[];
-  created_at: string;
+  created_at: string | null;
 }
 
 export interface Task {
@@ -66,6 +66,7 @@ export interface Question {
 export interface RunsListResponse {
   items: RunListItem[];
   total: number;
+  total_is_exact: boolean;
   limit: number;
-  offset: number;
+  next_cursor: string | null;
 }